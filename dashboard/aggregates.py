@@ -0,0 +1,149 @@
+"""
+Tabel agregat di balik grafik bar/garis dashboard, dihitung dari kubus
+dan tabel rollup.
+
+Dipakai charts.py untuk menggambar dan api.py untuk disajikan sebagai
+JSON, jadi angka di grafik & di API selalu sama. Modul ini sengaja tidak
+mengimpor matplotlib. AGGREGATES memetakan nama agregat ke fungsinya
+beserta kubus/tabel yang dibutuhkan; SECTION_INPUTS memetakan id bagian
+grafik ke nama input yang dibutuhkannya.
+"""
+import numpy as np
+
+from cube import confidence_interval, rollup
+from downsample import SeriesPyramid
+from rolling import hour_stamps
+
+# Definisi jam sibuk untuk kategori waktu (time_category)
+RUSH_HOURS = list(range(6, 10)) + list(range(16, 20))
+
+
+def with_time_category(hour_cube):
+    """Tambahkan kolom time_category (Rush/Non-Rush Hour) ke sel kubus."""
+    if 'time_category' in hour_cube.columns:
+        return hour_cube
+    return hour_cube.assign(time_category=np.where(
+        hour_cube['hr'].isin(RUSH_HOURS), 'Rush Hour', 'Non-Rush Hour'
+    ))
+
+
+def with_ci(summary):
+    """Tambahkan kolom ci_low & ci_high (CI 95%) ke hasil `rollup`."""
+    ci_low, ci_high = confidence_interval(summary)
+    return summary.assign(ci_low=ci_low, ci_high=ci_high)
+
+
+def hourly_trend(hour_cube):
+    """Rata-rata peminjaman per jam dengan CI 95% (2b)."""
+    return with_ci(rollup(hour_cube, 'hr'))
+
+
+def monthly_pattern(day_cube):
+    """Rata-rata peminjaman harian per bulan (2c)."""
+    return rollup(day_cube, 'mnth')
+
+
+def rush_hour_pattern(hour_cube):
+    """Rata-rata peminjaman Rush Hour vs Non-Rush Hour dengan CI 95% (2d)."""
+    summary = rollup(hour_cube, 'rush_hour')
+    # Pastikan tipenya string untuk memudahkan sorting/label. Label dibangun
+    # per nilai: astype(str) pada kategori kosong gagal (copy-on-write + numpy 2)
+    summary['rush_hour'] = [str(value) for value in summary['rush_hour']]
+    return with_ci(summary)
+
+
+def weather_comparison(hour_cube):
+    """Total peminjaman per kondisi cuaca (3f)."""
+    return rollup(hour_cube, 'weathersit').rename(columns={'total': 'total_peminjaman'})
+
+
+def rush_hour_comparison(hour_cube):
+    """Rata-rata peminjaman per kategori waktu (4c)."""
+    return rollup(with_time_category(hour_cube), 'time_category').rename(
+        columns={'mean': 'avg_peminjaman', 'total': 'total_peminjaman'}
+    )
+
+
+def rush_hour_weekday(hour_cube):
+    """Rata-rata peminjaman per kategori waktu dan tipe hari (4d)."""
+    return rollup(with_time_category(hour_cube), ['time_category', 'day_type']).rename(
+        columns={'mean': 'avg_peminjaman', 'total': 'total_peminjaman'}
+    )
+
+
+def weekday_weekend_comparison(hour_cube):
+    """Total peminjaman weekday vs weekend (4e)."""
+    return rollup(hour_cube, 'day_type').rename(
+        columns={'mean': 'avg_peminjaman', 'total': 'total_peminjaman'}
+    )
+
+
+def weekly_trend(week_rollup):
+    """Total & rata-rata peminjaman harian per minggu (rollup mingguan; hanya filter yr)."""
+    return week_rollup[['week_start', 'days', 'casual', 'registered', 'cnt', 'cnt_mean']].rename(
+        columns={'cnt': 'total_peminjaman', 'cnt_mean': 'avg_peminjaman'}
+    )
+
+
+def trend_pyramids(df_day, day_stats):
+    """
+    Piramida downsampling untuk deret harian 'cnt' & rata-rata bergerak 30 hari.
+
+    Rata-rata bergerak diambil dari `day_stats` (rolling.RollingStats atas
+    seluruh data) pada tanggal-tanggal di `df_day`, jadi tetap 30 hari
+    kalender walaupun df_day sudah difilter.
+    """
+    rolling_mean = day_stats.at(df_day['dteday'], ['mean_30d'])['mean_30d']
+    return {
+        'cnt': SeriesPyramid(df_day['dteday'], df_day['cnt']),
+        'rolling_30': SeriesPyramid(df_day['dteday'], rolling_mean.to_numpy()),
+    }
+
+
+def hour_trend_pyramids(df_hour, hour_stats):
+    """
+    Piramida downsampling untuk deret per jam 'cnt' & rata-rata bergerak
+    24/168 jam, diambil dari `hour_stats` (atas seluruh data) pada jam-jam
+    di `df_hour` seperti trend_pyramids.
+    """
+    stamps = hour_stamps(df_hour)
+    rolling = hour_stats.at(stamps, ['mean_24h', 'mean_168h'])
+    return {
+        'cnt': SeriesPyramid(stamps, df_hour['cnt']),
+        'rolling_24': SeriesPyramid(stamps, rolling['mean_24h'].to_numpy()),
+        'rolling_168': SeriesPyramid(stamps, rolling['mean_168h'].to_numpy()),
+    }
+
+
+# Nama agregat -> (fungsi, nama kubus/tabel yang dibutuhkan)
+AGGREGATES = {
+    'hourly_trend': (hourly_trend, 'hour_cube'),
+    'monthly_pattern': (monthly_pattern, 'day_cube'),
+    'rush_hour_pattern': (rush_hour_pattern, 'hour_cube'),
+    'weather_comparison': (weather_comparison, 'hour_cube'),
+    'rush_hour_comparison': (rush_hour_comparison, 'hour_cube'),
+    'rush_hour_weekday': (rush_hour_weekday, 'hour_cube'),
+    'weekday_weekend_comparison': (weekday_weekend_comparison, 'hour_cube'),
+    'weekly_trend': (weekly_trend, 'week_rollup'),
+}
+
+# Id bagian grafik -> nama input yang dibutuhkan (dipakai charts.py & vega_charts.py)
+SECTION_INPUTS = {
+    '2a': ('day_trends', 'date_range'),
+    '2b': ('hour_cube',),
+    '2c': ('day_cube',),
+    '2d': ('hour_cube',),
+    '2e': ('day_trends', 'date_range'),
+    '2f': ('hour_trends', 'date_range'),
+    '3a': ('day_boxes',),
+    '3b': ('hour_boxes',),
+    '3c': ('day_boxes',),
+    '3d': ('hour_boxes',),
+    '3e': ('hour_boxes',),
+    '3f': ('hour_cube',),
+    '4a': ('day_boxes',),
+    '4b': ('hour_boxes',),
+    '4c': ('hour_cube',),
+    '4d': ('hour_cube',),
+    '4e': ('hour_cube',),
+}
@@ -0,0 +1,272 @@
+"""
+Layanan query JSON lokal untuk agregat di balik grafik dashboard.
+
+Alat lain bisa mengambil angka yang sama dengan grafik (aggregates.py)
+tanpa membuka halaman Streamlit atau membaca CSV sendiri. Kubus & tabel
+rollup dimuat sekali dari dataset Parquet dan dimuat ulang otomatis saat
+versi data berubah; batch di incoming/ tidak ikut (sama seperti
+export.py).
+
+Endpoint:
+    GET  /aggregates                          daftar agregat & nilai filter
+    GET  /query/<nama>?yr=0&season=Spring,Summer
+    POST /batch   {"queries": [{"name": "weather_comparison", "filters": {"yr": [0]}}, ...]}
+    GET  /metrics                             metrik Prometheus layanan ini
+
+Filter yang kolomnya tidak ada di tabel agregat (mis. season untuk
+weekly_trend, yang hanya punya yr) ditolak dengan 400, bukan diabaikan;
+begitu juga body yang bentuknya salah ('queries' bukan list, 'filters'
+bukan objek {kolom: [nilai, ...]}). Galat tak terduga dijawab 500 JSON.
+
+Setiap jawaban query membawa ETag (versi data + query); klien yang
+mengirim If-None-Match yang sama mendapat 304 tanpa agregasi ulang. Hasil
+per query disimpan di cache LRU, dan permintaan dilayani paralel di
+thread terpisah.
+
+Jalankan:
+    python api.py                 # http://127.0.0.1:8502
+    python api.py --port 9000 --host 0.0.0.0
+"""
+import argparse
+import hashlib
+import json
+import threading
+import time
+import traceback
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from aggregates import AGGREGATES
+from cube import HOUR_DIMENSIONS, build_cube_from_parts, slice_cube
+from data_store import data_version, iter_partitions, read_dataset
+from filters import FILTER_COLUMNS
+from metrics import Metrics
+from render_cache import RenderCache, filter_key
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8502
+
+# Batas ukuran cache hasil query (bytes JSON) & jumlah query per batch
+CACHE_BYTES = 16 * 1024 * 1024
+MAX_BATCH = 64
+
+
+class QueryError(ValueError):
+    """Query tidak valid (nama agregat, kolom atau nilai filter)."""
+
+
+class QueryService:
+    """Kubus per versi data + cache hasil query, aman dipakai banyak thread."""
+
+    def __init__(self, cache_bytes=CACHE_BYTES):
+        self.version = None
+        self.cubes = {}
+        self.options = {}
+        self.cache = RenderCache(cache_bytes)
+        self.metrics = Metrics()
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Bangun ulang kubus jika versi data berubah; kembalikan versi aktif."""
+        version = data_version()
+        if version != self.version:
+            with self._lock:
+                if version != self.version:
+                    cubes = {
+                        'day_cube': read_dataset("month"),
+                        'hour_cube': build_cube_from_parts(iter_partitions("hour"), HOUR_DIMENSIONS),
+                        'week_rollup': read_dataset("week"),
+                    }
+                    # Data harian adalah rollup data per jam: opsi cukup dari kubus per jam
+                    self.options = {
+                        col: sorted(cubes['hour_cube'][col].unique().tolist())
+                        for col in FILTER_COLUMNS if col in cubes['hour_cube'].columns
+                    }
+                    self.cubes = cubes
+                    self.version = version
+        return self.version
+
+    def parse(self, name, filters):
+        """Validasi query; kembalikan (nama, filter_key)."""
+        if not isinstance(name, str) or name not in AGGREGATES:
+            raise QueryError(f"Agregat '{name}' tidak ada; pilihan: {', '.join(AGGREGATES)}")
+        # Filter hanya bisa diterapkan pada kolom yang ada di tabel agregatnya
+        # (mis. rollup mingguan hanya punya yr), jadi kolom lain ditolak
+        columns = self.cubes[AGGREGATES[name][1]].columns
+        allowed = [col for col in self.options if col in columns]
+        if filters is not None and not isinstance(filters, dict):
+            raise QueryError("'filters' harus berupa objek {kolom: [nilai, ...]}")
+        selections = {}
+        for col, values in (filters or {}).items():
+            if col not in self.options:
+                raise QueryError(f"Kolom filter '{col}' tidak ada; pilihan: {', '.join(self.options)}")
+            if col not in allowed:
+                raise QueryError(f"Agregat '{name}' tidak bisa difilter dengan '{col}'; pilihan: {', '.join(allowed)}")
+            if not isinstance(values, list) or any(isinstance(value, (list, dict)) for value in values):
+                raise QueryError(f"Filter '{col}' harus berupa list nilai")
+            by_text = {str(option): option for option in self.options[col]}
+            unknown = [value for value in values if str(value) not in by_text]
+            if unknown:
+                raise QueryError(f"Nilai {col} tidak ada: {', '.join(map(str, unknown))}")
+            selections[col] = [by_text[str(value)] for value in values]
+        return name, filter_key(selections)
+
+    def etag(self, version, queries):
+        """ETag untuk daftar (nama, filter_key) pada versi data `version`."""
+        digest = hashlib.sha256(repr((version, queries)).encode()).hexdigest()[:20]
+        return f'"{digest}"'
+
+    def result(self, version, name, key):
+        """Bytes JSON hasil satu query (dari cache jika ada)."""
+        cache_key = (version, name, key)
+        body = self.cache.get(cache_key)
+        if body is None:
+            start = time.perf_counter()
+            aggregate, cube_name = AGGREGATES[name]
+            frame = aggregate(slice_cube(self.cubes[cube_name], dict(key)))
+            body = json.dumps({
+                'name': name,
+                'filters': {col: list(values) for col, values in key},
+                'rows': json.loads(frame.to_json(orient="records", date_format="iso")),
+            }).encode()
+            self.cache.put(cache_key, body)
+            self.metrics.observe("api_query_seconds", time.perf_counter() - start, aggregate=name)
+        return body
+
+    def describe(self):
+        """Daftar agregat (beserta docstring) & nilai filter yang tersedia."""
+        return {
+            'version': self.version,
+            'aggregates': {name: aggregate.__doc__ for name, (aggregate, _) in AGGREGATES.items()},
+            'filters': {col: list(map(str, values)) for col, values in self.options.items()},
+        }
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """Handler HTTP; satu thread per permintaan (ThreadingHTTPServer)."""
+
+    service = None
+
+    def do_GET(self):
+        self.guarded(self.route_get)
+
+    def do_POST(self):
+        self.guarded(self.route_post)
+
+    def guarded(self, route):
+        """Jalankan `route`; galat tak terduga dijawab 500 JSON, bukan koneksi yang diputus."""
+        try:
+            route()
+        except Exception:
+            self.log_error("%s", traceback.format_exc())
+            self.send_error_json(HTTPStatus.INTERNAL_SERVER_ERROR, "Galat internal server")
+
+    def route_get(self):
+        url = urlsplit(self.path)
+        if url.path == "/aggregates":
+            self.service.refresh()
+            self.send_json(json.dumps(self.service.describe()).encode())
+        elif url.path == "/metrics":
+            self.send_body(self.service.metrics.to_prometheus().encode(), "text/plain; version=0.0.4")
+        elif url.path.startswith("/query/"):
+            filters = {
+                col: [value for text in texts for value in text.split(",")]
+                for col, texts in parse_qs(url.query).items()
+            }
+            self.answer([{'name': url.path[len("/query/"):], 'filters': filters}], batch=False)
+        else:
+            self.send_error_json(HTTPStatus.NOT_FOUND, f"Path '{url.path}' tidak dikenal")
+
+    def route_post(self):
+        if urlsplit(self.path).path != "/batch":
+            self.send_error_json(HTTPStatus.NOT_FOUND, f"Path '{self.path}' tidak dikenal")
+            return
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            queries = payload['queries']
+        except (ValueError, KeyError, TypeError):
+            self.send_error_json(HTTPStatus.BAD_REQUEST, 'Body harus berupa {"queries": [...]}')
+            return
+        if not isinstance(queries, list) or len(queries) > MAX_BATCH:
+            self.send_error_json(HTTPStatus.BAD_REQUEST, f"'queries' harus list berisi maks. {MAX_BATCH} query")
+            return
+        self.answer(queries, batch=True)
+
+    def answer(self, queries, batch):
+        """Jawab satu atau beberapa query, dengan ETag & 304."""
+        start = time.perf_counter()
+        service = self.service
+        version = service.refresh()
+        try:
+            parsed = [
+                service.parse(query.get('name'), query.get('filters'))
+                for query in queries if isinstance(query, dict)
+            ]
+            if len(parsed) != len(queries):
+                raise QueryError("Setiap query harus berupa objek {name, filters}")
+        except QueryError as error:
+            self.send_error_json(HTTPStatus.BAD_REQUEST, str(error))
+            return
+
+        etag = service.etag(version, parsed)
+        if self.headers.get("If-None-Match") == etag:
+            service.metrics.incr("api_requests", status="304")
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        results = [service.result(version, name, key) for name, key in parsed]
+        body = b'{"results":[' + b",".join(results) + b"]}" if batch else results[0]
+        self.send_json(body, etag)
+        service.metrics.incr("api_requests", status="200")
+        service.metrics.observe("api_request_seconds", time.perf_counter() - start, batch=str(batch).lower())
+
+    def send_body(self, body, content_type, status=HTTPStatus.OK, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            # Klien boleh menyimpan jawaban, tapi wajib validasi ulang dengan ETag
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, body, etag=None):
+        self.send_body(body, "application/json", etag=etag)
+
+    def send_error_json(self, status, message):
+        self.service.metrics.incr("api_requests", status=str(int(status)))
+        self.send_body(json.dumps({'error': message}).encode(), "application/json", status=status)
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, service=None):
+    """Server HTTP multi-thread untuk `service` (dibuat baru jika None)."""
+    service = service or QueryService()
+    service.refresh()
+    handler = type("BoundQueryHandler", (QueryHandler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan query JSON untuk agregat dashboard.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"alamat (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port (default: {DEFAULT_PORT})")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port)
+    print(f"Melayani di http://{args.host}:{server.server_port}/aggregates")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""
+Benchmark tanpa browser untuk setiap bagian dashboard (2a ... 4e).
+
+Data sintetis dibangun dari skema main_data_day/hour: data asli diulang
+`skala` kali, setiap salinan digeser 2 tahun (maksimal MAX_YEAR_SHIFTS kali)
+lalu dijadikan stasiun baru ('station') dengan jumlah peminjaman diacak
+sedikit. Data sintetis ditulis ke dataset Parquet terpartisi sementara.
+Untuk setiap skala, kombinasi filter dan bagian, input grafik dibangun
+dengan section_inputs.py seperti di dashboard.py: baris dibaca dari Parquet
+dengan filter saat membaca, kubus dipotong, ringkasan boxplot & piramida
+tren diturunkan. Lalu grafik dirender ke PNG.
+
+Yang dicatat per bagian:
+- wall_s           : waktu (detik) untuk baca + input + plot + render PNG
+- rss_peak_mb      : puncak RSS proses selama bagian berjalan (Linux:
+                     VmHWM yang direset sebelum tiap bagian; OS lain:
+                     puncak sejak proses dimulai)
+- alloc_peak_mb    : puncak memori yang dialokasikan (tracemalloc)
+- alloc_blocks     : jumlah blok memori yang dialokasikan dan masih hidup
+                     di akhir bagian (tracemalloc)
+
+Alokasi diukur pada putaran terpisah karena tracemalloc memperlambat
+eksekusi. Hasil disimpan sebagai JSON agar bisa dibandingkan antar run.
+
+Jalankan:
+    python benchmark.py                          # skala 1, 10, 100, 1000
+    python benchmark.py --scales 1 10 --sections 2a 3b
+    python benchmark.py --baseline hasil_lama.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime, timezone
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+from charts import SECTIONS
+from cube import DAY_DIMENSIONS, HOUR_DIMENSIONS, build_cube
+from data_store import apply_schema, read_dataset, read_parquet, write_dataset
+from render_cache import figure_to_png
+from rolling import day_rolling, hour_rolling
+from section_inputs import SectionInputs
+
+DEFAULT_SCALES = [1, 10, 100, 1000]
+
+# Salinan data digeser 2 tahun sebanyak ini; sisanya menjadi stasiun baru
+MAX_YEAR_SHIFTS = 10
+
+# Kombinasi filter sidebar yang diukur: {nama: {kolom: daftar nilai}}
+FILTER_CASES = {
+    'semua': {},
+    'tahun_awal': {'yr': [0]},
+    'spring': {'season': ['Spring']},
+    'cerah': {'weathersit': [1]},
+    'spring_cerah_tahun_awal': {'yr': [0], 'season': ['Spring'], 'weathersit': [1]},
+}
+
+COUNT_COLUMNS = ['casual', 'registered']
+
+
+# ------------------------------------
+# Data sintetis
+# ------------------------------------
+def calendar_seasons(df, dates):
+    """
+    Musim untuk `dates` menurut kalender di `df` (musim per tanggal-bulan);
+    tanggal yang tidak ada di `df` ikut musim tanggal terakhir sebelumnya.
+    """
+    days = df['dteday'].dt.month * 100 + df['dteday'].dt.day
+    table = df['season'].groupby(days.to_numpy(), observed=True).first()
+    keys = (dates.dt.month * 100 + dates.dt.day).to_numpy()
+    pos = (np.searchsorted(table.index, keys, side='right') - 1) % len(table)
+    return pd.Categorical(table.to_numpy()[pos], dtype=df['season'].dtype)
+
+
+def synthesize(df, scale, seed=0):
+    """
+    Ulang `df` sebanyak `scale` kali dengan tahun & stasiun tambahan.
+
+    Tanggal digeser kelipatan 52 minggu per tahun agar hari dalam minggu
+    (weekday/day_type) tetap konsisten; yr/mnth/season diturunkan ulang
+    dari tanggal yang sudah digeser. 'cnt' = casual + registered.
+    """
+    n = len(df)
+    copy_id = np.repeat(np.arange(scale), n)
+    year_shift = 2 * (copy_id % MAX_YEAR_SHIFTS)
+
+    out = df.iloc[np.tile(np.arange(n), scale)].reset_index(drop=True)
+    out['dteday'] = out['dteday'] + pd.to_timedelta(year_shift * 364, unit='D')
+    first_year = int((df['dteday'].dt.year - df['yr']).min())
+    out['yr'] = out['dteday'].dt.year - first_year
+    out['mnth'] = out['dteday'].dt.month
+    if 'season' in out.columns:
+        out['season'] = calendar_seasons(df, out['dteday'])
+    out['station'] = copy_id // MAX_YEAR_SHIFTS
+    if 'instant' in out.columns:
+        out['instant'] = np.arange(1, len(out) + 1)
+
+    # Salinan pertama identik dengan data asli; sisanya diberi noise
+    rng = np.random.default_rng(seed)
+    noise = np.where(copy_id == 0, 1.0, rng.uniform(0.8, 1.2, len(out)))
+    for col in COUNT_COLUMNS:
+        out[col] = np.rint(out[col] * noise)
+    out['cnt'] = out['casual'] + out['registered']
+    if 'cnt_log' in out.columns:
+        out['cnt_log'] = np.log1p(out['cnt'])
+
+    out['station'] = out['station'].astype('int16')
+    return apply_schema(out)
+
+
+# ------------------------------------
+# Pengukuran
+# ------------------------------------
+def reset_peak_rss():
+    """Reset puncak RSS (Linux); kembalikan True jika berhasil."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    """Puncak RSS proses dalam MB (VmHWM jika tersedia)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss dalam byte di macOS, dalam KB di Linux/BSD
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(fn, allocations=True):
+    """Jalankan `fn` dan kembalikan metrik wall time, RSS & alokasi."""
+    gc.collect()
+    reset_peak_rss()
+    start = time.perf_counter()
+    fn()
+    result = {
+        'wall_s': round(time.perf_counter() - start, 4),
+        'rss_peak_mb': round(peak_rss_mb(), 1),
+    }
+
+    if allocations:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        finally:
+            tracemalloc.stop()
+        result['alloc_peak_mb'] = round(peak / (1024 * 1024), 2)
+        result['alloc_blocks'] = blocks
+    return result
+
+
+# ------------------------------------
+# Input & bagian dashboard
+# ------------------------------------
+def prepare_base(df_day, df_hour, folder):
+    """
+    Tulis data ke dataset Parquet di `folder` dan siapkan kubus lengkap,
+    sama seperti yang disiapkan dashboard.py.
+    """
+    roots = {'day': os.path.join(folder, "day"), 'hour': os.path.join(folder, "hour")}
+    write_dataset(df_day, roots['day'])
+    write_dataset(df_hour, roots['hour'])
+    return {
+        'roots': roots,
+        'day_cube': build_cube(df_day, DAY_DIMENSIONS),
+        'day_stats': day_rolling(df_day),
+        'hour_stats': hour_rolling(df_hour),
+        'hour_cube': build_cube(df_hour, HOUR_DIMENSIONS),
+    }
+
+
+def run_section(base, section_id, filters):
+    """Baca, bangun input, plot dan render PNG satu bagian (tanpa cache); kembalikan ukuran PNG."""
+    plot, input_names = SECTIONS[section_id]
+    inputs = SectionInputs(
+        filters, lambda name, filters, columns: read_parquet(base['roots'][name], columns, filters),
+        base['day_cube'], base['hour_cube'], base['day_stats'], base['hour_stats'],
+    )
+    fig = plot(*inputs.for_section(input_names))
+    return len(figure_to_png(fig))
+
+
+def run_scale(df_day, df_hour, scale, sections, filter_cases, allocations=True, log=print):
+    """Ukur semua bagian & filter untuk satu skala; kembalikan (setup, hasil)."""
+    timings = {}
+
+    start = time.perf_counter()
+    day = synthesize(df_day, scale)
+    hour = synthesize(df_hour, scale)
+    timings['synthesize_s'] = round(time.perf_counter() - start, 4)
+
+    setup = {
+        'scale': scale,
+        'rows_day': len(day),
+        'rows_hour': len(hour),
+        'memory_mb': round((day.memory_usage(deep=True).sum()
+                            + hour.memory_usage(deep=True).sum()) / (1024 * 1024), 1),
+    }
+    log(f"skala {scale}x: {len(hour):,} baris per jam, {len(day):,} baris harian")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="benchmark-") as folder:
+        start = time.perf_counter()
+        base = prepare_base(day, hour, folder)
+        timings['parquet_cube_s'] = round(time.perf_counter() - start, 4)
+        # Baris dibaca dari Parquet per bagian; frame di memori tidak dipakai lagi
+        del day, hour
+
+        for filter_name, filters in filter_cases.items():
+            for section_id in sections:
+                metrics = measure(lambda: run_section(base, section_id, filters), allocations)
+                results.append({'scale': scale, 'filter': filter_name, 'section': section_id, **metrics})
+                log(f"  {filter_name:<24} {section_id}  {metrics['wall_s']:>8.3f} s"
+                    f"  {metrics['rss_peak_mb']:>8.1f} MB RSS")
+    return {**setup, **timings}, results
+
+
+def compare(results, baseline):
+    """Rasio wall time hasil baru terhadap `baseline` per (skala, filter, bagian)."""
+    old = {(r['scale'], r['filter'], r['section']): r['wall_s'] for r in baseline['results']}
+    rows = []
+    for r in results:
+        key = (r['scale'], r['filter'], r['section'])
+        if key in old and old[key] > 0:
+            rows.append({**dict(zip(('scale', 'filter', 'section'), key)),
+                         'wall_s': r['wall_s'], 'baseline_wall_s': old[key],
+                         'ratio': round(r['wall_s'] / old[key], 3)})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark bagian dashboard pada data sintetis.")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="kelipatan jumlah baris (default: 1 10 100 1000)")
+    parser.add_argument("--sections", nargs="+", default=list(SECTIONS),
+                        choices=list(SECTIONS), help="bagian yang diukur (default: semua)")
+    parser.add_argument("--filters", nargs="+", default=list(FILTER_CASES),
+                        choices=list(FILTER_CASES), help="kombinasi filter yang diukur")
+    parser.add_argument("--no-alloc", action="store_true",
+                        help="lewati pengukuran alokasi (tracemalloc)")
+    parser.add_argument("--output", default=None,
+                        help="file JSON hasil (default: benchmark-<waktu>.json)")
+    parser.add_argument("--baseline", default=None,
+                        help="file JSON run sebelumnya untuk dibandingkan")
+    args = parser.parse_args(argv)
+
+    sns.set(style="whitegrid")
+    # Peringatan deprecation seaborn tidak relevan untuk hasil benchmark
+    warnings.simplefilter("ignore", FutureWarning)
+    df_day = read_dataset("day")
+    df_hour = read_dataset("hour")
+    filter_cases = {name: FILTER_CASES[name] for name in args.filters}
+
+    started = datetime.now(timezone.utc)
+    report = {
+        'meta': {
+            'started': started.isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'matplotlib': matplotlib.__version__,
+            'platform': platform.platform(),
+            'scales': args.scales,
+            'sections': args.sections,
+            'filters': filter_cases,
+            'allocations': not args.no_alloc,
+        },
+        'setup': [],
+        'results': [],
+    }
+
+    for scale in args.scales:
+        setup, results = run_scale(df_day, df_hour, scale, args.sections,
+                                   filter_cases, allocations=not args.no_alloc)
+        report['setup'].append(setup)
+        report['results'].extend(results)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            report['comparison'] = compare(report['results'], json.load(f))
+        for row in sorted(report['comparison'], key=lambda r: -r['ratio'])[:10]:
+            print(f"{row['scale']}x {row['filter']:<24} {row['section']}  x{row['ratio']:.2f}")
+
+    output = args.output or f"benchmark-{started:%Y%m%d-%H%M%S}.json"
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Hasil disimpan di {os.path.abspath(output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Ringkasan boxplot (five-number summary + outlier) yang dihitung sekali.
+
+Alih-alih menyerahkan seluruh baris mentah ke sns.boxplot, nilai cukup
+diurutkan satu kali per kolom (dikelompokkan lewat np.lexsort), lalu
+kuartil, whisker dan outlier setiap grup diambil dari potongan array
+yang sudah terurut. Grafik digambar dari ringkasan ini dengan ax.bxp.
+"""
+import numpy as np
+import pandas as pd
+
+# Nama ringkasan -> (kolom grup, kolom nilai). Grup None berarti satu
+# kotak per kolom nilai (mis. casual vs registered).
+BOX_SPECS = {
+    'season': ('season', 'cnt'),
+    'weathersit': ('weathersit', 'cnt'),
+    'temp_category': ('temp_category', 'cnt'),
+    'users': (None, ['casual', 'registered']),
+}
+
+# Kolom yang dibutuhkan semua ringkasan di BOX_SPECS (cukup ini yang dibaca)
+BOX_COLUMNS = list(dict.fromkeys(
+    col for by, value in BOX_SPECS.values()
+    for col in ([by] if by else []) + (value if isinstance(value, list) else [value])
+))
+
+
+def summarize_sorted(values, label):
+    """Ringkasan boxplot dari array `values` yang sudah terurut naik."""
+    if len(values) == 0:
+        return None
+
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    # Whisker: nilai data terjauh yang masih di dalam 1.5 * IQR
+    lo = np.searchsorted(values, q1 - 1.5 * iqr, side='left')
+    hi = np.searchsorted(values, q3 + 1.5 * iqr, side='right')
+
+    return {
+        'label': label,
+        'n': len(values),
+        'mean': float(values.mean()),
+        'q1': float(q1),
+        'med': float(med),
+        'q3': float(q3),
+        'whislo': float(values[lo]),
+        'whishi': float(values[hi - 1]),
+        'fliers': np.concatenate([values[:lo], values[hi:]]),
+    }
+
+
+def grouped_box_summary(df, by, value):
+    """Ringkasan boxplot `value` per grup `by`, urut sesuai urutan grup."""
+    codes, groups = pd.factorize(df[by], sort=True)
+    values = df[value].to_numpy(dtype='float64')
+
+    # Satu kali sort untuk semua grup: urutkan per kode grup lalu per nilai
+    order = np.lexsort((values, codes))
+    sorted_values = values[order]
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(codes[codes >= 0], minlength=len(groups)))])
+    # Baris dengan grup kosong (NaN, kode -1) ada di awal hasil sort
+    offset = int((codes < 0).sum())
+
+    stats = []
+    for i, group in enumerate(groups):
+        chunk = sorted_values[offset + bounds[i]:offset + bounds[i + 1]]
+        summary = summarize_sorted(chunk, group.item() if isinstance(group, np.generic) else group)
+        if summary is not None:
+            stats.append(summary)
+    return stats
+
+
+def column_box_summary(df, columns):
+    """Ringkasan boxplot satu kotak per kolom di `columns`."""
+    stats = []
+    for col in columns:
+        summary = summarize_sorted(np.sort(df[col].to_numpy(dtype='float64')), col)
+        if summary is not None:
+            stats.append(summary)
+    return stats
+
+
+def box_summaries(df, specs=BOX_SPECS):
+    """Semua ringkasan di `specs` yang kolomnya tersedia di `df`."""
+    summaries = {}
+    for name, (by, value) in specs.items():
+        if by is None:
+            if all(col in df.columns for col in value):
+                summaries[name] = column_box_summary(df, value)
+        elif by in df.columns and value in df.columns:
+            summaries[name] = grouped_box_summary(df, by, value)
+    return summaries
+
+
+def draw_boxes(ax, stats, palette, order=None):
+    """
+    Gambar boxplot dari ringkasan `stats` ke `ax` dengan warna `palette`.
+
+    `order` (opsional) menentukan posisi kotak berdasarkan label; label
+    yang tidak ada datanya dibiarkan kosong. Mengembalikan {label: posisi}.
+    """
+    if order is None:
+        order = [s['label'] for s in stats]
+    positions = {label: i for i, label in enumerate(order)}
+    stats = [s for s in stats if s['label'] in positions]
+
+    ax.set_xticks(range(len(order)))
+    ax.set_xticklabels([str(label) for label in order])
+    ax.set_xlim(-0.5, len(order) - 0.5)
+    if not stats:
+        return positions
+
+    # Diimpor di sini supaya box_summaries tidak ikut memuat seaborn
+    import seaborn as sns
+
+    colors = sns.color_palette(palette, len(order))
+    boxes = ax.bxp(
+        stats,
+        positions=[positions[s['label']] for s in stats],
+        widths=0.8,
+        patch_artist=True,
+        flierprops={'marker': 'd', 'markersize': 4, 'markerfacecolor': '#3f3f3f', 'markeredgecolor': '#3f3f3f'},
+        medianprops={'color': '#3f3f3f'},
+        whiskerprops={'color': '#3f3f3f'},
+        capprops={'color': '#3f3f3f'},
+    )
+    for box, s in zip(boxes['boxes'], stats):
+        box.set_facecolor(colors[positions[s['label']]])
+        box.set_edgecolor('#3f3f3f')
+
+    # bxp menimpa label & batas sumbu x; pasang ulang sesuai urutan
+    ax.set_xticks(range(len(order)))
+    ax.set_xticklabels([str(label) for label in order])
+    ax.set_xlim(-0.5, len(order) - 0.5)
+    return positions
@@ -0,0 +1,406 @@
+"""
+Fungsi pembuat grafik untuk setiap bagian dashboard (2a ... 4e).
+
+Setiap fungsi hanya membangun figure matplotlib dari data yang sudah
+difilter dan mengembalikannya; menampilkan & meng-cache hasil render
+dilakukan oleh dashboard.py. SECTIONS memetakan id bagian ke fungsi
+pembuatnya beserta nama input yang dibutuhkan (aggregates.SECTION_INPUTS).
+
+Modul ini memuat matplotlib & seaborn, jadi hanya diimpor saat grafik
+PNG pertama kali dibutuhkan (lihat render_pool.py).
+"""
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import numpy as np
+import seaborn as sns
+
+from aggregates import (
+    SECTION_INPUTS, hourly_trend, monthly_pattern, rush_hour_comparison, rush_hour_pattern,
+    rush_hour_weekday, weather_comparison, weekday_weekend_comparison,
+)
+from box_stats import draw_boxes
+from downsample import DEFAULT_POINTS
+
+# Supaya tampilan seaborn lebih enak dibaca; berlaku sejak modul grafik
+# pertama kali dimuat (di proses dashboard maupun worker render)
+sns.set(style="whitegrid")
+
+
+def plot_daily_trend(day_trends, date_range=None):
+    """Tren peminjaman sepeda per hari (rentang `date_range` atau seluruhnya)."""
+    dates, counts = day_trends['cnt'].view(DEFAULT_POINTS, *(date_range or (None, None)))
+
+    fig, ax = plt.subplots(figsize=(12,5), dpi=100)
+    ax.plot(dates, counts, label="Total Peminjaman", marker='o', linestyle='-')
+    ax.set_xlabel("Tanggal", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Tren Peminjaman Sepeda per Hari", fontsize=12)
+    ax.legend()
+
+    # Format tanggal di sumbu X
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+    # Satu label per bulan, dijarangkan untuk rentang lebih dari 2 tahun
+    months = len(np.unique(dates.astype('datetime64[M]'))) if len(dates) else 1
+    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=max(1, months // 24)))
+    plt.xticks(rotation=45)
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_hourly_trend(hour_cube):
+    """Rata-rata peminjaman per jam dengan CI 95%."""
+    # Rata-rata per jam + CI 95% dari kubus agregat
+    hourly = hourly_trend(hour_cube)
+
+    fig, ax = plt.subplots(figsize=(12,5), dpi=100)
+    ax.plot(hourly['hr'], hourly['mean'], marker='o', linestyle='-', label="Total Peminjaman")
+    ax.fill_between(hourly['hr'], hourly['ci_low'], hourly['ci_high'], alpha=0.2)
+    ax.set_xlabel("Jam", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Tren Peminjaman Sepeda per Jam", fontsize=12)
+    ax.legend()
+    ax.set_xticks(range(0,24,1))
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_monthly_pattern(day_cube):
+    """Rata-rata peminjaman harian per bulan."""
+    monthly = monthly_pattern(day_cube)
+
+    fig, ax = plt.subplots(figsize=(10,5), dpi=100)
+    sns.barplot(x='mnth', y='mean', data=monthly, palette="viridis", errorbar=None, ax=ax)
+    ax.set_xlabel("Bulan", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Jumlah Peminjaman Sepeda Berdasarkan Bulan (Day)", fontsize=12)
+    ax.set_xticks(range(0,12))
+    ax.set_xticklabels(["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], fontsize=9)
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_rush_hour_pattern(hour_cube):
+    """Rata-rata peminjaman Rush Hour vs Non-Rush Hour."""
+    fig, ax = plt.subplots(figsize=(10,5), dpi=100)
+    plot_data = rush_hour_pattern(hour_cube)
+
+    ax2 = sns.barplot(x='rush_hour', y='mean', data=plot_data, palette="coolwarm", ax=ax)
+    # Error bar CI 95% dari kubus (pengganti bootstrap seaborn)
+    ax2.errorbar(range(len(plot_data)), plot_data['mean'],
+                 yerr=[plot_data['mean'] - plot_data['ci_low'], plot_data['ci_high'] - plot_data['mean']],
+                 fmt='none', ecolor='#424242', linewidth=2.5)
+    ax2.set_xlabel("Kategori Waktu", fontsize=10)
+    ax2.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax2.set_title("Distribusi Peminjaman Sepeda pada Rush Hour vs Non-Rush Hour (Hour)", fontsize=12)
+
+    # Anotasi
+    for p in ax2.patches:
+        ax2.annotate(f'{int(p.get_height())}', 
+                     (p.get_x() + p.get_width() / 2, p.get_height()),
+                     ha='center', va='bottom', fontsize=9, color='black')
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_daily_rolling_trend(day_trends, date_range=None):
+    """Tren harian beserta rata-rata bergerak 30 hari (rentang `date_range` atau seluruhnya)."""
+    # Kedua deret sudah direduksi ke jumlah titik sesuai lebar gambar & rentang tanggal
+    dates, counts = day_trends['cnt'].view(DEFAULT_POINTS, *(date_range or (None, None)))
+    rolling_dates, rolling_mean = day_trends['rolling_30'].view(DEFAULT_POINTS, *(date_range or (None, None)))
+
+    fig, ax = plt.subplots(figsize=(12,5), dpi=100)
+
+    sns.lineplot(x=dates, y=counts, marker='o', label="Total Peminjaman", ax=ax, color='blue')
+    sns.lineplot(x=rolling_dates, y=rolling_mean, label="Rata-rata Bergerak (30 hari)", ax=ax, color='red')
+
+    ax.set_xlabel("Tanggal", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Tren Peminjaman Sepeda Harian dalam 2 Tahun", fontsize=12)
+    plt.xticks(rotation=45)
+    plt.legend()
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_hourly_rolling_trend(hour_trends, date_range=None):
+    """Tren per jam beserta rata-rata bergerak 24 & 168 jam (rentang `date_range` atau seluruhnya)."""
+    view = date_range or (None, None)
+    dates, counts = hour_trends['cnt'].view(DEFAULT_POINTS, *view)
+
+    fig, ax = plt.subplots(figsize=(12,5), dpi=100)
+    ax.plot(dates, counts, label="Total Peminjaman per Jam", color='lightgray', linewidth=0.8)
+    for name, label, color in (('rolling_24', "Rata-rata Bergerak (24 jam)", 'red'),
+                               ('rolling_168', "Rata-rata Bergerak (168 jam)", 'green')):
+        rolling_dates, rolling_mean = hour_trends[name].view(DEFAULT_POINTS, *view)
+        ax.plot(rolling_dates, rolling_mean, label=label, color=color)
+
+    ax.set_xlabel("Tanggal", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Tren Peminjaman Sepeda per Jam dengan Rata-rata Bergerak", fontsize=12)
+    plt.xticks(rotation=45)
+    plt.legend()
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_season_day(day_boxes):
+    """Boxplot peminjaman harian per musim dari ringkasan kuartil."""
+    stats = day_boxes['season']
+
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    positions = draw_boxes(ax, stats, "coolwarm")
+    ax.set_xlabel("Musim", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Pengaruh Musim terhadap Peminjaman Sepeda (Day)", fontsize=12)
+
+    # Anotasi rata-rata
+    for s in stats:
+        ax.text(positions[s['label']], s['mean'] + 500, f'{int(s["mean"]):,}', ha='center', va='bottom', fontsize=9, color='black')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_season_hour(hour_boxes):
+    """Boxplot peminjaman per jam per musim dari ringkasan kuartil."""
+    stats = hour_boxes['season']
+
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    positions = draw_boxes(ax, stats, "coolwarm")
+    ax.set_xlabel("Musim", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Pengaruh Musim terhadap Peminjaman Sepeda (Hour)", fontsize=12)
+
+    # Anotasi rata-rata
+    for s in stats:
+        ax.text(positions[s['label']], s['mean'] + 100, f'{int(s["mean"]):,}', ha='center', va='bottom', fontsize=9, color='black')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_weather_day(day_boxes):
+    """Boxplot peminjaman harian per kondisi cuaca dari ringkasan kuartil."""
+    stats = day_boxes['weathersit']
+
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    positions = draw_boxes(ax, stats, "coolwarm")
+    ax.set_xlabel("Kondisi Cuaca", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda (Day)", fontsize=12)
+
+    # Anotasi rata-rata
+    for s in stats:
+        ax.text(positions[s['label']], s['mean'] + 100, f'{int(s["mean"]):,}', ha='center', va='bottom', fontsize=9, color='black')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_weather_hour(hour_boxes):
+    """Boxplot peminjaman per jam per kondisi cuaca dari ringkasan kuartil."""
+    stats = hour_boxes['weathersit']
+
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    positions = draw_boxes(ax, stats, "coolwarm")
+    ax.set_xlabel("Kondisi Cuaca", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda (Hour)", fontsize=12)
+
+    # Anotasi rata-rata
+    for s in stats:
+        ax.text(positions[s['label']], s['mean'] + 100, f'{int(s["mean"]):,}', ha='center', va='bottom', fontsize=9, color='black')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_temperature_hour(hour_boxes):
+    """Boxplot peminjaman per jam per kategori suhu dari ringkasan kuartil."""
+    stats = hour_boxes['temp_category']
+
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    # Pastikan urutan kategori suhu: Cold, Mild, Warm, Hot
+    order_cats = ["Cold", "Mild", "Warm", "Hot"]
+    positions = draw_boxes(ax, stats, "magma", order=order_cats)
+    ax.set_xlabel("Kategori Suhu", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Pengaruh Suhu terhadap Peminjaman Sepeda (Hour)", fontsize=12)
+
+    # Anotasi median
+    for s in stats:
+        if s['label'] in positions:
+            ax.text(positions[s['label']], s['med'] + 50, f'{int(s["med"]):,}', ha='center', va='bottom', fontsize=9, color='black')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_weather_total(hour_cube):
+    """Total peminjaman per kondisi cuaca."""
+    # Agregasi total peminjaman berdasarkan kondisi cuaca
+    weather_totals = weather_comparison(hour_cube)
+
+    # Membuat visualisasi Pengaruh Cuaca
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    sns.barplot(x='weathersit', y='total_peminjaman', data=weather_totals, palette="coolwarm", ax=ax)
+
+    # Menambahkan label dan judul
+    ax.set_xlabel("Kondisi Cuaca", fontsize=10)
+    ax.set_ylabel("Total Peminjaman", fontsize=10)
+    ax.set_title("Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda", fontsize=12)
+
+    # Menambahkan anotasi jumlah peminjaman di setiap kategori cuaca
+    for i, row in weather_totals.iterrows():
+        ax.text(i, row.total_peminjaman + 1000, f'{int(row.total_peminjaman):,}',
+                ha='center', fontsize=9, color='black')
+
+    # Menambahkan grid untuk memperjelas perbedaan jumlah peminjaman
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_user_type_day(day_boxes):
+    """Boxplot pengguna casual vs registered (harian) dari ringkasan kuartil."""
+    stats = day_boxes['users']
+
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    positions = draw_boxes(ax, stats, ["skyblue", "salmon"])
+    ax.set_xlabel("Tipe Pengguna", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Perbandingan Pengguna Casual vs Registered (Day)", fontsize=12)
+
+    # Anotasi median
+    for s in stats:
+        ax.text(positions[s['label']], s['med'] + 100, f'{int(s["med"]):,}', ha='center', va='bottom', fontsize=9, color='black')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_user_type_hour(hour_boxes):
+    """Boxplot pengguna casual vs registered (per jam) dari ringkasan kuartil."""
+    stats = hour_boxes['users']
+
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    positions = draw_boxes(ax, stats, ["skyblue", "salmon"])
+    ax.set_xlabel("Tipe Pengguna", fontsize=10)
+    ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
+    ax.set_title("Perbandingan Pengguna Casual vs Registered (Hour)", fontsize=12)
+
+    # Anotasi median
+    for s in stats:
+        ax.text(positions[s['label']], s['med'] + 100, f'{int(s["med"]):,}', ha='center', va='bottom', fontsize=9, color='black')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_rush_hour_comparison(hour_cube):
+    """Rata-rata peminjaman per kategori waktu (jam sibuk)."""
+    # Agregasi jumlah peminjaman per kategori waktu
+    by_time = rush_hour_comparison(hour_cube)
+
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    sns.barplot(x='time_category', y='avg_peminjaman', data=by_time, palette='coolwarm', ax=ax)
+    ax.set_xlabel("Kategori Waktu", fontsize=10)
+    ax.set_ylabel("Rata-rata Peminjaman", fontsize=10)
+    ax.set_title("Perbandingan Peminjaman Sepeda pada Rush Hour vs Non-Rush Hour", fontsize=12)
+
+    # Anotasi
+    for i, row in by_time.iterrows():
+        ax.text(i, row.avg_peminjaman + 10, f'{int(row.avg_peminjaman):,}', 
+                ha='center', fontsize=9, color='black')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_rush_hour_weekday(hour_cube):
+    """Rata-rata peminjaman per kategori waktu dan tipe hari."""
+    by_time_day = rush_hour_weekday(hour_cube)
+
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    sns.barplot(x='time_category', y='avg_peminjaman', hue='day_type', data=by_time_day, 
+                palette=['blue','red'], ax=ax)
+    ax.set_xlabel("Kategori Waktu", fontsize=10)
+    ax.set_ylabel("Rata-rata Peminjaman", fontsize=10)
+    ax.set_title("Pengaruh Hari Kerja dan Akhir Pekan terhadap Peminjaman Sepeda", fontsize=12)
+
+    # Legenda
+    plt.legend(title="Tipe Hari", labels=["Weekday","Weekend"])
+
+    # Anotasi
+    for p in ax.patches:
+        ax.annotate(f'{int(p.get_height()):,}',
+                    (p.get_x() + p.get_width()/2., p.get_height()),
+                    ha='center', va='bottom', fontsize=9, color='black')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_weekday_weekend(hour_cube):
+    """Total peminjaman weekday vs weekend."""
+    # Agregasi total peminjaman berdasarkan tipe hari
+    by_day_type = weekday_weekend_comparison(hour_cube)
+
+    # Membuat visualisasi Total Peminjaman
+    fig, ax = plt.subplots(figsize=(8,5), dpi=100)
+    sns.barplot(x='day_type', y='total_peminjaman', data=by_day_type, palette=['blue', 'orange'], ax=ax)
+
+    # Menambahkan label dan judul
+    ax.set_xlabel("Tipe Hari", fontsize=10)
+    ax.set_ylabel("Total Peminjaman", fontsize=10)
+    ax.set_title("Perbandingan Total Peminjaman Sepeda: Weekday vs Weekend", fontsize=12)
+
+    # Menambahkan anotasi jumlah peminjaman di setiap kategori waktu
+    for i, row in by_day_type.iterrows():
+        ax.text(i, row.total_peminjaman + 2000, f'{int(row.total_peminjaman):,}',
+                ha='center', fontsize=9, color='black')
+
+    # Menambahkan grid untuk memperjelas perbedaan jumlah peminjaman
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+# Id bagian -> fungsi pembuat grafik
+PLOTS = {
+    '2a': plot_daily_trend,
+    '2b': plot_hourly_trend,
+    '2c': plot_monthly_pattern,
+    '2d': plot_rush_hour_pattern,
+    '2e': plot_daily_rolling_trend,
+    '2f': plot_hourly_rolling_trend,
+    '3a': plot_season_day,
+    '3b': plot_season_hour,
+    '3c': plot_weather_day,
+    '3d': plot_weather_hour,
+    '3e': plot_temperature_hour,
+    '3f': plot_weather_total,
+    '4a': plot_user_type_day,
+    '4b': plot_user_type_hour,
+    '4c': plot_rush_hour_comparison,
+    '4d': plot_rush_hour_weekday,
+    '4e': plot_weekday_weekend,
+}
+
+# Id bagian -> (fungsi pembuat grafik, nama input yang dibutuhkan)
+SECTIONS = {section_id: (plot, SECTION_INPUTS[section_id]) for section_id, plot in PLOTS.items()}
@@ -0,0 +1,84 @@
+"""
+Kubus agregat (OLAP cube) untuk grafik bar/rata-rata/total di dashboard.
+
+Kubus dibangun sekali saat data dimuat: setiap sel berisi jumlah baris,
+total (sum) dan jumlah kuadrat (sum of squares) dari 'cnt', 'casual' dan
+'registered' untuk satu kombinasi dimensi. Filter sidebar cukup memotong
+sel kubus lalu menjumlahkan ulang, tanpa memindai baris mentah lagi.
+"""
+import numpy as np
+import pandas as pd
+
+# Dimensi kubus untuk data per jam & harian (kolom yang tidak ada dilewati)
+HOUR_DIMENSIONS = ['yr', 'season', 'weathersit', 'mnth', 'hr', 'day_type', 'rush_hour', 'temp_category']
+DAY_DIMENSIONS = ['yr', 'season', 'weathersit', 'mnth', 'day_type', 'temp_category']
+
+MEASURES = ['cnt', 'casual', 'registered']
+
+
+def build_cube(df, dimensions, measures=MEASURES):
+    """Agregasi `df` ke sel-sel kubus: n, <m>_sum dan <m>_sumsq per measure."""
+    dims = [d for d in dimensions if d in df.columns]
+    measures = [m for m in measures if m in df.columns]
+
+    work = df[dims + measures].copy()
+    for m in measures:
+        work[f'{m}_sq'] = work[m].astype('float64') ** 2
+
+    aggs = {'n': (measures[0], 'size')}
+    for m in measures:
+        aggs[f'{m}_sum'] = (m, 'sum')
+        aggs[f'{m}_sumsq'] = (f'{m}_sq', 'sum')
+
+    return work.groupby(dims, observed=True).agg(**aggs).reset_index()
+
+
+def merge_cubes(*cubes):
+    """Gabungkan kubus-kubus berdimensi sama dengan menjumlahkan selnya."""
+    measures = [c for c in cubes[0].columns if c == 'n' or c.endswith(('_sum', '_sumsq'))]
+    dims = [c for c in cubes[0].columns if c not in measures]
+    merged = pd.concat(cubes, ignore_index=True)
+    return merged.groupby(dims, observed=True).sum().reset_index()
+
+
+def build_cube_from_parts(parts, dimensions, measures=MEASURES):
+    """Kubus dari potongan-potongan data (mis. per partisi) tanpa menggabung barisnya."""
+    return merge_cubes(*(build_cube(part, dimensions, measures) for part in parts))
+
+
+def slice_cube(cube, filters):
+    """Ambil sel kubus yang lolos filter {kolom: daftar nilai terpilih}."""
+    mask = np.ones(len(cube), dtype=bool)
+    for col, values in filters.items():
+        if col in cube.columns:
+            mask &= cube[col].isin(values).to_numpy()
+    return cube[mask]
+
+
+def rollup(cube, by, measure='cnt'):
+    """
+    Jumlahkan ulang sel kubus per `by` untuk satu measure.
+
+    Hasil: kolom `by` + total, count, mean dan std (sampel) dari measure.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    grouped = cube.groupby(by, observed=True)[['n', f'{measure}_sum', f'{measure}_sumsq']].sum()
+
+    n = grouped['n']
+    total = grouped[f'{measure}_sum']
+    mean = total / n
+    # Varians sampel dari sum & sum of squares
+    var = (grouped[f'{measure}_sumsq'] - n * mean ** 2) / (n - 1).where(n > 1)
+
+    return pd.DataFrame({
+        'total': total,
+        'count': n,
+        'mean': mean,
+        'std': np.sqrt(var.clip(lower=0)),
+    }).reset_index()
+
+
+def confidence_interval(summary, z=1.96):
+    """Batas bawah & atas CI (default 95%) untuk rata-rata hasil `rollup`."""
+    margin = z * summary['std'].fillna(0) / np.sqrt(summary['count'])
+    return summary['mean'] - margin, summary['mean'] + margin
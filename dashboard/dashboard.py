@@ -1,141 +1,405 @@
+import os
+import threading
+import time
+from concurrent.futures import as_completed
+
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import os
-import matplotlib.dates as mdates
+
+from aggregates import SECTION_INPUTS
+from cube import DAY_DIMENSIONS, HOUR_DIMENSIONS, build_cube, build_cube_from_parts
+from data_store import (
+    PARTITION_COLUMNS, apply_schema, data_version, filter_frame, iter_partitions, read_dataset,
+)
+from filters import FILTER_COLUMNS, row_mask
+from ingest import LiveDataset, batch_matches, hour_keys
+from metrics import Metrics, RunTrace
+from render_cache import RenderCache, filter_key
+from render_pool import RenderPool, render_section
+from rolling import day_rolling, hour_rolling
+from rollups import daily_rollup
+from section_inputs import HOUR_INPUTS, SectionInputs
+from sketches import build_cell_sketches, describe_cells, sketch_frame
 
 # Pengaturan dasar halaman
 st.set_page_config(page_title="Bike Sharing Dashboard", layout="wide")
 
-# Supaya tampilan seaborn lebih enak dibaca
-sns.set(style="whitegrid")
+# Judul halaman & sidebar dikirim lebih dulu, sebelum data dimuat. Pustaka
+# grafik (matplotlib/seaborn, altair) baru dimuat saat grafik pertama
+# dibutuhkan atau oleh warm-up di akhir rerun pertama.
+st.title("🚴‍♂️ Bike Sharing Dashboard")
+st.sidebar.title("Bike Sharing Filters")
+
+# Copy-on-write: salinan/irisan frame berbagi memori sampai ada yang mengubahnya
+pd.set_option("mode.copy_on_write", True)
+
+@st.cache_resource
+def get_metrics():
+    """Metrik latensi & cache yang dikumpulkan dari semua sesi."""
+    return Metrics()
+
+# Span waktu rerun ini (load, filter, tiap bagian) untuk metrik & panel debug
+metrics = get_metrics()
+trace = RunTrace(metrics)
 
 # ------------------------------------
 # 1. LOAD DATA
 # ------------------------------------
-@st.cache_data
-def load_day_data():
-    """Load dataset harian dari main_data_day.csv."""
-    df_day = pd.read_csv(os.path.join(os.path.dirname(__file__), "main_data_day.csv"))
-    
-    # Pastikan konversi 'dteday' ke datetime jika ada
-    if 'dteday' in df_day.columns:
-        df_day['dteday'] = pd.to_datetime(df_day['dteday'])
-    
-    return df_day
-
-@st.cache_data
-def load_hour_data():
-    """Load dataset per jam dari main_data_hour.csv."""
-    df_hour = pd.read_csv(os.path.join(os.path.dirname(__file__), "main_data_hour.csv"))
-    
-    # Pastikan konversi 'dteday' ke datetime jika ada
-    if 'dteday' in df_hour.columns:
-        df_hour['dteday'] = pd.to_datetime(df_hour['dteday'])
-        
-    return df_hour
-
-# Memuat kedua data
-df_day = load_day_data()
-df_hour = load_hour_data()
+# Data dasar tetap di disk sebagai dataset Parquet terpartisi (yr/mnth).
+# Yang disimpan di memori hanya kubus agregat dan baris yang lolos filter
+# sidebar; filter tahun/bulan diterapkan saat membaca, jadi partisi yang
+# tidak dipilih tidak pernah dibaca. Input grafik (section_inputs.py)
+# dipakai bersama oleh semua sesi (cache_resource) sebagai data baca-saja
+# (copy-on-write).
+@st.cache_resource
+def load_day_schema(version=None):
+    """Frame data harian tanpa baris (kolom & tipe saja)."""
+    return read_dataset("day", filters={PARTITION_COLUMNS[0]: []})
+
+@st.cache_resource(max_entries=4)
+def load_day_cube(version=None, store_version=0):
+    """
+    Kubus agregat data harian: tabel rollup bulanan yang sudah disimpan di
+    disk, atau dibangun ulang dari tabel harian jika ada baris tambahan.
+    """
+    if not store_version:
+        return read_dataset("month")
+    return build_cube(read_rows("day", {}), DAY_DIMENSIONS)
+
+@st.cache_resource
+def get_render_pool():
+    """Pool proses render grafik yang dipakai bersama oleh semua sesi."""
+    return RenderPool()
+
+@st.cache_resource
+def get_render_cache():
+    """Cache render grafik (PNG) yang dipakai bersama oleh semua sesi."""
+    return RenderCache()
+
+# Bagian grafik yang memakai data per jam (ikut berubah saat ada append)
+HOUR_SECTIONS = {
+    section_id for section_id, input_names in SECTION_INPUTS.items()
+    if HOUR_INPUTS & set(input_names)
+}
+
+@st.cache_resource
+def get_hour_store(version=None):
+    """
+    Kubus data per jam + baris tambahan yang bisa di-append, dipakai semua sesi.
+
+    Baris dasar tetap di disk; store hanya memegang kubusnya dan baris
+    dari batch baru. Setiap batch baru menghapus grafik harian (rollup-nya
+    ikut berubah) dan grafik per jam yang filternya mencakup baris batch
+    tersebut dari cache render; grafik per jam lainnya dipindah ke versi
+    store yang baru.
+    """
+    base = read_dataset("hour", columns=['instant', 'dteday', 'hr'])
+    store = LiveDataset(
+        read_dataset("hour", filters={PARTITION_COLUMNS[0]: []}),
+        HOUR_DIMENSIONS,
+        base_cube=build_cube_from_parts(iter_partitions("hour"), HOUR_DIMENSIONS),
+        next_instant=int(base['instant'].max()) + 1,
+        base_keys=hour_keys(base),
+    )
+    render_cache = get_render_cache()
+
+    def on_batch(batch):
+        previous = store.version - 1
+        render_cache.invalidate(lambda key: key[0] not in HOUR_SECTIONS or batch_matches(key[1], batch))
+        render_cache.rekey(lambda key: key[3] == previous, lambda key: key[:3] + (store.version,) + key[4:])
+
+    store.on_append(on_batch)
+    return store
+
+@st.cache_resource(max_entries=4)
+def load_appended_days(version, store_version, _snapshot):
+    """
+    Baris harian untuk tanggal yang disentuh baris tambahan: rollup ulang
+    baris per jam dasar tanggal itu + baris tambahan (None jika belum ada).
+    """
+    appended = _snapshot.frame
+    if appended.empty:
+        return None
+    base = read_dataset("hour", filters={col: sorted(set(appended[col])) for col in PARTITION_COLUMNS})
+    base = base[base['dteday'].isin(appended['dteday'])]
+    hours = apply_schema(pd.concat([base, appended[base.columns]], ignore_index=True))
+    start = min(read_dataset("day", columns=['dteday'])['dteday'].min(), hours['dteday'].min())
+    return daily_rollup(hours, start=start)
+
+def read_day_rows(filters, columns=None):
+    """Baris harian yang lolos `filters`; tanggal yang disentuh baris tambahan diganti rollup ulangnya."""
+    days = load_appended_days(version, hour_data.version, hour_data)
+    if days is None:
+        return read_dataset("day", columns=columns, filters=filters)
+    read_columns = None if columns is None else list(dict.fromkeys([*columns, 'dteday']))
+    rows = read_dataset("day", columns=read_columns, filters=filters)
+    rows = rows[~rows['dteday'].isin(days['dteday'])]
+    rows = pd.concat([rows, filter_frame(days, filters)[rows.columns]], ignore_index=True)
+    rows = apply_schema(rows.sort_values('dteday', ignore_index=True))
+    return rows if columns is None else rows[columns]
+
+def read_rows(name, filters, columns=None):
+    """
+    Kolom `columns` dataset `name` untuk baris yang lolos `filters`. Baris
+    dari incoming/ ditambahkan ke data per jam dan ikut di-rollup ke data
+    harian, jadi grafik harian & per jam menghitung baris yang sama.
+    """
+    if name == "day":
+        return read_day_rows(filters, columns)
+    rows = read_dataset(name, columns=columns, filters=filters)
+    appended = hour_data.frame[row_mask(hour_data.index, filters)]
+    if columns is not None:
+        appended = appended[columns]
+    if appended.empty:
+        return rows
+    return apply_schema(pd.concat([rows, appended], ignore_index=True))
+
+@st.cache_resource(max_entries=64)
+def load_input(name, filters, version, store_version, _build):
+    """Input grafik `name` untuk satu kombinasi filter, versi data & versi store."""
+    return _build()
+
+# Kubus & store dibangun sekali per versi data; file baru di
+# dashboard/incoming/ ditambahkan ke data per jam
+with trace.span("load"), st.spinner("Memuat data..."):
+    version = data_version()
+    hour_store = get_hour_store(version)
+    hour_store.ingest_dropped_files()
+    # Satu snapshot store per rerun: baris tambahan, indeks & kubus yang
+    # saling cocok walaupun sesi lain sedang menambah batch
+    hour_data = hour_store.snapshot
+    hour_cube = hour_data.cube
+    day_cube = load_day_cube(version, hour_data.version)
+
+# Kolom yang tersedia (untuk pengecekan sebelum menggambar grafik)
+day_schema = load_day_schema(version)
+day_columns = day_schema.columns
+hour_columns = hour_data.frame.columns
+
+@st.cache_resource(max_entries=4)
+def load_day_rolling(version, store_version):
+    """Statistik bergerak harian (7/30/90 hari) atas seluruh data, per versi data & store."""
+    return day_rolling(read_rows("day", {}, ['dteday', 'cnt']))
+
+@st.cache_resource(max_entries=4)
+def load_hour_rolling(version, store_version):
+    """Statistik bergerak per jam (24/168 jam) atas seluruh data, per versi data & store."""
+    return hour_rolling(read_rows("hour", {}, ['dteday', 'hr', 'cnt']))
+
+@st.cache_resource(max_entries=8)
+def load_cell_sketches(name, columns, version, store_version=0):
+    """
+    Sketch statistik per sel filter atas seluruh dataset `name`, per versi
+    data. Data harian yang memuat baris tambahan (`store_version`) dibaca
+    ulang utuh karena tanggal yang di-rollup ulang tidak bisa dikurangkan
+    dari sketch.
+    """
+    parts = [read_rows(name, {})] if store_version else iter_partitions(name)
+    return build_cell_sketches(parts, FILTER_COLUMNS, columns)
+
+@st.cache_resource(max_entries=16)
+def load_appended_sketches(filters, columns, store_version, _snapshot):
+    """Sketch baris tambahan per jam yang lolos `filters`."""
+    return sketch_frame(_snapshot.frame[row_mask(_snapshot.index, dict(filters))], columns)
+
+def describe_filtered(name):
+    """Statistik deskriptif data terfilter dari gabungan sketch, tanpa memindai baris."""
+    schema = day_schema if name == "day" else hour_data.frame
+    columns = tuple(schema.select_dtypes(['number', 'datetime']).columns)
+    extra = None
+    if name == "hour":
+        extra = load_appended_sketches(filter_key(active_filters), columns, hour_data.version, hour_data)
+    store_version = hour_data.version if name == "day" else 0
+    return describe_cells(load_cell_sketches(name, columns, version, store_version), active_filters, columns, extra,
+                          datetime_columns=tuple(schema.select_dtypes('datetime').columns))
 
 # ------------------------------------
 # 2. SIDEBAR: FILTER-FILTER
 # ------------------------------------
-st.sidebar.title("Bike Sharing Filters")
-
-# Filter Tahun (yr) -> 0 = 2011, 1 = 2012
-if 'yr' in df_day.columns or 'yr' in df_hour.columns:
-    all_years_day = df_day['yr'].unique() if 'yr' in df_day.columns else []
-    all_years_hour = df_hour['yr'].unique() if 'yr' in df_hour.columns else []
-    all_years = sorted(list(set(all_years_day) | set(all_years_hour)))  # gabung unique di day & hour
-
-    selected_years = st.sidebar.multiselect(
-        "Pilih Tahun (0 = 2011, 1 = 2012):",
-        options=all_years,
-        default=all_years
-    )
-    # Terapkan filter ke df_day
-    if 'yr' in df_day.columns:
-        df_day = df_day[df_day['yr'].isin(selected_years)]
-    # Terapkan filter ke df_hour
-    if 'yr' in df_hour.columns:
-        df_hour = df_hour[df_hour['yr'].isin(selected_years)]
-
-# Filter Kondisi Cuaca (weathersit)
-if 'weathersit' in df_day.columns or 'weathersit' in df_hour.columns:
-    all_weather_day = df_day['weathersit'].unique() if 'weathersit' in df_day.columns else []
-    all_weather_hour = df_hour['weathersit'].unique() if 'weathersit' in df_hour.columns else []
-    all_weather = sorted(list(set(all_weather_day) | set(all_weather_hour)))
-
-    selected_weather = st.sidebar.multiselect(
-        "Pilih Kondisi Cuaca (1=cerah, 2=berawan, dsb.):",
-        options=all_weather,
-        default=all_weather
+# Kolom filter -> label widget. Tahun (yr): 0 = 2011, 1 = 2012
+FILTER_LABELS = {
+    'yr': "Pilih Tahun (0 = 2011, 1 = 2012):",
+    'weathersit': "Pilih Kondisi Cuaca (1=cerah, 2=berawan, dsb.):",
+    'season': "Pilih Musim (1=Musim Semi, 2=Musim Panas, dst.):",
+}
+
+# Filter yang dipilih di sidebar: {kolom: daftar nilai}
+# Opsi (sekaligus pilihan default) tiap kolom, diambil dari kubus per jam
+# (data harian adalah rollup-nya)
+filter_options = {
+    col: sorted(set(hour_cube[col])) for col in FILTER_COLUMNS if col in hour_cube.columns
+}
+active_filters = {}
+with trace.span("filters"):
+    for col, all_values in filter_options.items():
+        active_filters[col] = st.sidebar.multiselect(
+            FILTER_LABELS.get(col, f"Pilih {col}:"),
+            options=all_values,
+            default=all_values
+        )
+
+# Rentang tanggal yang terlihat di grafik tren (2a, 2e & 2f); level
+# downsampling dipilih dari rentang ini. None = seluruh data.
+day_stats = load_day_rolling(version, hour_data.version)
+date_range = None
+if len(day_stats.frame) > 1:
+    first_day, last_day = (day.date() for day in day_stats.frame.index[[0, -1]])
+    picked = st.sidebar.slider(
+        "Rentang tanggal grafik tren:",
+        min_value=first_day, max_value=last_day, value=(first_day, last_day)
     )
-    # Terapkan filter
-    if 'weathersit' in df_day.columns:
-        df_day = df_day[df_day['weathersit'].isin(selected_weather)]
-    if 'weathersit' in df_hour.columns:
-        df_hour = df_hour[df_hour['weathersit'].isin(selected_weather)]
-
-# Filter Musim (season)
-if 'season' in df_day.columns or 'season' in df_hour.columns:
-    all_season_day = df_day['season'].unique() if 'season' in df_day.columns else []
-    all_season_hour = df_hour['season'].unique() if 'season' in df_hour.columns else []
-    all_season = sorted(list(set(all_season_day) | set(all_season_hour)))
-
-    selected_season = st.sidebar.multiselect(
-        "Pilih Musim (1=Musim Semi, 2=Musim Panas, dst.):",
-        options=all_season,
-        default=all_season
-    )
-    # Terapkan filter
-    if 'season' in df_day.columns:
-        df_day = df_day[df_day['season'].isin(selected_season)]
-    if 'season' in df_hour.columns:
-        df_hour = df_hour[df_hour['season'].isin(selected_season)]
+    if tuple(picked) != (first_day, last_day):
+        # Sampai jam terakhir tanggal akhir (untuk deret per jam)
+        date_range = (pd.Timestamp(picked[0]), pd.Timestamp(picked[1]) + pd.Timedelta(hours=23))
 
 st.sidebar.write("---")
 st.sidebar.write("Gunakan filter di atas untuk menyesuaikan tampilan data.")
+st.sidebar.caption(f"Data per jam: {int(hour_cube['n'].sum()):,} baris ({hour_data.version} batch tambahan)")
+
+# Default: PNG matplotlib. Jika opsi ini dicentang, grafik digambar di
+# browser (Vega-Lite) dari tabel agregat kecil; PNG tetap dipakai untuk
+# grafik yang datanya terlalu besar. Default bisa diubah lewat
+# DASHBOARD_CHART_BACKEND=vega.
+client_charts = st.sidebar.checkbox(
+    "Gambar grafik di browser (Vega-Lite)",
+    value=os.environ.get("DASHBOARD_CHART_BACKEND", "matplotlib") == "vega",
+    key="client_charts",
+)
+
+# Cek file baru di incoming/ secara berkala (detik) tanpa menunggu interaksi
+INGEST_INTERVAL = 60
+
+@st.fragment(run_every=INGEST_INTERVAL)
+def watch_incoming():
+    """Muat batch baru dari incoming/ dan rerun halaman jika ada."""
+    if hour_store.ingest_dropped_files():
+        st.rerun()
+
+with st.sidebar:
+    watch_incoming()
+
+def cached_input(name, build):
+    """Bangun input lewat cache bersama; semua input ikut berganti saat ada append."""
+    return load_input(name, filter_key(active_filters), version, hour_data.version, build)
+
+# Input grafik yang sudah difilter, dihitung malas (hanya saat dibutuhkan
+# oleh bagian yang tampil dan belum ada di cache render)
+section_inputs = SectionInputs(
+    active_filters, read_rows, day_cube, hour_cube, day_stats, load_hour_rolling(version, hour_data.version),
+    cache=cached_input, date_range=date_range
+)
+
+# Grafik dirender sekali per (bagian, filter, versi data, versi store,
+# rentang tanggal) lalu dipakai ulang
+render_cache = get_render_cache()
+render_pool = get_render_pool()
+
+def cache_key(section_id):
+    """
+    Kunci cache render bagian `section_id`. Versi store ikut di kunci, jadi
+    render yang selesai setelah ada batch baru tidak dipakai lagi; rentang
+    tanggal hanya untuk bagian yang memakainya (selain itu None).
+    """
+    view = date_range if 'date_range' in SECTION_INPUTS[section_id] else None
+    return (section_id, filter_key(active_filters), version, hour_data.version, view)
+
+# Grafik yang sedang dirender di pool: (id bagian, kunci cache, placeholder, future, mulai)
+pending_charts = []
+
+def show_chart(section_id):
+    """
+    Tampilkan grafik bagian `section_id`.
+
+    Grafik Vega-Lite langsung dikirim ke browser. PNG yang sudah di-cache
+    langsung ditampilkan; sisanya dikirim ke pool render dan
+    placeholder-nya diisi oleh flush_charts().
+    """
+    input_names = SECTION_INPUTS[section_id]
+    key = cache_key(section_id)
+    started = time.perf_counter()
+    if client_charts:
+        # Diimpor di sini supaya altair baru dimuat saat grafik pertama dibutuhkan
+        from vega_charts import VEGA_SECTIONS
+        if section_id in VEGA_SECTIONS:
+            with trace.span("inputs", section=section_id):
+                inputs = section_inputs.for_section(input_names)
+            chart = VEGA_SECTIONS[section_id](*inputs)
+            if chart is not None:
+                st.altair_chart(chart, use_container_width=True)
+                trace.record("section", time.perf_counter() - started, {'backend': 'vega'}, section=section_id)
+                metrics.incr("chart_backend_total", section=section_id, backend='vega')
+                return
+
+    png = render_cache.get(key)
+    if png is not None:
+        st.image(png, use_container_width=True)
+        trace.record("section", time.perf_counter() - started,
+                     {'cache': 'hit', 'bytes': len(png)}, section=section_id)
+        metrics.incr("render_cache_requests_total", section=section_id, result='hit')
+        return
+
+    placeholder = st.empty()
+    placeholder.caption("Menggambar grafik...")
+    with trace.span("inputs", section=section_id):
+        inputs = section_inputs.for_section(input_names)
+    pending_charts.append((section_id, key, placeholder, render_pool.submit(section_id, inputs), started))
+
+def flush_charts():
+    """Isi placeholder grafik sesuai urutan selesainya render di pool."""
+    jobs = {future: (section_id, key, placeholder, started)
+            for section_id, key, placeholder, future, started in pending_charts}
+    pending_charts.clear()
+    for future in as_completed(jobs):
+        section_id, key, placeholder, started = jobs[future]
+        try:
+            png, render_seconds = future.result()
+        except Exception:
+            # Worker gagal (mis. pool rusak): render ulang di proses ini
+            png, render_seconds = render_section(section_id, section_inputs.for_section(SECTION_INPUTS[section_id]))
+        render_cache.put(key, png)
+        placeholder.image(png, use_container_width=True)
+
+        trace.record("plot", render_seconds, section=section_id)
+        trace.record("section", time.perf_counter() - started,
+                     {'cache': 'miss', 'bytes': len(png)}, section=section_id)
+        metrics.incr("render_cache_requests_total", section=section_id, result='miss')
+        metrics.set("figure_bytes", len(png), section=section_id)
 
 
 # ------------------------------------
 # 3. LAYOUT: TABS
 # ------------------------------------
-tab1, tab2, tab3, tab4 = st.tabs([
-    "Data Overview",
-    "Time Analysis",
-    "Weather Analysis",
-    "User Type Analysis"
-])
+# Hanya isi tab yang dipilih yang dijalankan pada setiap rerun
+TABS = ["Data Overview", "Time Analysis", "Weather Analysis", "User Type Analysis"]
+active_tab = st.radio("Pilih Tab", TABS, horizontal=True, label_visibility="collapsed", key="active_tab")
 
 # ------------------------------------
 # TAB 1: DATA OVERVIEW
 # ------------------------------------
-with tab1:
-    st.title("🚴‍♂️ Bike Sharing Dashboard")
+if active_tab == "Data Overview":
+    df_day_filtered = section_inputs.get('df_day')
+    df_hour_filtered = section_inputs.get('df_hour')
+
     st.markdown("### 1. Data Overview")
     st.write("Menampilkan gambaran umum data harian dan data per jam yang sudah terfilter.")
 
     st.subheader("Data Harian (df_day) - Preview")
-    st.dataframe(df_day.head(10))
+    st.dataframe(df_day_filtered.head(10))
 
     st.subheader("Descriptive Statistics (Day)")
-    st.write(df_day.describe())
+    st.write(describe_filtered("day"))
 
     st.subheader("Data Per Jam (df_hour) - Preview")
-    st.dataframe(df_hour.head(10))
+    st.dataframe(df_hour_filtered.head(10))
 
     st.subheader("Descriptive Statistics (Hour)")
-    st.write(df_hour.describe())
+    st.write(describe_filtered("hour"))
 
 # ------------------------------------
 # TAB 2: TIME ANALYSIS
 # (Menyesuaikan kode Colab: tren harian, tren jam, pola bulanan, jam rush vs non-rush, dll.)
 # ------------------------------------
-with tab2:
+elif active_tab == "Time Analysis":
     st.markdown("### 2. Time-based Analysis")
     st.write("Analisis tren penggunaan sepeda berdasarkan waktu (harian & per jam).")
 
@@ -143,21 +407,8 @@ with tab2:
     # 2a. Tren Peminjaman Sepeda per Hari
     # --------------------------------
     st.subheader("Tren Peminjaman Sepeda per Hari")
-    if 'dteday' in df_day.columns and 'cnt' in df_day.columns:
-        fig, ax = plt.subplots(figsize=(12,5), dpi=100)
-        ax.plot(df_day['dteday'], df_day['cnt'], label="Total Peminjaman", marker='o', linestyle='-')
-        ax.set_xlabel("Tanggal", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Tren Peminjaman Sepeda per Hari", fontsize=12)
-        ax.legend()
-
-        # Format tanggal di sumbu X
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-        plt.xticks(rotation=45)
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-
-        st.pyplot(fig)
+    if 'dteday' in day_columns and 'cnt' in day_columns:
+        show_chart('2a')
     else:
         st.warning("Kolom 'dteday' atau 'cnt' tidak ditemukan di df_day.")
 
@@ -165,35 +416,26 @@ with tab2:
     # 2b. Tren Peminjaman Sepeda per Jam
     # --------------------------------
     st.subheader("Tren Peminjaman Sepeda per Jam")
-    if 'hr' in df_hour.columns and 'cnt' in df_hour.columns:
-        fig, ax = plt.subplots(figsize=(12,5), dpi=100)
-        sns.lineplot(x=df_hour['hr'], y=df_hour['cnt'], marker='o', linestyle='-', label="Total Peminjaman", ax=ax)
-        ax.set_xlabel("Jam", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Tren Peminjaman Sepeda per Jam", fontsize=12)
-        ax.legend()
-        ax.set_xticks(range(0,24,1))
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-
-        st.pyplot(fig)
+    if 'hr' in hour_cube.columns and 'cnt_sum' in hour_cube.columns:
+        show_chart('2b')
     else:
         st.warning("Kolom 'hr' atau 'cnt' tidak ditemukan di df_hour.")
 
+    # --------------------------------
+    # 2f. Tren per Jam dengan Rata-rata Bergerak 24/168 Jam
+    # --------------------------------
+    st.subheader("Tren Peminjaman Sepeda per Jam dengan Rata-rata Bergerak (24 & 168 jam)")
+    if {'dteday', 'hr', 'cnt'} <= set(hour_columns):
+        show_chart('2f')
+    else:
+        st.warning("Kolom 'dteday', 'hr' atau 'cnt' tidak ditemukan di df_hour.")
+
     # --------------------------------
     # 2c. Pola Peminjaman Berdasarkan Bulan (Day)
     # --------------------------------
     st.subheader("Pola Peminjaman Berdasarkan Bulan (Day)")
-    if 'mnth' in df_day.columns and 'cnt' in df_day.columns:
-        fig, ax = plt.subplots(figsize=(10,5), dpi=100)
-        sns.barplot(x='mnth', y='cnt', data=df_day, palette="viridis", errorbar=None, ax=ax)
-        ax.set_xlabel("Bulan", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Jumlah Peminjaman Sepeda Berdasarkan Bulan (Day)", fontsize=12)
-        ax.set_xticks(range(0,12))
-        ax.set_xticklabels(["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], fontsize=9)
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-
-        st.pyplot(fig)
+    if 'mnth' in day_cube.columns and 'cnt_sum' in day_cube.columns:
+        show_chart('2c')
     else:
         st.warning("Kolom 'mnth' atau 'cnt' tidak ditemukan di df_day.")
 
@@ -201,26 +443,8 @@ with tab2:
     # 2d. Pola Peminjaman Berdasarkan Jam (Rush Hour vs Non-Rush Hour) - Hour
     # --------------------------------
     st.subheader("Pola Peminjaman Berdasarkan Rush Hour vs Non-Rush Hour (Hour)")
-    if 'rush_hour' in df_hour.columns and 'cnt' in df_hour.columns:
-        fig, ax = plt.subplots(figsize=(10,5), dpi=100)
-        plot_data = df_hour[['rush_hour','cnt']].copy()
-
-        # Pastikan tipenya string untuk memudahkan sorting/label
-        plot_data['rush_hour'] = plot_data['rush_hour'].astype(str)
-
-        ax2 = sns.barplot(x='rush_hour', y='cnt', data=plot_data, palette="coolwarm")
-        ax2.set_xlabel("Kategori Waktu", fontsize=10)
-        ax2.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax2.set_title("Distribusi Peminjaman Sepeda pada Rush Hour vs Non-Rush Hour (Hour)", fontsize=12)
-
-        # Anotasi
-        for p in ax2.patches:
-            ax2.annotate(f'{int(p.get_height())}', 
-                         (p.get_x() + p.get_width() / 2, p.get_height()),
-                         ha='center', va='bottom', fontsize=9, color='black')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-
-        st.pyplot(fig)
+    if 'rush_hour' in hour_cube.columns and 'cnt_sum' in hour_cube.columns:
+        show_chart('2d')
     else:
         st.warning("Kolom 'rush_hour' atau 'cnt' tidak ditemukan di df_hour.")
 
@@ -228,24 +452,8 @@ with tab2:
     # 2e. Tren Penggunaan Sepeda Selama 2 Tahun (Day)
     # --------------------------------
     st.subheader("Tren Penggunaan Sepeda Harian selama 2 Tahun")
-    if 'dteday' in df_day.columns and 'cnt' in df_day.columns:
-        # Tambahkan kolom rolling_mean(30 hari) jika belum ada
-        if 'rolling_mean' not in df_day.columns:
-            df_day['rolling_mean'] = df_day['cnt'].rolling(window=30).mean()
-
-        fig, ax = plt.subplots(figsize=(12,5), dpi=100)
-
-        sns.lineplot(x=df_day['dteday'], y=df_day['cnt'], marker='o', label="Total Peminjaman", ax=ax, color='blue')
-        sns.lineplot(x=df_day['dteday'], y=df_day['rolling_mean'], label="Rata-rata Bergerak (30 hari)", ax=ax, color='red')
-
-        ax.set_xlabel("Tanggal", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Tren Peminjaman Sepeda Harian dalam 2 Tahun", fontsize=12)
-        plt.xticks(rotation=45)
-        plt.legend()
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-
-        st.pyplot(fig)
+    if 'dteday' in day_columns and 'cnt' in day_columns:
+        show_chart('2e')
     else:
         st.warning("Kolom 'dteday' atau 'cnt' tidak ditemukan di df_day.")
 
@@ -253,7 +461,7 @@ with tab2:
 # TAB 3: WEATHER ANALYSIS
 # (Pengaruh Musim, Kondisi Cuaca, Suhu, dsb. untuk Day & Hour)
 # ------------------------------------
-with tab3:
+elif active_tab == "Weather Analysis":
     st.markdown("### 3. Weather-based Analysis")
     st.write("Analisis pengaruh musim, kondisi cuaca, dan suhu terhadap peminjaman sepeda (Day & Hour).")
 
@@ -261,20 +469,8 @@ with tab3:
     # 3a. Pengaruh Musim terhadap Peminjaman (Day)
     # ------------------------------
     st.subheader("Pengaruh Musim terhadap Peminjaman Sepeda (Day)")
-    if 'season' in df_day.columns and 'cnt' in df_day.columns:
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        sns.boxplot(x=df_day['season'], y=df_day['cnt'], palette="coolwarm", ax=ax)
-        ax.set_xlabel("Musim", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Pengaruh Musim terhadap Peminjaman Sepeda (Day)", fontsize=12)
-
-        # Anotasi rata-rata
-        mean_values = df_day.groupby("season")["cnt"].mean()
-        for i, mean_val in enumerate(mean_values):
-            ax.text(i, mean_val + 500, f'{int(mean_val):,}', ha='center', va='bottom', fontsize=9, color='black')
-
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        st.pyplot(fig)
+    if 'season' in day_columns and 'cnt' in day_columns:
+        show_chart('3a')
     else:
         st.warning("Kolom 'season' atau 'cnt' tidak ditemukan di df_day.")
 
@@ -282,20 +478,8 @@ with tab3:
     # 3b. Pengaruh Musim terhadap Peminjaman (Hour)
     # ------------------------------
     st.subheader("Pengaruh Musim terhadap Peminjaman Sepeda (Hour)")
-    if 'season' in df_hour.columns and 'cnt' in df_hour.columns:
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        sns.boxplot(x=df_hour['season'], y=df_hour['cnt'], palette="coolwarm", ax=ax)
-        ax.set_xlabel("Musim", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Pengaruh Musim terhadap Peminjaman Sepeda (Hour)", fontsize=12)
-
-        # Anotasi rata-rata
-        mean_values = df_hour.groupby("season")["cnt"].mean()
-        for i, mean_val in enumerate(mean_values):
-            ax.text(i, mean_val + 100, f'{int(mean_val):,}', ha='center', va='bottom', fontsize=9, color='black')
-
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        st.pyplot(fig)
+    if 'season' in hour_columns and 'cnt' in hour_columns:
+        show_chart('3b')
     else:
         st.warning("Kolom 'season' atau 'cnt' tidak ditemukan di df_hour.")
 
@@ -303,20 +487,8 @@ with tab3:
     # 3c. Pengaruh Kondisi Cuaca (weathersit) terhadap Peminjaman (Day)
     # ------------------------------
     st.subheader("Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda (Day)")
-    if 'weathersit' in df_day.columns and 'cnt' in df_day.columns:
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        sns.boxplot(x=df_day['weathersit'], y=df_day['cnt'], palette="coolwarm", ax=ax)
-        ax.set_xlabel("Kondisi Cuaca", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda (Day)", fontsize=12)
-
-        # Anotasi rata-rata
-        mean_values = df_day.groupby("weathersit")["cnt"].mean()
-        for i, mean_val in enumerate(mean_values):
-            ax.text(i, mean_val + 100, f'{int(mean_val):,}', ha='center', va='bottom', fontsize=9, color='black')
-
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        st.pyplot(fig)
+    if 'weathersit' in day_columns and 'cnt' in day_columns:
+        show_chart('3c')
     else:
         st.warning("Kolom 'weathersit' atau 'cnt' tidak ditemukan di df_day.")
 
@@ -324,20 +496,8 @@ with tab3:
     # 3d. Pengaruh Kondisi Cuaca (weathersit) terhadap Peminjaman (Hour)
     # ------------------------------
     st.subheader("Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda (Hour)")
-    if 'weathersit' in df_hour.columns and 'cnt' in df_hour.columns:
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        sns.boxplot(x=df_hour['weathersit'], y=df_hour['cnt'], palette="coolwarm", ax=ax)
-        ax.set_xlabel("Kondisi Cuaca", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda (Hour)", fontsize=12)
-
-        # Anotasi rata-rata
-        mean_values = df_hour.groupby("weathersit")["cnt"].mean()
-        for i, mean_val in enumerate(mean_values):
-            ax.text(i, mean_val + 100, f'{int(mean_val):,}', ha='center', va='bottom', fontsize=9, color='black')
-
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        st.pyplot(fig)
+    if 'weathersit' in hour_columns and 'cnt' in hour_columns:
+        show_chart('3d')
     else:
         st.warning("Kolom 'weathersit' atau 'cnt' tidak ditemukan di df_hour.")
 
@@ -345,22 +505,8 @@ with tab3:
     # 3e. Pengaruh Suhu (temp_category) terhadap Peminjaman (Hour)
     # ------------------------------
     st.subheader("Pengaruh Suhu terhadap Peminjaman Sepeda (Hour)")
-    if 'temp_category' in df_hour.columns and 'cnt' in df_hour.columns:
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        # Pastikan urutan kategori suhu: Cold, Mild, Warm, Hot
-        order_cats = ["Cold", "Mild", "Warm", "Hot"]
-        sns.boxplot(x=df_hour['temp_category'], y=df_hour['cnt'], palette="magma", order=order_cats, ax=ax)
-        ax.set_xlabel("Kategori Suhu", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Pengaruh Suhu terhadap Peminjaman Sepeda (Hour)", fontsize=12)
-
-        # Anotasi median
-        median_values = df_hour.groupby("temp_category")["cnt"].median()
-        for i, median_val in enumerate(median_values):
-            ax.text(i, median_val + 50, f'{int(median_val):,}', ha='center', va='bottom', fontsize=9, color='black')
-
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        st.pyplot(fig)
+    if 'temp_category' in hour_columns and 'cnt' in hour_columns:
+        show_chart('3e')
     else:
         st.warning("Kolom 'temp_category' atau 'cnt' tidak ditemukan di df_hour.")
 
@@ -369,30 +515,8 @@ with tab3:
     # ------------------------------
     st.subheader("Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda")
 
-    if 'weathersit' in df_hour.columns and 'cnt' in df_hour.columns:
-        # Agregasi total peminjaman berdasarkan kondisi cuaca
-        weather_comparison = df_hour.groupby('weathersit').agg(
-            total_peminjaman=('cnt', 'sum')
-        ).reset_index()
-
-        # Membuat visualisasi Pengaruh Cuaca
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        sns.barplot(x='weathersit', y='total_peminjaman', data=weather_comparison, palette="coolwarm", ax=ax)
-
-        # Menambahkan label dan judul
-        ax.set_xlabel("Kondisi Cuaca", fontsize=10)
-        ax.set_ylabel("Total Peminjaman", fontsize=10)
-        ax.set_title("Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda", fontsize=12)
-
-        # Menambahkan anotasi jumlah peminjaman di setiap kategori cuaca
-        for i, row in weather_comparison.iterrows():
-            ax.text(i, row.total_peminjaman + 1000, f'{int(row.total_peminjaman):,}',
-                    ha='center', fontsize=9, color='black')
-
-        # Menambahkan grid untuk memperjelas perbedaan jumlah peminjaman
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        
-        st.pyplot(fig)
+    if 'weathersit' in hour_cube.columns and 'cnt_sum' in hour_cube.columns:
+        show_chart('3f')
     else:
         st.warning("Kolom 'weathersit' atau 'cnt' tidak ditemukan di df_hour.")
     
@@ -400,7 +524,7 @@ with tab3:
 # TAB 4: USER TYPE ANALYSIS
 # (Perbandingan casual vs registered, jam sibuk vs non-sibuk, weekday vs weekend, dsb.)
 # ------------------------------------
-with tab4:
+elif active_tab == "User Type Analysis":
     st.markdown("### 4. User Type Analysis")
     st.write("Perbandingan penggunaan oleh **casual** vs. **registered**, serta analisis jam sibuk vs non-sibuk, hari kerja vs akhir pekan.")
 
@@ -408,20 +532,8 @@ with tab4:
     # 4a. Perbandingan Pengguna Casual vs Registered (Day)
     # ------------------------------------------------------
     st.subheader("Perbandingan Pengguna Casual vs Registered (Day)")
-    if 'casual' in df_day.columns and 'registered' in df_day.columns:
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        sns.boxplot(data=df_day[['casual', 'registered']], palette=["skyblue", "salmon"], ax=ax)
-        ax.set_xlabel("Tipe Pengguna", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Perbandingan Pengguna Casual vs Registered (Day)", fontsize=12)
-
-        # Anotasi median
-        median_values = df_day[['casual', 'registered']].median()
-        for i, median_val in enumerate(median_values):
-            ax.text(i, median_val + 100, f'{int(median_val):,}', ha='center', va='bottom', fontsize=9, color='black')
-
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        st.pyplot(fig)
+    if 'casual' in day_columns and 'registered' in day_columns:
+        show_chart('4a')
     else:
         st.warning("Kolom 'casual' atau 'registered' tidak ditemukan di df_day.")
 
@@ -429,20 +541,8 @@ with tab4:
     # 4b. Perbandingan Pengguna Casual vs Registered (Hour)
     # ------------------------------------------------------
     st.subheader("Perbandingan Pengguna Casual vs Registered (Hour)")
-    if 'casual' in df_hour.columns and 'registered' in df_hour.columns:
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        sns.boxplot(data=df_hour[['casual', 'registered']], palette=["skyblue", "salmon"], ax=ax)
-        ax.set_xlabel("Tipe Pengguna", fontsize=10)
-        ax.set_ylabel("Jumlah Peminjaman", fontsize=10)
-        ax.set_title("Perbandingan Pengguna Casual vs Registered (Hour)", fontsize=12)
-
-        # Anotasi median
-        median_values = df_hour[['casual', 'registered']].median()
-        for i, median_val in enumerate(median_values):
-            ax.text(i, median_val + 100, f'{int(median_val):,}', ha='center', va='bottom', fontsize=9, color='black')
-
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        st.pyplot(fig)
+    if 'casual' in hour_columns and 'registered' in hour_columns:
+        show_chart('4b')
     else:
         st.warning("Kolom 'casual' atau 'registered' tidak ditemukan di df_hour.")
 
@@ -450,35 +550,8 @@ with tab4:
     # 4c. Analisis Jam Sibuk (Rush Hour) vs Non-Sibuk (Hour)
     # ------------------------------------------------------
     st.subheader("Analisis Jam Sibuk vs Non-Sibuk (Hour)")
-    if 'hr' in df_hour.columns and 'cnt' in df_hour.columns:
-        # Definisi jam sibuk
-        rush_hours = list(range(6, 10)) + list(range(16, 20))
-        
-        # Buat kolom time_category jika belum ada
-        if 'time_category' not in df_hour.columns:
-            df_hour['time_category'] = df_hour['hr'].apply(
-                lambda x: 'Rush Hour' if x in rush_hours else 'Non-Rush Hour'
-            )
-        
-        # Agregasi jumlah peminjaman
-        rush_hour_comparison = df_hour.groupby('time_category').agg(
-            avg_peminjaman=('cnt','mean'),
-            total_peminjaman=('cnt','sum')
-        ).reset_index()
-
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        sns.barplot(x='time_category', y='avg_peminjaman', data=rush_hour_comparison, palette='coolwarm', ax=ax)
-        ax.set_xlabel("Kategori Waktu", fontsize=10)
-        ax.set_ylabel("Rata-rata Peminjaman", fontsize=10)
-        ax.set_title("Perbandingan Peminjaman Sepeda pada Rush Hour vs Non-Rush Hour", fontsize=12)
-
-        # Anotasi
-        for i, row in rush_hour_comparison.iterrows():
-            ax.text(i, row.avg_peminjaman + 10, f'{int(row.avg_peminjaman):,}', 
-                    ha='center', fontsize=9, color='black')
-
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        st.pyplot(fig)
+    if 'hr' in hour_cube.columns and 'cnt_sum' in hour_cube.columns:
+        show_chart('4c')
     else:
         st.warning("Kolom 'hr' atau 'cnt' tidak ditemukan di df_hour.")
 
@@ -487,67 +560,89 @@ with tab4:
     #     + Pengaruh Rush Hour vs Non-Rush Hour
     # ------------------------------------------------------
     st.subheader("Pengaruh Hari Kerja vs Akhir Pekan terhadap Peminjaman (Hour)")
-    if 'time_category' in df_hour.columns and 'day_type' in df_hour.columns and 'cnt' in df_hour.columns:
-        rush_hour_weekday = df_hour.groupby(['time_category', 'day_type']).agg(
-            avg_peminjaman=('cnt','mean'),
-            total_peminjaman=('cnt','sum')
-        ).reset_index()
-
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        sns.barplot(x='time_category', y='avg_peminjaman', hue='day_type', data=rush_hour_weekday, 
-                    palette=['blue','red'], ax=ax)
-        ax.set_xlabel("Kategori Waktu", fontsize=10)
-        ax.set_ylabel("Rata-rata Peminjaman", fontsize=10)
-        ax.set_title("Pengaruh Hari Kerja dan Akhir Pekan terhadap Peminjaman Sepeda", fontsize=12)
-        
-        # Legenda
-        plt.legend(title="Tipe Hari", labels=["Weekday","Weekend"])
-
-        # Anotasi
-        for p in ax.patches:
-            ax.annotate(f'{int(p.get_height()):,}',
-                        (p.get_x() + p.get_width()/2., p.get_height()),
-                        ha='center', va='bottom', fontsize=9, color='black')
-
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        st.pyplot(fig)
+    if 'hr' in hour_cube.columns and 'day_type' in hour_cube.columns and 'cnt_sum' in hour_cube.columns:
+        show_chart('4d')
     else:
-        st.warning("Kolom 'time_category' atau 'day_type' atau 'cnt' tidak ditemukan di df_hour.")
+        st.warning("Kolom 'hr' atau 'day_type' atau 'cnt' tidak ditemukan di df_hour.")
     # ------------------------------------------------------
     # 4e. Analisis Weekday Weekend
     # ------------------------------------------------------
     st.subheader("Perbandingan Total Peminjaman Sepeda: Weekday vs Weekend")
 
-    if 'day_type' in df_hour.columns and 'cnt' in df_hour.columns:
-        # Agregasi total peminjaman berdasarkan tipe hari
-        weekday_weekend_comparison = df_hour.groupby('day_type').agg(
-            total_peminjaman=('cnt', 'sum'),
-            avg_peminjaman=('cnt', 'mean')
-        ).reset_index()
-
-        # Membuat visualisasi Total Peminjaman
-        fig, ax = plt.subplots(figsize=(8,5), dpi=100)
-        sns.barplot(x='day_type', y='total_peminjaman', data=weekday_weekend_comparison, palette=['blue', 'orange'], ax=ax)
-        
-        # Menambahkan label dan judul
-        ax.set_xlabel("Tipe Hari", fontsize=10)
-        ax.set_ylabel("Total Peminjaman", fontsize=10)
-        ax.set_title("Perbandingan Total Peminjaman Sepeda: Weekday vs Weekend", fontsize=12)
-
-        # Menambahkan anotasi jumlah peminjaman di setiap kategori waktu
-        for i, row in weekday_weekend_comparison.iterrows():
-            ax.text(i, row.total_peminjaman + 2000, f'{int(row.total_peminjaman):,}',
-                    ha='center', fontsize=9, color='black')
-
-        # Menambahkan grid untuk memperjelas perbedaan jumlah peminjaman
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        
-        st.pyplot(fig)
+    if 'day_type' in hour_cube.columns and 'cnt_sum' in hour_cube.columns:
+        show_chart('4e')
     else:
         st.warning("Kolom 'day_type' atau 'cnt' tidak ditemukan di df_hour.")
+# Tunggu grafik yang masih dirender di pool
+flush_charts()
+
+@st.cache_resource
+def start_warmup(version, store_version, _filters, _day_cube, _hour_cube):
+    """
+    Warm-up di thread latar, sekali per versi data & store, setelah tampilan
+    pertama terkirim.
+
+    Hanya menyiapkan input grafik tab lain di cache bersama (load_input)
+    untuk filter default `_filters`, tanpa konteks sesi mana pun. Pustaka
+    grafik & matplotlib disiapkan oleh worker render masing-masing.
+    """
+    inputs = SectionInputs(
+        _filters, read_rows, _day_cube, _hour_cube, load_day_rolling(version, store_version),
+        load_hour_rolling(version, store_version),
+        cache=lambda name, build: load_input(name, filter_key(_filters), version, store_version, build)
+    )
+
+    def warm_up():
+        started = time.perf_counter()
+        for name in ('day_trends', 'hour_trends', 'day_boxes', 'hour_boxes'):
+            inputs.get(name)
+        metrics.set("warmup_seconds", time.perf_counter() - started)
+
+    thread = threading.Thread(target=warm_up, name="dashboard-warmup", daemon=True)
+    thread.start()
+    return thread
+
+# Worker render dijalankan sekarang jika sesi ini memakai grafik PNG
+if not client_charts:
+    render_pool.warm_up()
+
+# Matikan warm-up dengan DASHBOARD_WARMUP=0
+if os.environ.get("DASHBOARD_WARMUP", "1") != "0":
+    start_warmup(version, hour_data.version, filter_options, day_cube, hour_cube)
+
 # ------------------------------------
 # Bagian Bawah Halaman
 # ------------------------------------
+# Statistik cache render (setelah semua grafik ditampilkan)
+cache_stats = render_cache.stats()
+st.sidebar.caption(
+    f"Render cache: {cache_stats['hits']} hit / {cache_stats['misses']} miss, "
+    f"{cache_stats['bytes'] / 1024 / 1024:.1f} MB"
+)
+metrics.set("render_cache_bytes", cache_stats['bytes'])
+metrics.set("render_cache_entries", cache_stats['entries'])
+
+# Memori input terfilter yang dipegang sesi ini pada rerun ini
+session_bytes = sum(
+    int(value.memory_usage(deep=True).sum())
+    for value in section_inputs.built.values() if isinstance(value, pd.DataFrame)
+)
+metrics.set("session_input_bytes", session_bytes)
+trace.finish()
+
+# Ekspor metrik (Prometheus & JSON) paling sering sekali per interval (detik)
+METRICS_EXPORT_INTERVAL = 10
+metrics.export(min_interval=METRICS_EXPORT_INTERVAL)
+
+# Panel debug opsional: span rerun ini & ringkasan latensi semua sesi
+if st.sidebar.checkbox("Tampilkan panel debug", key="debug_panel"):
+    with st.sidebar.expander("Instrumentasi", expanded=True):
+        st.caption(f"Input sesi: {session_bytes / 1024 / 1024:.2f} MB")
+        st.write("Span rerun ini (ms)")
+        st.dataframe(pd.DataFrame(trace.spans).round(1))
+        st.write("Latensi semua sesi (ms)")
+        st.dataframe(pd.DataFrame(metrics.summary()).round(1))
+
 st.write("---")
 st.markdown("""
 **Catatan**:  
@@ -0,0 +1,305 @@
+"""
+Penyimpanan kolumnar (Parquet) untuk dataset dashboard.
+
+CSV per jam (main_data_hour.csv) tetap menjadi sumber data, tetapi
+dikonversi sekali ke Parquet dengan tipe data yang sudah benar: kolom
+kategori disimpan sebagai dictionary-encoded dan 'dteday' sebagai
+timestamp asli. Loader cukup membaca kolom yang dibutuhkan saja. Dataset
+harian, mingguan & bulanan adalah rollup dari data per jam (rollups.py)
+yang disimpan di sampingnya dan dibangun ulang saat CSV per jam berubah.
+
+Dataset Parquet dipartisi per tahun & bulan (folder yr=<n>/mnth=<n>/).
+Filter pada kolom partisi diterapkan pada daftar file sebelum membaca,
+sehingga memilih satu tahun hanya membaca file tahun tersebut; filter
+kolom lain diterapkan saat pemindaian.
+
+Jalankan `python data_store.py` untuk membangun ulang dataset Parquet.
+"""
+import os
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Nama dataset -> file CSV sumber
+CSV_FILES = {
+    "hour": "main_data_hour.csv",
+}
+
+# Dataset rollup yang diturunkan dari data per jam
+ROLLUP_LEVELS = ("day", "week", "month")
+
+# Kolom teks yang disimpan sebagai dictionary-encoded (pandas category),
+# lengkap dengan urutan kategorinya supaya urutan pada grafik konsisten
+CATEGORY_ORDER = {
+    "season": ["Spring", "Summer", "Fall", "Winter"],
+    "day_type": ["Weekday", "Weekend"],
+    "temp_category": ["Cold", "Mild", "Warm", "Hot"],
+    "rush_hour": ["Non-Rush Hour", "Rush Hour"],
+    "data_source": ["day", "hour"],
+}
+
+# Tipe data ringkas untuk kolom numerik: kode kecil -> int8, jumlah
+# peminjaman -> int32 (aman untuk data multi-tahun), pengukuran -> float32
+NUMERIC_DTYPES = {
+    "instant": "int32",
+    "yr": "int8",
+    "mnth": "int8",
+    "hr": "int8",
+    "holiday": "int8",
+    "weekday": "int8",
+    "workingday": "int8",
+    "weathersit": "int8",
+    "season": "int8",
+    "temp": "float32",
+    "hum": "float32",
+    "windspeed": "float32",
+    "casual": "int32",
+    "registered": "int32",
+    "cnt": "int32",
+    "cnt_log": "float32",
+}
+
+# Naikkan jika skema berubah supaya file Parquet lama dibangun ulang
+SCHEMA_VERSION = "4"
+
+# Kolom partisi dataset Parquet (urutan = tingkat folder)
+PARTITION_COLUMNS = ["yr", "mnth"]
+PARTITIONING = ds.partitioning(
+    pa.schema([(col, pa.int8()) for col in PARTITION_COLUMNS]), flavor="hive"
+)
+
+# File penanda versi skema di dalam folder dataset
+VERSION_FILE = "_schema_version"
+
+
+def csv_path(name):
+    """Path file CSV sumber untuk dataset `name` (rollup: CSV per jam)."""
+    return os.path.join(DATA_DIR, CSV_FILES.get(name, CSV_FILES["hour"]))
+
+
+def parquet_path(name):
+    """Path folder dataset Parquet terpartisi untuk `name` ('hour', 'day', 'week', 'month')."""
+    return os.path.join(DATA_DIR, f"main_data_{name}.parquet")
+
+
+def apply_schema(df):
+    """Terapkan skema: 'dteday' ke datetime, teks ke category, angka ke tipe ringkas."""
+    if 'dteday' in df.columns:
+        df['dteday'] = pd.to_datetime(df['dteday'])
+
+    # Kolom yang tipenya sudah benar tidak disentuh, supaya kolom yang
+    # dipetakan dari file bersama (shared_data.py) tidak ikut tersalin
+    for col, dtype in NUMERIC_DTYPES.items():
+        # 'season' numerik hanya ada di data mentah; yang berlabel jadi category
+        if col in df.columns and pd.api.types.is_numeric_dtype(df[col]) and df[col].dtype != dtype:
+            df[col] = df[col].astype(dtype)
+
+    for col, categories in CATEGORY_ORDER.items():
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            # Nilai di luar daftar tetap dipertahankan (ditambahkan di belakang)
+            extra = sorted(set(df[col].dropna().unique()) - set(categories))
+            if list(getattr(df[col].dtype, 'categories', [])) != categories + extra:
+                df[col] = pd.Categorical(df[col], categories=categories + extra)
+
+    return df
+
+
+def write_parquet(df, path):
+    """Tulis `df` ke Parquet beserta penanda versi skema."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = {**(table.schema.metadata or {}), b"schema_version": SCHEMA_VERSION.encode()}
+    pq.write_table(table.replace_schema_metadata(metadata), path)
+
+
+def write_dataset(df, path):
+    """
+    Tulis `df` sebagai dataset Parquet terpartisi per PARTITION_COLUMNS.
+
+    Folder baru ditulis di samping lalu ditukar, sehingga pembaca tidak
+    pernah melihat dataset setengah jadi.
+    """
+    staging = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    for keys, part in df.groupby(PARTITION_COLUMNS, sort=True):
+        folder = os.path.join(staging, *(f"{col}={key}" for col, key in zip(PARTITION_COLUMNS, keys)))
+        os.makedirs(folder)
+        write_parquet(part, os.path.join(folder, "part-0.parquet"))
+    with open(os.path.join(staging, VERSION_FILE), "w") as f:
+        f.write(SCHEMA_VERSION)
+
+    # Tukar folder; dataset lama (folder atau file Parquet tunggal) dihapus
+    retired = f"{path}.old-{os.getpid()}"
+    if os.path.isdir(path):
+        os.rename(path, retired)
+    elif os.path.exists(path):
+        os.remove(path)
+    os.rename(staging, path)
+    shutil.rmtree(retired, ignore_errors=True)
+
+
+def rollup_tables():
+    """Semua tabel rollup {tingkat: DataFrame} dari data per jam."""
+    # Diimpor di sini karena rollups.py sendiri mengimpor modul ini
+    from rollups import build_rollups
+    return build_rollups(read_dataset("hour"))
+
+
+def load_source(name):
+    """DataFrame dataset `name` tanpa Parquet (CSV, atau rollup dari data per jam)."""
+    if name in ROLLUP_LEVELS:
+        return rollup_tables()[name]
+    return apply_schema(pd.read_csv(csv_path(name)))
+
+
+def build_parquet(name):
+    """
+    Bangun dataset Parquet `name` dan kembalikan DataFrame-nya.
+
+    Untuk rollup, semua tingkat (day/week/month) ditulis sekaligus.
+    """
+    if name not in ROLLUP_LEVELS:
+        df = load_source(name)
+        write_dataset(df, parquet_path(name))
+        return df
+
+    tables = rollup_tables()
+    for level, table in tables.items():
+        write_dataset(table, parquet_path(level))
+    return tables[name]
+
+
+def is_stale(name):
+    """True jika dataset belum ada, lebih lama dari CSV sumbernya, atau skemanya usang."""
+    marker = os.path.join(parquet_path(name), VERSION_FILE)
+    if not os.path.exists(marker):
+        return True
+    if os.path.getmtime(marker) < os.path.getmtime(csv_path(name)):
+        return True
+    with open(marker) as f:
+        return f.read().strip() != SCHEMA_VERSION
+
+
+def data_version():
+    """Penanda versi data: berubah setiap kali salah satu CSV sumber berubah."""
+    parts = []
+    for name in sorted(CSV_FILES):
+        stat = os.stat(csv_path(name))
+        parts.append(f"{name}:{stat.st_mtime_ns}:{stat.st_size}")
+    return "|".join(parts)
+
+
+def partition_key(path):
+    """Nilai partisi (yr, mnth) dari path file, untuk mengurutkan file."""
+    parts = dict(
+        segment.split("=", 1) for segment in path.split(os.sep) if "=" in segment
+    )
+    return tuple(int(parts.get(col, -1)) for col in PARTITION_COLUMNS)
+
+
+def open_parquet(root):
+    """Dataset pyarrow dari folder terpartisi `root`, file diurutkan per (yr, mnth)."""
+    files = [
+        os.path.join(folder, filename)
+        for folder, _, filenames in os.walk(root)
+        for filename in filenames if filename.endswith(".parquet")
+    ]
+    files.sort(key=partition_key)
+    return ds.dataset(files, format="parquet", partitioning=PARTITIONING, partition_base_dir=root)
+
+
+def open_dataset(name):
+    """Dataset pyarrow untuk `name`, file diurutkan per (yr, mnth)."""
+    return open_parquet(parquet_path(name))
+
+
+def filter_expression(schema, filters):
+    """Ekspresi pyarrow dari {kolom: daftar nilai}; kolom yang tidak ada diabaikan."""
+    expression = None
+    for col, values in (filters or {}).items():
+        if col not in schema.names:
+            continue
+        # Tipe value set disamakan dengan kolomnya, supaya daftar kosong tidak bertipe null
+        value_type = schema.field(col).type
+        if pa.types.is_dictionary(value_type):
+            value_type = value_type.value_type
+        condition = ds.field(col).isin(pa.array(list(values), type=value_type))
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def filter_frame(df, filters):
+    """Terapkan {kolom: daftar nilai} ke DataFrame (untuk jalur CSV)."""
+    mask = pd.Series(True, index=df.index)
+    for col, values in (filters or {}).items():
+        if col in df.columns:
+            mask &= df[col].isin(list(values))
+    return df[mask].reset_index(drop=True)
+
+
+def read_parquet(root, columns=None, filters=None):
+    """
+    Baca dataset Parquet terpartisi di folder `root` dengan `columns` &
+    `filters`; partisi yang tidak cocok dengan filter yr/mnth tidak dibaca.
+    """
+    dataset = open_parquet(root)
+    table = dataset.to_table(columns=columns, filter=filter_expression(dataset.schema, filters))
+    return apply_schema(table.to_pandas())
+
+
+def read_dataset(name, columns=None, filters=None):
+    """
+    Baca dataset `name`, hanya kolom `columns` (None = semua) dan baris yang
+    lolos `filters` ({kolom: daftar nilai}, None = semua baris).
+
+    Baris dibaca dari file Arrow bersama yang di-memory-map
+    (shared_data.py) jika tersedia; jika tidak, dari Parquet. Di kedua
+    jalur, partisi yang tidak cocok dengan filter yr/mnth dilewati tanpa
+    memeriksa barisnya. Dataset
+    dibangun otomatis dari CSV jika belum ada / sudah usang. Jika folder
+    tidak bisa ditulisi, data dibaca langsung dari CSV (rollup dihitung di
+    memori).
+    """
+    columns = list(columns) if columns is not None else None
+
+    if is_stale(name):
+        try:
+            df = build_parquet(name)
+        except OSError:
+            df = load_source(name)
+        df = filter_frame(df, filters)
+        return df[columns] if columns is not None else df
+
+    # Diimpor di sini karena shared_data.py sendiri mengimpor modul ini
+    from shared_data import select_rows, shared_table
+    shared = shared_table(name)
+    if shared is not None:
+        # split_blocks: kolom tetap menunjuk ke file yang dipetakan (tanpa salinan)
+        return apply_schema(select_rows(shared, columns, filters).to_pandas(split_blocks=True))
+
+    return read_parquet(parquet_path(name), columns, filters)
+
+
+def iter_partitions(name, columns=None):
+    """Baca dataset `name` satu partisi (yr, mnth) per langkah."""
+    if is_stale(name):
+        build_parquet(name)
+    for fragment in open_dataset(name).get_fragments():
+        yield apply_schema(fragment.to_table(columns=columns).to_pandas())
+
+
+if __name__ == "__main__":
+    for dataset in CSV_FILES:
+        build_parquet(dataset)
+    # Satu pemanggilan menulis semua tingkat rollup
+    build_parquet(ROLLUP_LEVELS[0])
+    for dataset in [*CSV_FILES, *ROLLUP_LEVELS]:
+        frame = read_dataset(dataset)
+        print(f"{parquet_path(dataset)}: {len(frame):,} baris, {frame.shape[1]} kolom, "
+              f"{frame.groupby(PARTITION_COLUMNS).ngroups} partisi")
@@ -0,0 +1,122 @@
+"""
+Downsampling deret waktu untuk grafik garis (level of detail).
+
+Deret panjang direduksi menjadi piramida level: setiap level dibangun dari
+level sebelumnya dengan bucket min/max (nilai terendah & tertinggi tiap
+bucket dipertahankan, jadi puncak & lembah tidak hilang). Saat digambar,
+level yang dipilih adalah level paling kasar yang masih punya cukup titik
+untuk rentang tanggal yang terlihat, lalu direduksi ke jumlah titik
+sesuai lebar gambar dengan LTTB (Largest-Triangle-Three-Buckets).
+
+Deret yang sudah cukup pendek (mis. 731 hari) digambar apa adanya.
+"""
+import numpy as np
+import pandas as pd
+
+# Jumlah titik default ≈ lebar figure 12 inci × dpi 100
+DEFAULT_POINTS = 1200
+
+# Rasio jumlah titik antar level piramida
+LEVEL_FACTOR = 4
+
+
+def lttb_indices(x, y, n_out):
+    """Indeks titik terpilih LTTB (`x` numerik & terurut)."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 bucket di antara titik pertama & terakhir
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        # Titik dengan luas segitiga terbesar terhadap titik terpilih sebelumnya
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y, n_buckets):
+    """Indeks nilai minimum & maksimum tiap bucket (urut sesuai posisi)."""
+    n = len(y)
+    if n_buckets * 2 >= n:
+        return np.arange(n)
+
+    bucket = np.arange(n) * n_buckets // n
+    order = np.lexsort((y, bucket))
+    starts = np.searchsorted(bucket[order], np.arange(n_buckets))
+    ends = np.append(starts[1:], n) - 1
+    return np.unique(np.concatenate([order[starts], order[ends]]))
+
+
+class SeriesPyramid:
+    """Piramida level min/max untuk satu deret (x, y)."""
+
+    def __init__(self, x, y, min_points=DEFAULT_POINTS, factor=LEVEL_FACTOR):
+        x = pd.Series(x).to_numpy()
+        y = pd.Series(y).to_numpy(dtype=float)
+
+        # Titik tanpa nilai (mis. awal rata-rata bergerak) tidak digambar
+        keep = ~np.isnan(y)
+        x, y = x[keep], y[keep]
+        if len(x) and not np.all(x[1:] >= x[:-1]):
+            order = np.argsort(x, kind="stable")
+            x, y = x[order], y[order]
+
+        self.levels = [(x, y)]
+        while len(self.levels[-1][0]) > min_points * factor:
+            level_x, level_y = self.levels[-1]
+            picked = minmax_indices(level_y, len(level_x) // (2 * factor))
+            self.levels.append((level_x[picked], level_y[picked]))
+
+    def __len__(self):
+        return len(self.levels[0][0])
+
+    def span(self, level, start=None, end=None):
+        """Posisi [lo, hi) rentang [start, end] di level `level`."""
+        level_x = self.levels[level][0]
+        lo = 0 if start is None else np.searchsorted(level_x, np.asarray(start, dtype=level_x.dtype))
+        hi = len(level_x) if end is None else np.searchsorted(
+            level_x, np.asarray(end, dtype=level_x.dtype), side="right")
+        return lo, hi
+
+    def level(self, points=DEFAULT_POINTS, start=None, end=None):
+        """
+        Level paling kasar yang masih punya >= `points` titik di rentang
+        [start, end] (0 = deret asli). Rentang yang lebih sempit memakai
+        level yang lebih rinci:
+
+        >>> x = np.arange(100_000)
+        >>> pyramid = SeriesPyramid(x, np.sin(x / 50), min_points=500)
+        >>> pyramid.level(500), pyramid.level(500, start=0, end=5_000)
+        (3, 1)
+        """
+        for level in reversed(range(len(self.levels))):
+            lo, hi = self.span(level, start, end)
+            if hi - lo >= points:
+                return level
+        return 0
+
+    def view(self, points=DEFAULT_POINTS, start=None, end=None):
+        """
+        Deret (x, y) untuk rentang [start, end] dengan maksimal `points` titik.
+
+        Dipilih level dari `level`, lalu direduksi dengan LTTB.
+        """
+        level = self.level(points, start, end)
+        lo, hi = self.span(level, start, end)
+        x, y = self.levels[level][0][lo:hi], self.levels[level][1][lo:hi]
+
+        picked = lttb_indices(x.astype(np.int64).astype(float) if x.dtype.kind == "M" else x.astype(float),
+                              y, points)
+        return x[picked], y[picked]
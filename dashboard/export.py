@@ -0,0 +1,257 @@
+"""
+Ekspor laporan statis: semua grafik dashboard untuk banyak kombinasi filter.
+
+Untuk setiap kombinasi filter sidebar (yr × weathersit × season) semua
+bagian di charts.SECTIONS dirender ke PNG, ditambah index.html per
+kombinasi dan satu index.html utama. Hasilnya bisa disajikan dari file
+host statis tanpa sesi Streamlit. Input grafik dibangun dengan
+section_inputs.py seperti di dashboard.py, dengan filter diterapkan saat
+membaca dataset terpartisi. Batch di incoming/ tidak ikut.
+
+Render berjalan paralel di pool proses (render_pool.py). Kombinasi yang
+manifest-nya masih cocok dengan versi data & kode grafik dilewati.
+
+Jalankan:
+    python export.py --out laporan/                         # semua + tiap nilai
+    python export.py --out laporan/ --yr all 0 1 --season all Spring,Summer
+    python export.py --out laporan/ --force                 # render ulang semua
+"""
+import argparse
+import hashlib
+import html
+import itertools
+import json
+import os
+from concurrent.futures import as_completed
+
+from charts import SECTIONS
+from cube import HOUR_DIMENSIONS, build_cube_from_parts
+from data_store import data_version, iter_partitions, read_dataset
+from filters import FILTER_COLUMNS
+from render_cache import RENDER_DPI
+from render_pool import DEFAULT_WORKERS, RenderPool
+from rolling import day_rolling, hour_rolling
+from section_inputs import SectionInputs
+
+# Kode yang menentukan isi gambar; perubahan di sini membuat hasil lama usang
+CHART_MODULES = [
+    "charts.py", "aggregates.py", "box_stats.py", "cube.py", "downsample.py", "render_cache.py",
+    "rolling.py", "rollups.py", "section_inputs.py",
+]
+
+MANIFEST_FILE = "manifest.json"
+
+ALL = "all"
+
+
+def code_version():
+    """Hash isi modul grafik + DPI render."""
+    digest = hashlib.sha256(str(RENDER_DPI).encode())
+    here = os.path.dirname(os.path.abspath(__file__))
+    for filename in CHART_MODULES:
+        with open(os.path.join(here, filename), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def section_title(section_id):
+    """Judul bagian dari baris pertama docstring fungsi grafiknya."""
+    plot, _ = SECTIONS[section_id]
+    return (plot.__doc__ or section_id).strip().splitlines()[0].rstrip(".")
+
+
+# ------------------------------------
+# Kombinasi filter
+# ------------------------------------
+def parse_value(text, options):
+    """Ubah teks argumen jadi nilai opsi (angka untuk kolom numerik)."""
+    for option in options:
+        if str(option) == text:
+            return option
+    raise ValueError(f"Nilai '{text}' tidak ada; pilihan: {', '.join(map(str, options))}")
+
+
+def column_subsets(specs, options):
+    """
+    Daftar subset nilai untuk satu kolom filter.
+
+    `specs` berisi 'all' atau daftar nilai dipisah koma (mis. '1,2');
+    None = 'all' ditambah setiap nilai satu per satu.
+    """
+    if specs is None:
+        return [list(options)] + [[value] for value in options]
+    subsets = []
+    for spec in specs:
+        if spec == ALL:
+            subsets.append(list(options))
+        else:
+            subsets.append([parse_value(text, options) for text in spec.split(",")])
+    return subsets
+
+
+def combinations(subsets_by_column):
+    """Produk kartesius subset per kolom -> daftar {kolom: nilai}."""
+    columns = list(subsets_by_column)
+    for choice in itertools.product(*(subsets_by_column[col] for col in columns)):
+        yield dict(zip(columns, choice))
+
+
+def combination_slug(filters, options):
+    """Nama folder untuk satu kombinasi, mis. 'yr-0_weathersit-all_season-Spring+Summer'."""
+    parts = []
+    for col, values in filters.items():
+        label = ALL if list(values) == list(options[col]) else "+".join(map(str, values))
+        parts.append(f"{col}-{label}")
+    return "_".join(parts)
+
+
+# ------------------------------------
+# Manifest & HTML
+# ------------------------------------
+def is_current(folder, stamp):
+    """True jika hasil di `folder` dibuat dengan `stamp` yang sama dan lengkap."""
+    try:
+        with open(os.path.join(folder, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if {k: manifest.get(k) for k in stamp} != stamp:
+        return False
+    return all(os.path.exists(os.path.join(folder, f"{section_id}.png")) for section_id in SECTIONS)
+
+
+def write_combination_page(folder, filters, stamp):
+    """Tulis index.html & manifest.json untuk satu kombinasi."""
+    filter_text = ", ".join(f"{col}: {', '.join(map(str, values))}" for col, values in filters.items())
+    sections = "\n".join(
+        f'<section><h2>{section_id}. {html.escape(section_title(section_id))}</h2>'
+        f'<img src="{section_id}.png" alt="{section_id}" loading="lazy"></section>'
+        for section_id in SECTIONS
+    )
+    with open(os.path.join(folder, "index.html"), "w", encoding="utf-8") as f:
+        f.write(PAGE_TEMPLATE.format(
+            title="Bike Sharing Dashboard", subtitle=html.escape(filter_text), body=sections
+        ))
+    with open(os.path.join(folder, MANIFEST_FILE), "w") as f:
+        json.dump({**stamp, 'filters': {col: list(map(str, v)) for col, v in filters.items()}}, f, indent=2)
+
+
+def write_index(out_dir):
+    """Tulis index.html utama berisi tautan ke semua kombinasi yang lengkap di `out_dir`."""
+    slugs = sorted(
+        entry for entry in os.listdir(out_dir)
+        if os.path.exists(os.path.join(out_dir, entry, MANIFEST_FILE))
+    )
+    links = "\n".join(f'<li><a href="{slug}/index.html">{html.escape(slug)}</a></li>' for slug in slugs)
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(PAGE_TEMPLATE.format(
+            title="Bike Sharing Dashboard", subtitle=f"{len(slugs)} kombinasi filter",
+            body=f"<ul>{links}</ul>"
+        ))
+
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; max-width: 1100px; margin: 2em auto; }}
+img {{ max-width: 100%; }}
+section {{ margin-bottom: 2em; }}
+</style>
+</head>
+<body>
+<h1>🚴‍♂️ {title}</h1>
+<p>{subtitle}</p>
+{body}
+</body>
+</html>
+"""
+
+
+# ------------------------------------
+# Ekspor
+# ------------------------------------
+def read_rows(name, filters, columns=None):
+    """Kolom `columns` dataset `name` untuk baris yang lolos `filters`."""
+    return read_dataset(name, columns=columns, filters=filters)
+
+
+def export(out_dir, subsets_by_column=None, workers=DEFAULT_WORKERS, force=False, log=print):
+    """
+    Render semua bagian untuk setiap kombinasi filter ke `out_dir`.
+
+    Kembalikan (jumlah kombinasi dirender, jumlah kombinasi dilewati).
+    """
+    day_cube = read_dataset("month")
+    hour_cube = build_cube_from_parts(iter_partitions("hour"), HOUR_DIMENSIONS)
+    day_stats = day_rolling(read_dataset("day", columns=['dteday', 'cnt']))
+    hour_stats = hour_rolling(read_dataset("hour", columns=['dteday', 'hr', 'cnt']))
+    # Data harian adalah rollup data per jam, jadi opsinya cukup dari kubus per jam
+    options = {col: sorted(set(hour_cube[col])) for col in FILTER_COLUMNS if col in hour_cube.columns}
+    subsets_by_column = subsets_by_column or {}
+    subsets = {col: column_subsets(subsets_by_column.get(col), options[col]) for col in options}
+
+    stamp = {'data_version': data_version(), 'code_version': code_version()}
+    os.makedirs(out_dir, exist_ok=True)
+
+    pool = RenderPool(workers)
+    jobs = {}
+    pending = {}
+    skipped = 0
+    try:
+        for filters in combinations(subsets):
+            slug = combination_slug(filters, options)
+            folder = os.path.join(out_dir, slug)
+            if not force and is_current(folder, stamp):
+                skipped += 1
+                continue
+
+            os.makedirs(folder, exist_ok=True)
+            inputs = SectionInputs(filters, read_rows, day_cube, hour_cube, day_stats, hour_stats)
+            for section_id, (_, input_names) in SECTIONS.items():
+                future = pool.submit(section_id, inputs.for_section(input_names))
+                jobs[future] = (slug, section_id)
+            pending[slug] = (filters, len(SECTIONS))
+
+        for future in as_completed(jobs):
+            slug, section_id = jobs[future]
+            png, _ = future.result()
+            with open(os.path.join(out_dir, slug, f"{section_id}.png"), "wb") as f:
+                f.write(png)
+
+            filters, remaining = pending[slug]
+            pending[slug] = (filters, remaining - 1)
+            if remaining == 1:
+                # Manifest ditulis terakhir: kombinasi dianggap lengkap setelah ini
+                write_combination_page(os.path.join(out_dir, slug), filters, stamp)
+                log(f"{slug}: selesai")
+    finally:
+        pool.shutdown()
+
+    write_index(out_dir)
+    return len(pending), skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor grafik dashboard ke HTML/PNG statis.")
+    parser.add_argument("--out", required=True, help="folder hasil")
+    for col in FILTER_COLUMNS:
+        parser.add_argument(
+            f"--{col}", nargs="+", default=None,
+            help=f"subset nilai {col}: 'all' atau daftar dipisah koma "
+                 f"(default: all + setiap nilai)"
+        )
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"jumlah proses render (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--force", action="store_true", help="render ulang walaupun hasil masih baru")
+    args = parser.parse_args(argv)
+
+    subsets = {col: getattr(args, col) for col in FILTER_COLUMNS}
+    rendered, skipped = export(args.out, subsets, workers=args.workers, force=args.force)
+    print(f"{rendered} kombinasi dirender, {skipped} dilewati; buka {os.path.join(args.out, 'index.html')}")
+
+
+if __name__ == "__main__":
+    main()
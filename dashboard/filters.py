@@ -0,0 +1,78 @@
+"""
+Indeks bitmap untuk filter sidebar pada baris yang dipegang di memori.
+
+Baris dasar difilter saat membaca dataset Parquet (data_store.py); indeks
+ini dipakai untuk baris per jam tambahan dari incoming/ (ingest.py).
+
+Untuk setiap kolom filter disiapkan satu bitmap (bit per baris, dipadatkan
+dengan np.packbits) per nilai unik. Pilihan di sidebar digabung dengan
+OR di dalam satu kolom dan AND antar kolom, sehingga setiap rerun hanya
+menghasilkan satu mask baris tanpa salinan DataFrame di tiap langkah.
+Menambah dimensi filter baru cukup dengan menambah kolomnya ke indeks.
+"""
+import numpy as np
+import pandas as pd
+
+# Kolom yang bisa difilter dari sidebar
+FILTER_COLUMNS = ['yr', 'weathersit', 'season']
+
+
+def build_index(df, columns=FILTER_COLUMNS):
+    """Bangun indeks {kolom: {nilai: bitmap}} untuk `df`."""
+    index = {'n_rows': len(df), 'bitmaps': {}}
+    for col in columns:
+        if col not in df.columns:
+            continue
+        codes, uniques = pd.factorize(df[col], sort=True)
+        index['bitmaps'][col] = {
+            value.item() if isinstance(value, np.generic) else value: np.packbits(codes == i)
+            for i, value in enumerate(uniques)
+        }
+    return index
+
+
+def row_mask(index, selections):
+    """
+    Mask boolean baris yang lolos semua filter.
+
+    `selections` berupa {kolom: daftar nilai terpilih}; kolom yang tidak
+    diindeks diabaikan.
+    """
+    n_bytes = (index['n_rows'] + 7) // 8
+    combined = np.full(n_bytes, 0xFF, dtype=np.uint8)
+
+    for col, values in selections.items():
+        bitmaps = index['bitmaps'].get(col)
+        if bitmaps is None:
+            continue
+        selected = np.zeros(n_bytes, dtype=np.uint8)
+        for value in values:
+            if value in bitmaps:
+                selected |= bitmaps[value]
+        combined &= selected
+
+    return np.unpackbits(combined, count=index['n_rows']).astype(bool)
+
+
+def extend_index(index, df):
+    """
+    Indeks baru = `index` ditambah baris-baris `df` (ditambahkan di akhir).
+
+    Bitmap lama hanya di-unpack & disambung, tanpa memindai ulang baris lama.
+    """
+    n_old = index['n_rows']
+    n_new = n_old + len(df)
+    extended = {'n_rows': n_new, 'bitmaps': {}}
+
+    for col, bitmaps in index['bitmaps'].items():
+        values = df[col] if col in df.columns else pd.Series([None] * len(df))
+        new_values = set(values.dropna().unique()) - set(bitmaps)
+        columns = {**bitmaps, **{v.item() if isinstance(v, np.generic) else v: None for v in new_values}}
+        extended['bitmaps'][col] = {}
+        for value, bitmap in columns.items():
+            old_bits = (np.unpackbits(bitmap, count=n_old) if bitmap is not None
+                        else np.zeros(n_old, dtype=np.uint8))
+            new_bits = (values == value).to_numpy(dtype=np.uint8)
+            extended['bitmaps'][col][value] = np.packbits(np.concatenate([old_bits, new_bits]))
+
+    return extended
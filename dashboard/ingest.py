@@ -0,0 +1,182 @@
+"""
+Penambahan (append) data per jam secara langsung tanpa memuat ulang semuanya.
+
+LiveDataset menyimpan frame per jam beserta indeks bitmap filter dan kubus
+agregatnya. Batch baru (dari pemanggilan `append` atau file CSV yang
+diletakkan di folder incoming/) dibersihkan dengan parameter cleaning yang
+sama seperti pipeline.py, lalu hanya menambah baris di akhir: bitmap
+disambung dan kubus batch digabung ke kubus lama, sehingga biaya per
+batch sebanding dengan ukuran batch, bukan ukuran seluruh data.
+
+Setiap append menerbitkan satu Snapshot baru (frame, indeks, kubus, versi)
+dalam satu assignment; pembaca di thread/sesi lain cukup mengambil
+`store.snapshot` sekali, sehingga frame & indeks bitmap selalu cocok.
+
+Data dasar boleh tetap di disk (dataset Parquet terpartisi): cukup berikan
+kubusnya sebagai `base_cube`, dan `frame` hanya berisi baris tambahan.
+
+File di incoming/ tidak dipindahkan; folder ini berfungsi sebagai log
+append yang dibaca ulang saat proses dashboard dimulai kembali. Hanya file
+*.csv yang dibaca, jadi penulis file harus menulis ke *.tmp lalu
+me-rename-nya menjadi *.csv agar file setengah jadi tidak pernah terbaca.
+Jam (dteday, hr) yang sudah ada di data dibuang dari batch, sehingga file
+yang dibaca ulang (atau ditulis ulang) tidak menghitung baris dua kali.
+"""
+import glob
+import os
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from cube import build_cube, merge_cubes
+from data_store import DATA_DIR, apply_schema
+from filters import FILTER_COLUMNS, build_index, extend_index
+from pipeline import add_features, clean, load_cleaning_params
+
+INCOMING_DIR = os.path.join(DATA_DIR, "incoming")
+
+# Keadaan store yang konsisten: baris tambahan, indeks bitmap-nya, kubus & versi
+Snapshot = namedtuple('Snapshot', ['frame', 'index', 'cube', 'version'])
+
+
+def hour_keys(df):
+    """Kunci setiap jam (dteday, hr) sebagai int64: hari sejak epoch * 24 + jam."""
+    return df['dteday'].to_numpy('datetime64[D]').astype('int64') * 24 + df['hr'].to_numpy('int64')
+
+
+def prepare_rows(rows, like, next_instant=None, params=None, existing_keys=None):
+    """
+    Samakan kolom & tipe batch `rows` dengan frame `like`.
+
+    Batch boleh berformat data mentah (hour.csv) atau sudah berfitur
+    (main_data_hour.csv). Anomali hum/windspeed ditangani dengan `params`
+    (pipeline.clean; default: parameter run pipeline terakhir) dan kolom
+    turunan yang belum ada akan dihitung. Nomor 'instant' baru dimulai dari
+    `next_instant` (default: lanjutan dari `like`); batch yang nomornya
+    bentrok dengan baris lama atau ganda dinomori ulang. Baris yang jamnya
+    sudah ada di `existing_keys` (lihat hour_keys) atau muncul dua kali di
+    batch dibuang sebelum penomoran.
+    """
+    if params is None:
+        params = load_cleaning_params('hour')
+    rows = clean(pd.DataFrame(rows), params)
+    if 'rush_hour' not in rows.columns:
+        rows = add_features(rows, 'hour')
+    rows = apply_schema(rows.reset_index(drop=True))
+    if existing_keys is not None:
+        keys = hour_keys(rows)
+        fresh = ~np.isin(keys, existing_keys) & ~pd.Series(keys).duplicated().to_numpy()
+        rows = rows[fresh].reset_index(drop=True)
+
+    if 'instant' in like.columns:
+        if next_instant is None:
+            next_instant = int(like['instant'].max()) + 1 if len(like) else 1
+        # Nomor dari batch dipakai hanya jika semuanya baru & unik
+        if ('instant' not in rows.columns or (rows['instant'] < next_instant).any()
+                or rows['instant'].duplicated().any()):
+            rows['instant'] = np.arange(next_instant, next_instant + len(rows))
+
+    missing = [col for col in like.columns if col not in rows.columns]
+    if missing:
+        raise ValueError(f"Kolom tidak ditemukan di batch: {missing}")
+
+    rows = rows[list(like.columns)]
+    for col in like.columns:
+        if rows[col].dtype != like[col].dtype:
+            rows[col] = rows[col].astype(like[col].dtype)
+    return rows
+
+
+class LiveDataset:
+    """Frame per jam + indeks filter + kubus agregat yang bisa di-append."""
+
+    def __init__(self, frame, cube_dimensions, index_columns=FILTER_COLUMNS,
+                 base_cube=None, next_instant=None, base_keys=None):
+        self.cube_dimensions = cube_dimensions
+        cube = build_cube(frame, cube_dimensions)
+        if base_cube is not None:
+            cube = merge_cubes(base_cube, cube) if len(frame) else base_cube
+        self.snapshot = Snapshot(frame, build_index(frame, index_columns), cube, 0)
+        self.next_instant = next_instant
+        # Jam yang sudah ada (data dasar di disk + baris tambahan)
+        self.known_hours = np.concatenate([
+            np.asarray(base_keys if base_keys is not None else [], dtype='int64'), hour_keys(frame)
+        ])
+        self.ingested_files = set()
+        self.listeners = []
+        self._lock = threading.RLock()
+
+    # Akses satu bagian snapshot terbaru; pembaca yang butuh beberapa
+    # bagian sekaligus (mis. frame & indeks) mengambil `snapshot` sekali
+    @property
+    def frame(self):
+        return self.snapshot.frame
+
+    @property
+    def index(self):
+        return self.snapshot.index
+
+    @property
+    def cube(self):
+        return self.snapshot.cube
+
+    @property
+    def version(self):
+        return self.snapshot.version
+
+    def on_append(self, callback):
+        """Daftarkan `callback(batch)` yang dipanggil setiap ada batch baru."""
+        self.listeners.append(callback)
+
+    def append(self, rows):
+        """Tambahkan batch `rows`; kembalikan batch yang sudah dinormalisasi."""
+        with self._lock:
+            old = self.snapshot
+            batch = prepare_rows(rows, old.frame, self.next_instant, existing_keys=self.known_hours)
+            if batch.empty:
+                return batch
+            if self.next_instant is not None and 'instant' in batch.columns:
+                self.next_instant = max(self.next_instant, int(batch['instant'].max()) + 1)
+            self.known_hours = np.concatenate([self.known_hours, hour_keys(batch)])
+            self.snapshot = Snapshot(
+                pd.concat([old.frame, batch], ignore_index=True),
+                extend_index(old.index, batch),
+                merge_cubes(old.cube, build_cube(batch, self.cube_dimensions)),
+                old.version + 1,
+            )
+            for callback in self.listeners:
+                callback(batch)
+        return batch
+
+    def ingest_dropped_files(self, folder=INCOMING_DIR):
+        """
+        Append semua file CSV baru/berubah di `folder`; kembalikan daftar
+        batch-nya. File yang dibaca ulang hanya menambah jam yang belum ada.
+        """
+        batches = []
+        with self._lock:
+            for path in sorted(glob.glob(os.path.join(folder, "*.csv"))):
+                stat = os.stat(path)
+                file_id = (os.path.basename(path), stat.st_mtime_ns, stat.st_size)
+                if file_id in self.ingested_files:
+                    continue
+                batch = self.append(pd.read_csv(path))
+                self.ingested_files.add(file_id)
+                if not batch.empty:
+                    batches.append(batch)
+        return batches
+
+
+def batch_matches(filters, batch):
+    """
+    True jika ada baris `batch` yang lolos filter `filters`.
+
+    `filters` berupa tuple ((kolom, (nilai, ...)), ...) seperti kunci cache.
+    """
+    mask = np.ones(len(batch), dtype=bool)
+    for col, values in filters:
+        if col in batch.columns:
+            mask &= batch[col].isin(values).to_numpy()
+    return bool(mask.any())
@@ -0,0 +1,216 @@
+"""
+Instrumentasi jalur utama dashboard: span waktu, counter & gauge.
+
+Satu objek Metrics dipakai bersama oleh semua sesi (st.cache_resource di
+dashboard.py) dan mengumpulkan histogram latensi per span (load, filter,
+tiap bagian grafik, rerun), counter hit/miss cache render, serta ukuran
+gambar & input sesi. Setiap rerun mencatat span-nya sendiri di RunTrace
+untuk panel debug di sidebar.
+
+Metrik bisa diekspor sebagai teks Prometheus (metrics.prom) dan JSON
+(metrics.json) ke folder METRICS_DIR.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+METRICS_DIR = os.environ.get(
+    "DASHBOARD_METRICS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "metrics")
+)
+
+# Batas atas bucket histogram latensi (detik)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Jumlah sampel terakhir per histogram untuk estimasi p50/p95 di panel debug
+RECENT_SAMPLES = 500
+
+PREFIX = "dashboard_"
+
+
+def label_key(labels):
+    """Ubah dict label menjadi tuple terurut yang bisa di-hash."""
+    return tuple(sorted(labels.items()))
+
+
+def format_labels(key, extra=()):
+    """Tulis label dalam format Prometheus: {a="1",b="2"}."""
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+class Histogram:
+    """Histogram kumulatif + sampel terakhir untuk kuantil."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, value):
+        """Catat satu nilai."""
+        self.counts[int(np.searchsorted(self.buckets, value))] += 1
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def quantile(self, q):
+        """Kuantil `q` dari sampel terakhir (None jika belum ada sampel)."""
+        if not self.recent:
+            return None
+        return float(np.quantile(np.fromiter(self.recent, float), q))
+
+    def cumulative(self):
+        """Pasangan (batas atas, jumlah kumulatif) termasuk +Inf."""
+        return list(zip([*self.buckets, float("inf")], np.cumsum(self.counts).tolist()))
+
+
+class Metrics:
+    """Kumpulan histogram, counter & gauge yang thread-safe."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.histograms = {}
+        self.counters = {}
+        self.gauges = {}
+        self.last_export = 0.0
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+
+    def observe(self, name, value, **labels):
+        """Catat `value` ke histogram `name`."""
+        with self._lock:
+            hist = self.histograms.setdefault((name, label_key(labels)), Histogram(self.buckets))
+            hist.observe(value)
+
+    def incr(self, name, amount=1, **labels):
+        """Tambah counter `name`."""
+        key = (name, label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set(self, name, value, **labels):
+        """Set gauge `name`."""
+        with self._lock:
+            self.gauges[(name, label_key(labels))] = value
+
+    def summary(self):
+        """Ringkasan histogram: count, rata-rata, p50 & p95 per (nama, label)."""
+        with self._lock:
+            rows = []
+            for (name, key), hist in sorted(self.histograms.items()):
+                rows.append({
+                    'metric': name,
+                    **dict(key),
+                    'count': hist.count,
+                    'mean_ms': 1000 * hist.sum / hist.count,
+                    'p50_ms': 1000 * hist.quantile(0.5),
+                    'p95_ms': 1000 * hist.quantile(0.95),
+                })
+            return rows
+
+    def to_json(self):
+        """Semua metrik sebagai dict yang bisa di-serialisasi ke JSON."""
+        with self._lock:
+            return {
+                'histograms': [
+                    {'name': name, 'labels': dict(key), 'count': hist.count, 'sum': hist.sum,
+                     'buckets': {str(le): n for le, n in hist.cumulative()},
+                     'p50': hist.quantile(0.5), 'p95': hist.quantile(0.95)}
+                    for (name, key), hist in sorted(self.histograms.items())
+                ],
+                'counters': [{'name': name, 'labels': dict(key), 'value': value}
+                             for (name, key), value in sorted(self.counters.items())],
+                'gauges': [{'name': name, 'labels': dict(key), 'value': value}
+                           for (name, key), value in sorted(self.gauges.items())],
+            }
+
+    def to_prometheus(self):
+        """Semua metrik dalam format teks Prometheus."""
+        lines = []
+        with self._lock:
+            for kind, items in (('counter', self.counters), ('gauge', self.gauges)):
+                for name in sorted({name for name, _ in items}):
+                    lines.append(f"# TYPE {PREFIX}{name} {kind}")
+                    for (n, key), value in sorted(items.items()):
+                        if n == name:
+                            lines.append(f"{PREFIX}{name}{format_labels(key)} {value}")
+
+            for name in sorted({name for name, _ in self.histograms}):
+                lines.append(f"# TYPE {PREFIX}{name} histogram")
+                for (n, key), hist in sorted(self.histograms.items()):
+                    if n != name:
+                        continue
+                    for le, count in hist.cumulative():
+                        bound = "+Inf" if le == float("inf") else repr(le)
+                        lines.append(f"{PREFIX}{name}_bucket{format_labels(key, [('le', bound)])} {count}")
+                    lines.append(f"{PREFIX}{name}_sum{format_labels(key)} {hist.sum}")
+                    lines.append(f"{PREFIX}{name}_count{format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory=METRICS_DIR, min_interval=0.0):
+        """
+        Tulis metrics.prom & metrics.json ke `directory`.
+
+        Dilewati jika ekspor terakhir kurang dari `min_interval` detik lalu;
+        kembalikan True jika file ditulis.
+        """
+        with self._export_lock:
+            now = time.time()
+            if now - self.last_export < min_interval:
+                return False
+            self.last_export = now
+
+            os.makedirs(directory, exist_ok=True)
+            for filename, content in (("metrics.prom", self.to_prometheus()),
+                                      ("metrics.json", json.dumps(self.to_json(), indent=2))):
+                # Tulis ke file sementara lalu rename agar pembaca tidak melihat file setengah jadi
+                target = os.path.join(directory, filename)
+                with open(target + ".tmp", "w") as f:
+                    f.write(content)
+                os.replace(target + ".tmp", target)
+            return True
+
+
+class RunTrace:
+    """Daftar span satu rerun; setiap span juga dicatat ke `metrics`."""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.spans = []
+        self.started = time.perf_counter()
+
+    def finish(self, name="rerun"):
+        """Catat durasi sejak RunTrace dibuat sebagai span `name`; kembalikan detik."""
+        elapsed = time.perf_counter() - self.started
+        self.metrics.observe("span_seconds", elapsed, span=name)
+        self.spans.append({'span': name, 'ms': 1000 * elapsed})
+        return elapsed
+
+    @contextmanager
+    def span(self, name, **labels):
+        """
+        Ukur durasi blok sebagai histogram 'span_seconds'.
+
+        Blok boleh mengisi dict yang di-yield dengan info tambahan (mis.
+        status cache atau ukuran gambar) untuk ditampilkan di panel debug.
+        """
+        info = {}
+        start = time.perf_counter()
+        try:
+            yield info
+        finally:
+            self.record(name, time.perf_counter() - start, info, **labels)
+
+    def record(self, name, seconds, info=None, **labels):
+        """Catat span yang durasinya diukur di tempat lain (mis. di worker)."""
+        self.metrics.observe("span_seconds", seconds, span=name, **labels)
+        self.spans.append({'span': name, **labels, 'ms': 1000 * seconds, **(info or {})})
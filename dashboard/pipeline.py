@@ -0,0 +1,236 @@
+"""
+Pipeline ETL: data mentah (data/hour.csv) -> data bersih -> fitur -> data dashboard.
+
+Langkah-langkahnya sama dengan notebook (penanganan anomali hum/windspeed,
+hapus 'atemp', label musim, rush_hour, day_type, temp_category, cnt_log,
+data_source), tetapi semuanya vektor (tanpa apply/lambda) dan inkremental:
+data mentah dibagi per bulan (yyyy-mm), setiap partisi diberi hash isi, dan
+hanya partisi yang baru/berubah yang diproses ulang. Hasil per partisi
+disimpan di data/.pipeline/ sebagai Parquet dengan tipe data ringkas.
+Data harian/mingguan/bulanan dashboard adalah rollup dari hasil per jam
+(rollups.py) dan dibangun ulang setiap kali data per jam berubah.
+
+Jalankan:
+    python pipeline.py            # proses inkremental
+    python pipeline.py --full     # proses ulang semua partisi
+"""
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_store import (
+    CSV_FILES, DATA_DIR, ROLLUP_LEVELS, apply_schema, build_parquet, parquet_path, write_dataset,
+    write_parquet,
+)
+
+RAW_DIR = os.path.join(os.path.dirname(DATA_DIR), "data")
+CACHE_DIR = os.path.join(RAW_DIR, ".pipeline")
+MANIFEST_PATH = os.path.join(CACHE_DIR, "manifest.json")
+
+# Batas persentase anomali (nilai 0): di bawah ini baris dihapus,
+# di atasnya nilai 0 diganti median
+ANOMALY_THRESHOLD = 5
+ANOMALY_FEATURES = ["hum", "windspeed"]
+
+SEASON_LABELS = {1: 'Spring', 2: 'Summer', 3: 'Fall', 4: 'Winter'}
+TEMP_BINS = [0, 0.3, 0.6, 0.9, 1.0]
+TEMP_LABELS = ['Cold', 'Mild', 'Warm', 'Hot']
+
+
+# ------------------------------------
+# Langkah cleaning & feature engineering
+# ------------------------------------
+def cleaning_params(raw):
+    """
+    Tentukan penanganan anomali untuk seluruh dataset.
+
+    Hasil: {fitur: None (hapus baris bernilai 0) atau median pengganti}.
+    Dihitung dari data lengkap agar hasilnya sama dengan notebook.
+    """
+    params = {}
+    df = raw
+    for feature in ANOMALY_FEATURES:
+        anomaly_percentage = (df[feature] == 0.00).mean() * 100
+        if anomaly_percentage < ANOMALY_THRESHOLD:
+            params[feature] = None
+            df = df[df[feature] != 0.00]
+        else:
+            params[feature] = float(df[feature].median())
+    return params
+
+
+def load_cleaning_params(dataset):
+    """
+    Parameter cleaning yang dipakai run terakhir untuk `dataset` (dari
+    manifest), atau dihitung dari data mentah jika belum ada.
+    """
+    params = load_manifest().get(dataset, {}).get('params')
+    if params is None:
+        params = cleaning_params(pd.read_csv(os.path.join(RAW_DIR, f"{dataset}.csv")))
+    return params
+
+
+def clean(df, params):
+    """Tangani anomali hum/windspeed dan hapus kolom 'atemp'."""
+    for feature, median in params.items():
+        if median is None:
+            df = df[df[feature] != 0.00]
+        else:
+            df = df.assign(**{feature: df[feature].replace(0.00, median)})
+    return df.drop(columns=['atemp'], errors='ignore')
+
+
+def add_features(df, dataset):
+    """Tambahkan kolom turunan secara vektor."""
+    df = df.copy()
+    df['season'] = df['season'].map(SEASON_LABELS)
+    if 'hr' in df.columns:
+        df['rush_hour'] = np.where(
+            df['hr'].between(7, 9) | df['hr'].between(16, 19), 'Rush Hour', 'Non-Rush Hour'
+        )
+    df['day_type'] = np.where(df['weekday'].isin([0, 6]), 'Weekend', 'Weekday')
+    df['temp_category'] = pd.cut(df['temp'], bins=TEMP_BINS, labels=TEMP_LABELS)
+    df['cnt_log'] = np.log1p(df['cnt'])
+    df['data_source'] = dataset
+    return df
+
+
+# ------------------------------------
+# Partisi & hash isi
+# ------------------------------------
+def content_hash(df, extra=""):
+    """Hash sha256 dari isi DataFrame (tanpa index) + teks tambahan."""
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    digest.update(extra.encode())
+    return digest.hexdigest()
+
+
+def file_hash(path):
+    """Hash sha256 isi file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest():
+    """Baca manifest hash partisi (kosong jika belum ada)."""
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest):
+    """Simpan manifest hash partisi."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def partition_path(dataset, key):
+    """Path Parquet hasil untuk partisi `key` (yyyy-mm)."""
+    return os.path.join(CACHE_DIR, dataset, f"{key}.parquet")
+
+
+def run_dataset(dataset, manifest, full=False):
+    """
+    Proses satu dataset (kunci CSV_FILES) secara inkremental.
+
+    Mengembalikan jumlah partisi yang diproses ulang (0 = tidak ada perubahan).
+    """
+    raw_path = os.path.join(RAW_DIR, f"{dataset}.csv")
+    state = manifest.setdefault(dataset, {'partitions': {}})
+    raw_digest = file_hash(raw_path)
+    outputs_exist = os.path.exists(os.path.join(DATA_DIR, CSV_FILES[dataset]))
+    if not full and outputs_exist and state.get('raw_hash') == raw_digest:
+        return 0
+
+    raw = pd.read_csv(raw_path)
+    params = cleaning_params(raw)
+    params_text = json.dumps(params, sort_keys=True)
+
+    # Partisi per bulan berdasarkan 'dteday'
+    keys = raw['dteday'].str.slice(0, 7)
+    os.makedirs(os.path.join(CACHE_DIR, dataset), exist_ok=True)
+
+    processed = 0
+    partitions = {}
+    for key, part in raw.groupby(keys, sort=True):
+        digest = content_hash(part, params_text)
+        partitions[key] = digest
+        target = partition_path(dataset, key)
+        if not full and state['partitions'].get(key) == digest and os.path.exists(target):
+            continue
+        featured = add_features(clean(part, params), dataset)
+        write_parquet(apply_schema(featured), target)
+        processed += 1
+
+    # Hapus partisi yang sudah tidak ada di data mentah
+    for key in set(state['partitions']) - set(partitions):
+        if os.path.exists(partition_path(dataset, key)):
+            os.remove(partition_path(dataset, key))
+            processed += 1
+
+    if processed or not outputs_exist:
+        write_outputs(dataset, sorted(partitions))
+
+    state['partitions'] = partitions
+    state['raw_hash'] = raw_digest
+    # Dipakai ulang untuk batch baru di dashboard (ingest.py)
+    state['params'] = params
+    return processed
+
+
+def csv_cnt_log(cnt, csv_path):
+    """
+    cnt_log presisi penuh (float64) untuk CSV; Parquet tetap float32.
+
+    Nilai yang sudah ada di CSV lama (per nilai cnt) dipakai apa adanya,
+    jadi baris yang tidak berubah ditulis ulang dengan bytes yang sama.
+    """
+    values = np.log1p(cnt.astype('float64'))
+    if not os.path.exists(csv_path):
+        return values
+    old = pd.read_csv(csv_path, usecols=['cnt', 'cnt_log'], float_precision='round_trip')
+    known = old.drop_duplicates('cnt').set_index('cnt')['cnt_log']
+    return cnt.map(known).astype('float64').fillna(values)
+
+
+def write_outputs(dataset, keys):
+    """Gabungkan semua partisi menjadi CSV & Parquet untuk dashboard."""
+    frames = [pd.read_parquet(partition_path(dataset, key)) for key in keys]
+    df = apply_schema(pd.concat(frames, ignore_index=True))
+
+    out = df.copy()
+    out['dteday'] = out['dteday'].dt.strftime('%Y-%m-%d')
+    csv_path = os.path.join(DATA_DIR, CSV_FILES[dataset])
+    out['cnt_log'] = csv_cnt_log(out['cnt'], csv_path)
+    out.to_csv(csv_path, index=False)
+    # Parquet ditulis setelah CSV sehingga data_store menganggapnya terbaru
+    write_dataset(df, parquet_path(dataset))
+    if dataset == "hour":
+        # Satu pemanggilan menulis semua tingkat rollup
+        build_parquet(ROLLUP_LEVELS[0])
+
+
+def run(full=False):
+    """Jalankan pipeline untuk semua dataset; kembalikan {dataset: partisi diproses}."""
+    manifest = load_manifest()
+    result = {dataset: run_dataset(dataset, manifest, full=full) for dataset in CSV_FILES}
+    save_manifest(manifest)
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pipeline ETL data bike sharing.")
+    parser.add_argument("--full", action="store_true", help="proses ulang semua partisi")
+    args = parser.parse_args()
+
+    for dataset, processed in run(full=args.full).items():
+        print(f"{dataset}: {processed} partisi diproses ulang")
@@ -0,0 +1,110 @@
+"""
+Cache hasil render grafik (PNG) dengan batas ukuran total & eviksi LRU.
+
+Kunci cache berupa (id bagian, filter sidebar, versi data, versi store
+baris tambahan, rentang tanggal grafik tren harian). Satu objek
+cache dipakai bersama oleh semua sesi (lihat st.cache_resource di
+dashboard.py), sehingga grafik dengan filter yang sama cukup dirender
+sekali. Counter hit/miss disediakan untuk pemantauan.
+"""
+import io
+import threading
+from collections import OrderedDict
+
+# Batas default total ukuran gambar yang disimpan (64 MB)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Resolusi gambar, sama dengan default st.pyplot
+RENDER_DPI = 200
+
+
+def figure_to_png(fig, dpi=RENDER_DPI):
+    """Render figure ke bytes PNG lalu tutup figure-nya."""
+    # Diimpor di sini agar RenderCache bisa dipakai tanpa matplotlib (mis. api.py)
+    import matplotlib.pyplot as plt
+
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+def filter_key(filters):
+    """Ubah {kolom: daftar nilai} menjadi tuple yang bisa di-hash."""
+    return tuple(sorted((col, tuple(sorted(values))) for col, values in filters.items()))
+
+
+class RenderCache:
+    """Cache LRU thread-safe untuk bytes gambar, dibatasi total ukuran."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Ambil bytes untuk `key` (None jika tidak ada) dan catat hit/miss."""
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        """Simpan bytes untuk `key`, buang entri terlama jika melebihi batas."""
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.total_bytes -= len(old)
+            self._items[key] = data
+            self.total_bytes += len(data)
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def invalidate(self, predicate):
+        """Hapus entri yang kuncinya memenuhi `predicate`; kembalikan jumlahnya."""
+        with self._lock:
+            keys = [key for key in self._items if predicate(key)]
+            for key in keys:
+                self.total_bytes -= len(self._items.pop(key))
+            return len(keys)
+
+    def rekey(self, predicate, new_key):
+        """Pindahkan entri yang kuncinya memenuhi `predicate` ke `new_key(key)`; kembalikan jumlahnya."""
+        with self._lock:
+            keys = [key for key in self._items if predicate(key)]
+            for key in keys:
+                data = self._items.pop(key)
+                old = self._items.pop(new_key(key), None)
+                if old is not None:
+                    self.total_bytes -= len(old)
+                self._items[new_key(key)] = data
+            return len(keys)
+
+    def clear(self):
+        """Kosongkan cache (counter hit/miss tidak direset)."""
+        with self._lock:
+            self._items.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        """Ringkasan isi cache dan counter hit/miss."""
+        with self._lock:
+            return {
+                'entries': len(self._items),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
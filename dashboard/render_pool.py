@@ -0,0 +1,96 @@
+"""
+Render grafik secara paralel di pool proses.
+
+pyplot tidak aman dipakai dari banyak thread, jadi setiap grafik dirender
+di proses worker terpisah: dashboard mengirim id bagian beserta input yang
+sudah difilter (potongan kubus, ringkasan boxplot, piramida tren), worker
+memanggil fungsi di charts.SECTIONS dan mengembalikan bytes PNG. Beberapa
+grafik dalam satu tab dirender bersamaan di beberapa core.
+
+Jika pool tidak bisa dipakai (1 worker, atau worker mati), grafik dirender
+langsung di proses dashboard.
+"""
+import importlib
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Jumlah worker default: satu per core, maksimal sebanyak grafik di satu tab
+MAX_WORKERS = 6
+DEFAULT_WORKERS = int(os.environ.get(
+    "DASHBOARD_RENDER_WORKERS", min(MAX_WORKERS, os.cpu_count() or 1)
+))
+
+
+def init_worker():
+    """Siapkan backend grafik & muat modul grafik (beserta gayanya) di worker."""
+    import matplotlib
+    matplotlib.use("Agg")
+
+    # Memuat matplotlib & seaborn serta menerapkan gaya grafik sebelum tugas
+    # pertama; modulnya sendiri belum dipakai di sini
+    importlib.import_module("charts")
+
+
+def render_section(section_id, inputs):
+    """Render bagian `section_id` dari `inputs`; kembalikan (PNG, detik)."""
+    from charts import SECTIONS
+    from render_cache import figure_to_png
+
+    start = time.perf_counter()
+    plot, _ = SECTIONS[section_id]
+    png = figure_to_png(plot(*inputs))
+    return png, time.perf_counter() - start
+
+
+def render_inline(section_id, inputs):
+    """Render di proses ini dan bungkus hasilnya sebagai Future yang sudah selesai."""
+    future = Future()
+    try:
+        future.set_result(render_section(section_id, inputs))
+    except Exception as error:
+        future.set_exception(error)
+    return future
+
+
+class RenderPool:
+    """Pool proses untuk render grafik, dibuat saat pertama dipakai."""
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        self.workers = workers
+        self._executor = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            # 'spawn' agar worker tidak mewarisi thread & state Streamlit
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+            )
+        return self._executor
+
+    def submit(self, section_id, inputs):
+        """Kirim satu grafik ke pool; kembalikan Future berisi (PNG, detik)."""
+        if self.workers <= 1:
+            return render_inline(section_id, inputs)
+        try:
+            return self._get_executor().submit(render_section, section_id, inputs)
+        except BrokenProcessPool:
+            # Worker mati (mis. kehabisan memori): buat pool baru untuk berikutnya
+            self.shutdown()
+            return render_inline(section_id, inputs)
+
+    def warm_up(self):
+        """Jalankan semua worker sekarang, supaya grafik pertama tidak menunggu worker dibuat."""
+        if self.workers > 1 and self._executor is None:
+            for _ in range(self.workers):
+                self._get_executor().submit(os.getpid)
+
+    def shutdown(self):
+        """Hentikan semua worker."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,96 @@
+"""
+Statistik bergerak (rolling) berbasis kalender untuk deret waktu dashboard.
+
+Deret disusun ulang pada grid waktu yang rapat (per hari atau per jam) dengan
+DatetimeIndex, sehingga jendela "30 hari" benar-benar 30 hari kalender,
+bukan 30 baris. Rata-rata, jumlah dan simpangan baku semua jendela dihitung
+dalam satu lintasan dari jumlah kumulatif (sum, sum of squares, jumlah
+periode terisi); kuantil memakai rolling pandas pada grid yang sama.
+
+Hasilnya dihitung sekali per versi data untuk seluruh deret. Tampilan yang
+difilter cukup mengambil nilai pada tanggal yang terpilih (`at`), tanpa
+menghitung ulang.
+"""
+import numpy as np
+import pandas as pd
+
+# Jendela default: {nama: jumlah periode grid}
+DAY_WINDOWS = {'7d': 7, '30d': 30, '90d': 90}
+HOUR_WINDOWS = {'24h': 24, '168h': 168}
+
+QUANTILES = (0.5,)
+
+# Minimal porsi periode terisi dalam jendela agar statistiknya ditampilkan
+# (toleransi untuk hari/jam yang hilang, mis. baris yang dibuang saat cleaning)
+MIN_FRACTION = 0.8
+
+
+def windowed_sum(cumulative, window):
+    """Jumlah bergerak `window` periode dari array kumulatif (diawali 0)."""
+    start = np.arange(1, len(cumulative)) - window
+    lower = np.where(start >= 0, cumulative[np.clip(start, 0, None)], 0)
+    return cumulative[1:] - lower
+
+
+class RollingStats:
+    """Statistik bergerak beberapa jendela untuk satu deret waktu."""
+
+    def __init__(self, values, freq, windows, quantiles=QUANTILES, min_fraction=MIN_FRACTION):
+        """
+        `values` berupa Series ber-DatetimeIndex (indeks ganda dijumlahkan).
+        Periode tanpa data tidak dihitung; statistik baru muncul setelah
+        minimal `min_fraction` × panjang jendela periode terisi.
+        """
+        series = values.groupby(level=0).sum().sort_index()
+        if len(series):
+            series = series.asfreq(freq)
+        observed = series.notna().to_numpy()
+        filled = series.fillna(0).to_numpy(dtype=float)
+
+        cum_n = np.concatenate([[0], np.cumsum(observed)])
+        cum_sum = np.concatenate([[0.0], np.cumsum(filled)])
+        cum_sq = np.concatenate([[0.0], np.cumsum(filled ** 2)])
+
+        columns = {'value': series.to_numpy(dtype=float)}
+        for name, window in windows.items():
+            n = windowed_sum(cum_n, window)
+            total = windowed_sum(cum_sum, window)
+            mean = np.divide(total, n, out=np.full(len(n), np.nan), where=n > 0)
+            var = np.divide(windowed_sum(cum_sq, window) - n * mean ** 2, n - 1,
+                            out=np.full(len(n), np.nan), where=n > 1)
+            enough = n >= max(1, int(np.ceil(min_fraction * window)))
+
+            columns[f'count_{name}'] = n
+            columns[f'sum_{name}'] = np.where(enough, total, np.nan)
+            columns[f'mean_{name}'] = np.where(enough, mean, np.nan)
+            columns[f'std_{name}'] = np.where(enough, np.sqrt(np.clip(var, 0, None)), np.nan)
+
+            rolling = series.rolling(window, min_periods=max(1, int(np.ceil(min_fraction * window))))
+            for q in quantiles:
+                columns[f'q{int(q * 100)}_{name}'] = rolling.quantile(q).to_numpy()
+
+        self.freq = freq
+        self.windows = dict(windows)
+        self.frame = pd.DataFrame(columns, index=series.index)
+
+    def at(self, timestamps, columns=None):
+        """Baris statistik pada `timestamps` (urutan & duplikat dipertahankan)."""
+        frame = self.frame if columns is None else self.frame[columns]
+        return frame.reindex(pd.DatetimeIndex(timestamps))
+
+
+def day_rolling(df_day, measure='cnt', windows=DAY_WINDOWS, **kwargs):
+    """Statistik bergerak harian dari kolom 'dteday'."""
+    values = pd.Series(df_day[measure].to_numpy(), index=pd.DatetimeIndex(df_day['dteday']))
+    return RollingStats(values, 'D', windows, **kwargs)
+
+
+def hour_stamps(df_hour):
+    """Waktu setiap baris per jam: 'dteday' + 'hr' jam."""
+    return pd.DatetimeIndex(df_hour['dteday']) + pd.to_timedelta(df_hour['hr'].to_numpy(), unit='h')
+
+
+def hour_rolling(df_hour, measure='cnt', windows=HOUR_WINDOWS, **kwargs):
+    """Statistik bergerak per jam dari kolom 'dteday' + 'hr'."""
+    values = pd.Series(df_hour[measure].to_numpy(), index=hour_stamps(df_hour))
+    return RollingStats(values, 'h', windows, **kwargs)
@@ -0,0 +1,100 @@
+"""
+Tabel rollup harian, mingguan & bulanan yang diturunkan dari data per jam.
+
+Data harian tidak lagi dibaca dari CSV terpisah: semua tingkat dihitung
+dari data per jam, jadi angka harian & per jam tidak bisa berbeda. Baris
+per jam direduksi sekali (np.unique + bincount, tanpa groupby per kolom)
+menjadi satu baris per hari; minggu & bulan direduksi dari tabel harian
+yang jauh lebih kecil.
+
+- day:   satu baris per tanggal, kolomnya sama dengan main_data_day.csv
+         lama (jumlah peminjaman dijumlah, temp/hum/windspeed = rata-rata
+         per jam, weathersit = rata-rata per jam dibulatkan ke atas pada
+         .5). Jumlah peminjaman, weathersit, temp & hum sama dengan file
+         lama; windspeed tidak, karena file lama memakai nilai harian
+         day.csv, bukan rata-rata per jam (selisih hingga ~0.16)
+- week:  satu baris per minggu (mulai Senin): jumlah hari, total & rata-rata per hari
+- month: sel kubus harian (cube.DAY_DIMENSIONS) untuk grafik pola bulanan
+
+Disimpan oleh data_store sebagai dataset Parquet di samping data per jam.
+"""
+import numpy as np
+import pandas as pd
+
+from cube import DAY_DIMENSIONS, build_cube
+from data_store import apply_schema
+from pipeline import TEMP_BINS, TEMP_LABELS
+
+# Kolom yang nilainya sama untuk semua jam dalam satu hari
+DAY_CONSTANT_COLUMNS = ['season', 'yr', 'mnth', 'holiday', 'weekday', 'workingday', 'day_type']
+COUNT_COLUMNS = ['casual', 'registered', 'cnt']
+MEAN_COLUMNS = ['temp', 'hum', 'windspeed']
+
+DAY_COLUMNS = [
+    'instant', 'dteday', 'season', 'yr', 'mnth', 'holiday', 'weekday', 'workingday', 'weathersit',
+    'temp', 'hum', 'windspeed', 'casual', 'registered', 'cnt', 'day_type', 'temp_category',
+    'cnt_log', 'data_source',
+]
+
+
+def reduce_by(keys, df, sums=(), means=(), firsts=()):
+    """
+    Satu baris per nilai unik `keys` (terurut).
+
+    Kolom `sums` dijumlah, `means` dirata-rata, `firsts` diambil dari baris
+    pertama tiap kelompok. Hasil: (nilai unik, jumlah baris, {kolom: array}).
+    """
+    uniques, first, inverse, counts = np.unique(
+        keys, return_index=True, return_inverse=True, return_counts=True
+    )
+    columns = {col: df[col].iloc[first].to_numpy() for col in firsts}
+    for col in list(sums) + list(means):
+        total = np.bincount(inverse, weights=df[col].to_numpy(dtype=float), minlength=len(uniques))
+        columns[col] = total if col in sums else total / counts
+    return uniques, counts, columns
+
+
+def daily_rollup(df_hour, start=None):
+    """
+    Tabel harian dari baris per jam.
+
+    'instant' dihitung dari tanggal `start` (default: tanggal pertama), supaya
+    rollup sebagian tanggal tetap bernomor sama dengan tabel lengkapnya.
+    """
+    dates, _, columns = reduce_by(
+        df_hour['dteday'].to_numpy(), df_hour,
+        sums=COUNT_COLUMNS, means=MEAN_COLUMNS + ['weathersit'], firsts=DAY_CONSTANT_COLUMNS,
+    )
+    day = pd.DataFrame({'dteday': dates, **columns})
+    # Nomor hari sejak tanggal pertama (hari yang hilang tetap meninggalkan celah)
+    start = day['dteday'].iloc[0] if start is None else start
+    day['instant'] = (day['dteday'] - start).dt.days + 1
+    day['weathersit'] = np.floor(day['weathersit'] + 0.5)
+    day[COUNT_COLUMNS] = day[COUNT_COLUMNS].round()
+    # Presisi sama dengan data mentah, supaya suhu tepat di batas bin tidak bergeser
+    day[MEAN_COLUMNS] = day[MEAN_COLUMNS].round(6)
+    day['temp_category'] = pd.cut(day['temp'], bins=TEMP_BINS, labels=TEMP_LABELS).astype(object)
+    day['cnt_log'] = np.log1p(day['cnt'])
+    day['data_source'] = 'day'
+    return apply_schema(day[DAY_COLUMNS])
+
+
+def weekly_rollup(df_day):
+    """Tabel mingguan (minggu mulai Senin) dari tabel harian."""
+    week_start = df_day['dteday'] - pd.to_timedelta(df_day['dteday'].dt.dayofweek, unit='D')
+    weeks, days, columns = reduce_by(
+        week_start.to_numpy(), df_day, sums=COUNT_COLUMNS, means=MEAN_COLUMNS, firsts=['yr', 'mnth'],
+    )
+    week = pd.DataFrame({'week_start': weeks, 'days': days, **columns})
+    week['cnt_mean'] = week['cnt'] / week['days']
+    return apply_schema(week)
+
+
+def build_rollups(df_hour):
+    """{'day', 'week', 'month'} dari data per jam dalam satu lintasan."""
+    day = daily_rollup(df_hour)
+    return {
+        'day': day,
+        'week': weekly_rollup(day),
+        'month': build_cube(day, DAY_DIMENSIONS),
+    }
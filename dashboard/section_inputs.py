@@ -0,0 +1,82 @@
+"""
+Input grafik per bagian dashboard untuk satu kombinasi filter.
+
+Satu definisi dipakai bersama oleh dashboard.py, export.py dan
+benchmark.py, jadi ketiganya menggambar dari input yang sama: baris
+terfilter dibaca lewat fungsi `read_rows` (filter diterapkan saat membaca
+Parquet, hanya kolom di INPUT_COLUMNS), kubus dipotong dengan slice_cube,
+lalu ringkasan boxplot & piramida tren diturunkan dari baris tersebut.
+Input 'date_range' adalah rentang tanggal yang terlihat di grafik tren
+harian & per jam (None = seluruhnya), dipakai untuk memilih level downsampling.
+Nama input yang dibutuhkan tiap bagian ada di aggregates.SECTION_INPUTS.
+"""
+from aggregates import hour_trend_pyramids, trend_pyramids
+from box_stats import BOX_COLUMNS, box_summaries
+from cube import slice_cube
+
+# Input yang bergantung pada data per jam (ikut berubah saat ada append)
+HOUR_INPUTS = {'df_hour', 'hour_cube', 'hour_boxes', 'hour_trends'}
+
+# Input tampilan (bukan data): tidak lewat `cache` karena tidak bergantung filter
+VIEW_INPUTS = {'date_range'}
+
+# Input dari baris -> (dataset, kolom yang dibaca); None = semua kolom
+# (pratinjau tabel di Data Overview)
+INPUT_COLUMNS = {
+    'df_day': ("day", None),
+    'df_hour': ("hour", None),
+    'day_boxes': ("day", BOX_COLUMNS),
+    'day_trends': ("day", ['dteday', 'cnt']),
+    'hour_boxes': ("hour", BOX_COLUMNS),
+    'hour_trends': ("hour", ['dteday', 'hr', 'cnt']),
+}
+
+
+class SectionInputs:
+    """
+    Input grafik untuk `filters` ({kolom: daftar nilai}), dibangun malas &
+    sekali saja.
+
+    `read_rows(name, filters, columns)` mengembalikan baris terfilter
+    dataset 'day'/'hour' (kolom `columns`, None = semua); `day_cube` &
+    `hour_cube` adalah kubus lengkap, `day_stats` & `hour_stats` statistik
+    bergerak harian & per jam atas seluruh data. `cache(name, build)`
+    opsional membungkus setiap builder data, mis. dengan cache Streamlit
+    yang dipakai bersama oleh semua sesi. `date_range` berupa (awal, akhir)
+    atau None.
+    """
+
+    def __init__(self, filters, read_rows, day_cube, hour_cube, day_stats, hour_stats,
+                 cache=None, date_range=None):
+        self.filters = filters
+        self.built = {}
+        self._read_rows = read_rows
+        self._cache = cache
+        self._builders = {
+            'df_day': lambda: self.rows('df_day'),
+            'df_hour': lambda: self.rows('df_hour'),
+            'day_cube': lambda: slice_cube(day_cube, filters),
+            'hour_cube': lambda: slice_cube(hour_cube, filters),
+            'day_boxes': lambda: box_summaries(self.rows('day_boxes')),
+            'day_trends': lambda: trend_pyramids(self.rows('day_trends'), day_stats),
+            'hour_boxes': lambda: box_summaries(self.rows('hour_boxes')),
+            'hour_trends': lambda: hour_trend_pyramids(self.rows('hour_trends'), hour_stats),
+            'date_range': lambda: date_range,
+        }
+
+    def rows(self, input_name):
+        """Baris terfilter untuk `input_name`, hanya kolom yang dibutuhkannya."""
+        name, columns = INPUT_COLUMNS[input_name]
+        return self._read_rows(name, self.filters, columns)
+
+    def get(self, name):
+        """Input `name`, dibangun saat pertama kali diminta."""
+        if name not in self.built:
+            build = self._builders[name]
+            cached = self._cache and name not in VIEW_INPUTS
+            self.built[name] = self._cache(name, build) if cached else build()
+        return self.built[name]
+
+    def for_section(self, input_names):
+        """Daftar input untuk satu bagian (nama dari aggregates.SECTION_INPUTS)."""
+        return [self.get(name) for name in input_names]
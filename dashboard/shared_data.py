@@ -0,0 +1,200 @@
+"""
+Dataset bersama per host dalam bentuk file Arrow IPC yang di-memory-map.
+
+Setiap proses worker Streamlit (dan api.py/export.py) biasanya memegang
+salinan pandas sendiri dari baris data yang sama. Di sini dataset
+diterbitkan sekali per host sebagai file Arrow IPC tanpa kompresi, lalu
+setiap proses memetakannya baca-saja: kolom dibaca langsung dari page
+cache bersama (zero-copy), sehingga memori resident per host tidak lagi
+naik sebanding jumlah worker.
+
+File ditulis partisi demi partisi (tanpa memuat seluruh dataset): setiap
+record batch berisi baris satu partisi (yr, mnth), urut seperti dataset
+Parquet. Filter tahun/bulan cukup memilih batch tanpa memeriksa barisnya;
+hasil satu partisi tetap zero-copy, sedangkan gabungan beberapa partisi
+disalin saat diubah ke pandas.
+
+Penerbitan bersifat atomik: file data ditulis dengan nama berisi versi
+(<nama>-<versi>.arrow), lalu penanda versi (<nama>.version) ditukar
+dengan os.replace. Pembaca selalu mengikuti penanda versi; saat data
+baru diterbitkan, pemanggilan berikutnya memetakan file baru, sedangkan
+frame lama tetap valid sampai tidak dipakai lagi.
+
+Lokasi folder: variabel lingkungan DASHBOARD_SHARED_DIR (mis.
+/dev/shm/bike-dashboard), default dashboard/shared/. Kosongkan
+variabelnya untuk mematikan fitur ini (data dibaca dari Parquet).
+"""
+import glob
+import hashlib
+import os
+import threading
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.ipc as ipc
+
+from data_store import (
+    DATA_DIR, PARTITION_COLUMNS, SCHEMA_VERSION, data_version, filter_expression, open_dataset,
+)
+
+SHARED_DIR = os.environ.get("DASHBOARD_SHARED_DIR", os.path.join(DATA_DIR, "shared"))
+
+# Naikkan jika susunan file berubah supaya file lama diterbitkan ulang
+LAYOUT_VERSION = "2"
+
+# Tabel yang sedang dipetakan proses ini: nama -> (versi, tabel)
+_mapped = {}
+_lock = threading.Lock()
+
+
+def stamp_path(name):
+    """Path file penanda versi dataset `name`."""
+    return os.path.join(SHARED_DIR, f"{name}.version")
+
+
+def arrow_path(name, stamp):
+    """Path file Arrow IPC dataset `name` untuk versi `stamp`."""
+    return os.path.join(SHARED_DIR, f"{name}-{stamp}.arrow")
+
+
+def current_stamp():
+    """Versi yang seharusnya diterbitkan: versi data sumber + versi skema."""
+    return hashlib.sha256(f"{data_version()}|{SCHEMA_VERSION}|{LAYOUT_VERSION}".encode()).hexdigest()[:16]
+
+
+def published_stamp(name):
+    """Versi dataset `name` yang sedang diterbitkan (None jika belum ada)."""
+    try:
+        with open(stamp_path(name)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def global_dictionaries(dataset):
+    """
+    Satu kamus per kolom kategori untuk seluruh file (syarat format IPC
+    file), dikumpulkan partisi demi partisi dengan urutan kemunculan pertama.
+    """
+    names = [field.name for field in dataset.schema if pa.types.is_dictionary(field.type)]
+    values = {name: {} for name in names}
+    for fragment in dataset.get_fragments():
+        part = fragment.to_table(schema=dataset.schema, columns=names)
+        for name in names:
+            for chunk in part.column(name).chunks:
+                values[name].update(dict.fromkeys(chunk.dictionary.to_pylist()))
+    return {
+        name: pa.array(list(values[name]), type=dataset.schema.field(name).type.value_type)
+        for name in names
+    }
+
+
+def conform(batch, schema, dictionaries):
+    """`batch` dengan kolom kategori memakai kamus gabungan `dictionaries`."""
+    arrays = []
+    for field, array in zip(schema, batch.columns):
+        dictionary = dictionaries.get(field.name)
+        if dictionary is not None and not array.dictionary.equals(dictionary):
+            # Kode lama -> posisi nilainya di kamus gabungan
+            indices = pc.take(pc.index_in(array.dictionary, value_set=dictionary), array.indices)
+            array = pa.DictionaryArray.from_arrays(
+                indices.cast(field.type.index_type), dictionary, ordered=field.type.ordered
+            )
+        arrays.append(array)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def publish(name, stamp):
+    """
+    Tulis dataset Parquet `name` sebagai file Arrow IPC (satu partisi per
+    langkah) lalu tukar penanda versinya.
+    """
+    os.makedirs(SHARED_DIR, exist_ok=True)
+    dataset = open_dataset(name)
+    dictionaries = global_dictionaries(dataset)
+    path = arrow_path(name, stamp)
+    staging = f"{path}.tmp-{os.getpid()}"
+    with pa.OSFile(staging, "wb") as sink, ipc.new_file(sink, dataset.schema) as writer:
+        for fragment in dataset.get_fragments():
+            for batch in fragment.to_batches(schema=dataset.schema):
+                if batch.num_rows:
+                    writer.write_batch(conform(batch, dataset.schema, dictionaries))
+    os.replace(staging, path)
+
+    staging = f"{stamp_path(name)}.tmp-{os.getpid()}"
+    with open(staging, "w") as f:
+        f.write(stamp)
+    os.replace(staging, stamp_path(name))
+
+    # Versi lama dihapus; proses yang masih memetakannya tetap bisa membaca
+    for old in glob.glob(os.path.join(SHARED_DIR, f"{name}-*.arrow")):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+
+def shared_table(name):
+    """
+    Tabel pyarrow dataset `name` yang dipetakan dari file bersama.
+
+    Dataset diterbitkan dulu jika belum ada atau versinya usang. None jika
+    fitur dimatikan atau folder tidak bisa ditulisi.
+    """
+    if not SHARED_DIR:
+        return None
+    stamp = current_stamp()
+    with _lock:
+        mapped = _mapped.get(name)
+        if mapped is not None and mapped[0] == stamp:
+            return mapped[1]
+        try:
+            if published_stamp(name) != stamp:
+                publish(name, stamp)
+            table = ipc.open_file(pa.memory_map(arrow_path(name, stamp), "r")).read_all()
+        except OSError:
+            return None
+        _mapped[name] = (stamp, table)
+        return table
+
+
+def select_partitions(table, filters):
+    """
+    Batch `table` yang partisinya lolos filter kolom partisi di `filters`;
+    kembalikan (tabel, filter kolom lain). Setiap batch berisi satu
+    partisi, jadi cukup baris pertamanya yang diperiksa.
+    """
+    filters = dict(filters or {})
+    wanted = {
+        col: set(filters.pop(col)) for col in PARTITION_COLUMNS
+        if col in filters and col in table.schema.names
+    }
+    if not wanted:
+        return table, filters
+    batches = [
+        batch for batch in table.to_batches()
+        if all(batch.column(col)[0].as_py() in values for col, values in wanted.items())
+    ]
+    if len(batches) == table.column(0).num_chunks:
+        return table, filters
+    return pa.Table.from_batches(batches, schema=table.schema), filters
+
+
+def select_rows(table, columns=None, filters=None):
+    """
+    Kolom `columns` & baris `table` yang lolos `filters` ({kolom: daftar nilai}).
+
+    Filter yr/mnth memilih batch partisi; filter lain dievaluasi hanya pada
+    batch terpilih. Jika semua baris lolos, kolom dikembalikan tanpa disalin.
+    """
+    table, filters = select_partitions(table, filters)
+    selected = table.select(columns) if columns is not None else table
+    expression = filter_expression(table.schema, filters)
+    if expression is None:
+        return selected
+    mask = ds.dataset(table).to_table(columns={'keep': expression}).column('keep')
+    if pc.all(mask).as_py():
+        return selected
+    return selected.filter(mask)
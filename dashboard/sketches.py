@@ -0,0 +1,208 @@
+"""
+Ringkasan statistik yang bisa digabung (mergeable sketch) per sel filter.
+
+Setiap ColumnSketch menyimpan momen Welford (n, mean, M2, min, max) dan
+t-digest kecil (centroid mean, bobot, nilai terkecil & terbesar) untuk
+kuantil. Dua sketch digabung
+tanpa membaca baris lagi: momen dengan rumus Chan, centroid dengan
+menyatukan lalu memadatkan ulang. Potongan dengan nilai unik tidak lebih
+dari EXACT_LIMIT (kode kategori, jam, seluruh data harian) tidak pernah
+dipadatkan, jadi kuantilnya sama persis dengan df.describe(). Sisanya
+diperkirakan dengan interpolasi yang dijepit ke rentang tiap centroid.
+
+Sketch dibangun sekali per versi data untuk setiap sel filter
+(kombinasi yr × season × weathersit), partisi demi partisi. Tabel
+deskriptif untuk kombinasi filter apa pun cukup menggabungkan sketch sel
+yang terpilih, pengganti df.describe() yang memindai & mengurutkan semua
+baris setiap rerun.
+"""
+import numpy as np
+import pandas as pd
+
+# Parameter kompresi t-digest: makin besar makin akurat (maks. ~COMPRESSION/2 centroid)
+COMPRESSION = 200
+
+# Sampai sebanyak ini nilai unik disimpan apa adanya, jadi kuantil potongan
+# kecil (mis. seluruh data harian) sama persis dengan df.describe()
+EXACT_LIMIT = 2048
+
+DESCRIBE_ROWS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+# Urutan baris df.describe() jika ada kolom tanggal (std-nya NaN)
+DATETIME_DESCRIBE_ROWS = ['count', 'mean', 'min', '25%', '50%', '75%', 'max', 'std']
+
+
+def compress(means, weights, lo, hi, compression=COMPRESSION, exact_limit=EXACT_LIMIT):
+    """
+    Padatkan centroid dengan fungsi skala k1 (lebih rapat di ekor distribusi).
+
+    `lo`/`hi` adalah nilai terkecil & terbesar anggota tiap centroid, sehingga
+    kuantil tidak pernah diinterpolasi melewati celah antar centroid.
+    """
+    order = np.argsort(means, kind="stable")
+    means, weights, lo, hi = means[order], weights[order], lo[order], hi[order]
+
+    # Centroid exact (lo == hi) dengan nilai sama (mis. dari sel berbeda) selalu disatukan
+    same = (lo[1:] == hi[1:]) & (lo[:-1] == hi[:-1]) & (means[1:] == means[:-1])
+    means, weights, lo, hi = merge_groups(means, weights, lo, hi, np.concatenate([[0], np.cumsum(~same)]))
+    if len(means) <= exact_limit:
+        return means, weights, lo, hi
+
+    q = np.cumsum(weights) / weights.sum()
+    k = compression / (2 * np.pi) * np.arcsin(np.clip(2 * q - 1, -1, 1))
+    # Centroid baru dimulai setiap kali nilai k naik satu satuan
+    _, group = np.unique(np.floor(k - k[0]).astype(np.int64), return_inverse=True)
+    return merge_groups(means, weights, lo, hi, group)
+
+
+def merge_groups(means, weights, lo, hi, group):
+    """Satukan centroid terurut per `group` (label naik, berurutan)."""
+    if len(means) == 0:
+        return means, weights, lo, hi
+    starts = np.flatnonzero(np.diff(group, prepend=-1))
+    merged_weights = np.bincount(group, weights=weights)
+    merged_means = np.bincount(group, weights=means * weights) / merged_weights
+    return (merged_means, merged_weights,
+            np.minimum.reduceat(lo, starts), np.maximum.reduceat(hi, starts))
+
+
+class ColumnSketch:
+    """Momen Welford + t-digest untuk satu kolom numerik."""
+
+    __slots__ = ('n', 'mean', 'm2', 'min', 'max', 'means', 'weights', 'lo', 'hi', 'integer')
+
+    def __init__(self, n=0, mean=0.0, m2=0.0, min=np.nan, max=np.nan,
+                 means=np.empty(0), weights=np.empty(0), lo=np.empty(0), hi=np.empty(0),
+                 integer=True):
+        self.n, self.mean, self.m2 = n, mean, m2
+        self.min, self.max = min, max
+        self.means, self.weights = means, weights
+        self.lo, self.hi = lo, hi
+        # Semua nilai bulat: nilai terurut hasil perkiraan dibulatkan
+        self.integer = integer
+
+    @classmethod
+    def from_values(cls, values):
+        """Sketch dari array nilai (NaN diabaikan)."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return cls()
+        mean = values.mean()
+        unique, counts = np.unique(values, return_counts=True)
+        means, weights, lo, hi = compress(unique, counts.astype(float), unique, unique)
+        return cls(len(values), float(mean), float(((values - mean) ** 2).sum()),
+                   float(unique[0]), float(unique[-1]), means, weights, lo, hi,
+                   bool(np.all(unique == np.rint(unique))))
+
+    @classmethod
+    def merge(cls, sketches):
+        """Gabungkan beberapa sketch menjadi satu."""
+        sketches = [s for s in sketches if s.n]
+        if not sketches:
+            return cls()
+        n, mean, m2 = 0, 0.0, 0.0
+        for s in sketches:
+            # Rumus gabungan momen (Chan et al.)
+            total = n + s.n
+            delta = s.mean - mean
+            mean += delta * s.n / total
+            m2 += s.m2 + delta ** 2 * n * s.n / total
+            n = total
+        means, weights, lo, hi = compress(*(np.concatenate([getattr(s, name) for s in sketches])
+                                            for name in ('means', 'weights', 'lo', 'hi')))
+        return cls(n, mean, m2, min(s.min for s in sketches), max(s.max for s in sketches),
+                   means, weights, lo, hi, all(s.integer for s in sketches))
+
+    def std(self):
+        """Simpangan baku sampel (NaN jika n < 2)."""
+        return float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else np.nan
+
+    def at_rank(self, ranks):
+        """
+        Perkiraan nilai terurut ke-`ranks` (0-based).
+
+        Interpolasi antar titik tengah centroid, dijepit ke rentang [lo, hi]
+        centroid yang memuat rank tersebut agar tidak melewati celah data;
+        centroid tunggal atau exact memberi nilai persis.
+        """
+        upper = np.cumsum(self.weights)
+        inside = np.minimum(np.searchsorted(upper, ranks, side="right"), len(upper) - 1)
+        centers = upper - self.weights / 2
+        approx = np.interp(np.asarray(ranks) + 0.5, np.concatenate([[0], centers, [self.n]]),
+                           np.concatenate([[self.min], self.means, [self.max]]))
+        values = np.where(self.weights[inside] == 1, self.means[inside],
+                          np.clip(approx, self.lo[inside], self.hi[inside]))
+        return np.rint(values) if self.integer else values
+
+    def quantile(self, q):
+        """Perkiraan kuantil `q` (0..1), interpolasi linear seperti pandas."""
+        if self.n == 0:
+            return np.nan
+        position = q * (self.n - 1)
+        lo, hi = self.at_rank([np.floor(position), np.ceil(position)])
+        return float(lo + (position - np.floor(position)) * (hi - lo))
+
+    def describe(self):
+        """Statistik seperti kolom df.describe()."""
+        return [self.n, self.mean if self.n else np.nan, self.std(), self.min,
+                self.quantile(0.25), self.quantile(0.5), self.quantile(0.75), self.max]
+
+
+def column_values(series):
+    """Nilai kolom sebagai float; kolom tanggal dalam nanodetik sejak epoch."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return np.where(series.isna(), np.nan, series.to_numpy().view('int64'))
+    return series.to_numpy()
+
+
+def sketch_frame(df, columns):
+    """{kolom: ColumnSketch} untuk semua baris `df`."""
+    return {col: ColumnSketch.from_values(column_values(df[col])) for col in columns if col in df.columns}
+
+
+def build_cell_sketches(parts, cell_columns, value_columns):
+    """
+    Sketch per sel filter dari potongan-potongan data (mis. per partisi).
+
+    Hasil: {'columns': kolom sel, 'cells': {tuple nilai sel: {kolom: ColumnSketch}}}.
+    """
+    cells = {}
+    for part in parts:
+        for key, rows in part.groupby(list(cell_columns), observed=True, sort=False):
+            key = tuple(v.item() if isinstance(v, np.generic) else v for v in key)
+            sketches = sketch_frame(rows, value_columns)
+            if key in cells:
+                sketches = {col: ColumnSketch.merge([cells[key][col], sketch])
+                            for col, sketch in sketches.items()}
+            cells[key] = sketches
+    return {'columns': list(cell_columns), 'cells': cells}
+
+
+def describe_cells(cell_sketches, filters, value_columns, extra=None, datetime_columns=()):
+    """
+    Tabel seperti df.describe() untuk sel yang lolos `filters`.
+
+    `extra` ({kolom: ColumnSketch}, opsional) ikut digabung, mis. untuk
+    baris tambahan yang belum masuk sketch sel. Kolom di `datetime_columns`
+    ditampilkan sebagai tanggal, seperti df.describe().
+    """
+    cell_columns = cell_sketches['columns']
+    selected = [
+        sketches for key, sketches in cell_sketches['cells'].items()
+        if all(col not in filters or value in filters[col] for col, value in zip(cell_columns, key))
+    ]
+    if extra:
+        selected.append(extra)
+
+    table = {}
+    for col in value_columns:
+        merged = ColumnSketch.merge([sketches[col] for sketches in selected if col in sketches])
+        stats = merged.describe()
+        if col in datetime_columns:
+            stats = [stats[0], *pd.to_datetime(np.rint(stats[1:]).astype('float64'), unit='ns')]
+            stats[2] = np.nan
+        table[col] = stats
+    if datetime_columns:
+        return pd.DataFrame(table, index=DESCRIBE_ROWS).reindex(DATETIME_DESCRIBE_ROWS)
+    return pd.DataFrame(table, index=DESCRIBE_ROWS)
@@ -0,0 +1,270 @@
+"""
+Grafik sisi browser (Vega-Lite lewat Altair) untuk bagian dashboard.
+
+Alih-alih gambar PNG hasil matplotlib, server hanya mengirim tabel kecil
+(agregat dari aggregates.py, ringkasan boxplot, deret yang sudah
+di-downsample) beserta spesifikasi grafik; browser yang menggambar.
+Streamlit mengirim tabel grafik sebagai Arrow, dan pesan websocket
+dikompresi (.streamlit/config.toml).
+
+Setiap fungsi menerima input yang sama dengan pasangannya di charts.py.
+Fungsi mengembalikan None jika datanya terlalu besar untuk dikirim ke
+browser; bagian tersebut (dan bagian yang tidak ada di VEGA_SECTIONS)
+tetap dirender dengan matplotlib.
+"""
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from aggregates import (
+    hourly_trend, monthly_pattern, rush_hour_comparison, rush_hour_pattern, rush_hour_weekday,
+    weather_comparison, weekday_weekend_comparison,
+)
+from downsample import DEFAULT_POINTS
+
+# Batas jumlah baris data per grafik yang dikirim ke browser
+MAX_CLIENT_ROWS = 5000
+
+HEIGHT = 320
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+COUNT_TITLE = "Jumlah Peminjaman"
+
+
+# ------------------------------------
+# Pembangun grafik umum
+# ------------------------------------
+def bar_chart(data, x, y, title, x_title, y_title, scheme='redblue', colors=None, label_offset=-5):
+    """Bar per kategori `x` dengan label nilai `y` di atas setiap bar."""
+    scale = alt.Scale(range=colors) if colors else alt.Scale(scheme=scheme)
+    base = alt.Chart(data).encode(
+        x=alt.X(f'{x}:N', title=x_title, axis=alt.Axis(labelAngle=0)),
+        y=alt.Y(f'{y}:Q', title=y_title),
+        tooltip=[alt.Tooltip(f'{x}:N'), alt.Tooltip(f'{y}:Q', format=',.0f')],
+    )
+    bars = base.mark_bar().encode(color=alt.Color(f'{x}:N', scale=scale, legend=None))
+    labels = base.mark_text(dy=label_offset, color='black').encode(text=alt.Text(f'{y}:Q', format=',.0f'))
+    return (bars + labels).properties(title=title, height=HEIGHT)
+
+
+def box_chart(stats, title, x_title, scheme, annotate='mean', order=None):
+    """
+    Boxplot dari ringkasan box_stats (kotak, whisker, median, outlier) dan
+    anotasi kolom `annotate` ('mean' / 'med').
+    """
+    order = [str(label) for label in (order or [s['label'] for s in stats])]
+    stats = [s for s in stats if str(s['label']) in order]
+    boxes = pd.DataFrame(
+        [{'label': str(s['label']), **{k: s[k] for k in ('n', 'mean', 'q1', 'med', 'q3', 'whislo', 'whishi')}}
+         for s in stats],
+        columns=['label', 'n', 'mean', 'q1', 'med', 'q3', 'whislo', 'whishi'],
+    )
+    # Outlier dikirim sebagai nilai unik + jumlahnya
+    fliers = []
+    for s in stats:
+        values, counts = np.unique(s['fliers'], return_counts=True)
+        fliers.append(pd.DataFrame({'label': str(s['label']), 'value': values, 'count': counts}))
+    fliers = pd.concat(fliers, ignore_index=True) if fliers else pd.DataFrame(columns=['label', 'value', 'count'])
+    if len(boxes) + len(fliers) > MAX_CLIENT_ROWS:
+        return None
+
+    x = alt.X('label:N', title=x_title, sort=order, scale=alt.Scale(domain=order), axis=alt.Axis(labelAngle=0))
+    box_base = alt.Chart(boxes).encode(x=x)
+    whiskers = box_base.mark_rule(color='#3f3f3f').encode(y=alt.Y('whislo:Q', title=COUNT_TITLE), y2='whishi:Q')
+    box = box_base.mark_bar(size=40, stroke='#3f3f3f').encode(
+        y='q1:Q', y2='q3:Q',
+        color=alt.Color('label:N', scale=alt.Scale(scheme=scheme, domain=order), legend=None),
+        tooltip=['label:N', 'n:Q',
+                 *(alt.Tooltip(f'{k}:Q', format=',.1f') for k in ('whislo', 'q1', 'med', 'q3', 'whishi', 'mean'))],
+    )
+    median = box_base.mark_tick(color='#3f3f3f', size=40, thickness=2).encode(y='med:Q')
+    outliers = alt.Chart(fliers).mark_point(shape='diamond', size=16, filled=True, color='#3f3f3f').encode(
+        x=x, y='value:Q', tooltip=['label:N', 'value:Q', 'count:Q'],
+    )
+    labels = box_base.mark_text(dy=-8, color='black').encode(
+        y=f'{annotate}:Q', text=alt.Text(f'{annotate}:Q', format=',.0f'),
+    )
+    return (whiskers + box + median + outliers + labels).properties(title=title, height=HEIGHT)
+
+
+def series_frame(pyramid, name, date_range=None):
+    """Deret (tanggal, nilai) hasil downsampling di `date_range` sebagai tabel untuk grafik garis."""
+    dates, values = pyramid.view(DEFAULT_POINTS, *(date_range or (None, None)))
+    return pd.DataFrame({'dteday': dates, 'value': values, 'series': name})
+
+
+# ------------------------------------
+# Grafik per bagian (pasangan fungsi di charts.py)
+# ------------------------------------
+def vega_daily_trend(day_trends, date_range=None):
+    """Tren peminjaman sepeda per hari."""
+    data = series_frame(day_trends['cnt'], "Total Peminjaman", date_range)
+    return alt.Chart(data).mark_line(point=alt.OverlayMarkDef(size=12)).encode(
+        x=alt.X('dteday:T', title="Tanggal", axis=alt.Axis(format='%Y-%m-%d', labelAngle=-45)),
+        y=alt.Y('value:Q', title=COUNT_TITLE),
+        color=alt.Color('series:N', title=None, legend=alt.Legend(orient='top-left')),
+        tooltip=[alt.Tooltip('dteday:T', format='%Y-%m-%d'), alt.Tooltip('value:Q', format=',.0f')],
+    ).properties(title="Tren Peminjaman Sepeda per Hari", height=HEIGHT)
+
+
+def vega_hourly_trend(hour_cube):
+    """Rata-rata peminjaman per jam dengan CI 95%."""
+    base = alt.Chart(hourly_trend(hour_cube)).encode(x=alt.X('hr:O', title="Jam", axis=alt.Axis(labelAngle=0)))
+    band = base.mark_area(opacity=0.2).encode(y=alt.Y('ci_low:Q', title=COUNT_TITLE), y2='ci_high:Q')
+    line = base.mark_line(point=True).encode(
+        y='mean:Q',
+        tooltip=['hr:O', alt.Tooltip('mean:Q', format=',.1f'),
+                 alt.Tooltip('ci_low:Q', format=',.1f'), alt.Tooltip('ci_high:Q', format=',.1f')],
+    )
+    return (band + line).properties(title="Tren Peminjaman Sepeda per Jam", height=HEIGHT)
+
+
+def vega_monthly_pattern(day_cube):
+    """Rata-rata peminjaman harian per bulan."""
+    monthly = monthly_pattern(day_cube)
+    monthly['bulan'] = [MONTH_NAMES[m - 1] for m in monthly['mnth']]
+    return alt.Chart(monthly).mark_bar().encode(
+        x=alt.X('bulan:N', title="Bulan", sort=MONTH_NAMES, axis=alt.Axis(labelAngle=0)),
+        y=alt.Y('mean:Q', title=COUNT_TITLE),
+        color=alt.Color('bulan:N', sort=MONTH_NAMES, scale=alt.Scale(scheme='viridis'), legend=None),
+        tooltip=['bulan:N', alt.Tooltip('mean:Q', format=',.0f')],
+    ).properties(title="Jumlah Peminjaman Sepeda Berdasarkan Bulan (Day)", height=HEIGHT)
+
+
+def vega_rush_hour_pattern(hour_cube):
+    """Rata-rata peminjaman Rush Hour vs Non-Rush Hour."""
+    data = rush_hour_pattern(hour_cube)
+    bars = bar_chart(data, 'rush_hour', 'mean',
+                     "Distribusi Peminjaman Sepeda pada Rush Hour vs Non-Rush Hour (Hour)",
+                     "Kategori Waktu", COUNT_TITLE)
+    errors = alt.Chart(data).mark_rule(color='#424242', strokeWidth=2.5).encode(
+        x='rush_hour:N', y='ci_low:Q', y2='ci_high:Q',
+    )
+    return bars + errors
+
+
+def vega_daily_rolling_trend(day_trends, date_range=None):
+    """Tren harian beserta rata-rata bergerak 30 hari."""
+    names = ["Total Peminjaman", "Rata-rata Bergerak (30 hari)"]
+    data = pd.concat([series_frame(day_trends['cnt'], names[0], date_range),
+                      series_frame(day_trends['rolling_30'], names[1], date_range)], ignore_index=True)
+    return alt.Chart(data).mark_line().encode(
+        x=alt.X('dteday:T', title="Tanggal", axis=alt.Axis(labelAngle=-45)),
+        y=alt.Y('value:Q', title=COUNT_TITLE),
+        color=alt.Color('series:N', title=None, scale=alt.Scale(domain=names, range=['blue', 'red']),
+                        legend=alt.Legend(orient='top-left')),
+        tooltip=[alt.Tooltip('dteday:T', format='%Y-%m-%d'), 'series:N', alt.Tooltip('value:Q', format=',.0f')],
+    ).properties(title="Tren Peminjaman Sepeda Harian dalam 2 Tahun", height=HEIGHT)
+
+
+def vega_hourly_rolling_trend(hour_trends, date_range=None):
+    """Tren per jam beserta rata-rata bergerak 24 & 168 jam."""
+    names = ["Total Peminjaman per Jam", "Rata-rata Bergerak (24 jam)", "Rata-rata Bergerak (168 jam)"]
+    data = pd.concat([series_frame(hour_trends[key], name, date_range)
+                      for key, name in zip(['cnt', 'rolling_24', 'rolling_168'], names)], ignore_index=True)
+    return alt.Chart(data).mark_line().encode(
+        x=alt.X('dteday:T', title="Tanggal", axis=alt.Axis(labelAngle=-45)),
+        y=alt.Y('value:Q', title=COUNT_TITLE),
+        color=alt.Color('series:N', title=None, scale=alt.Scale(domain=names, range=['lightgray', 'red', 'green']),
+                        legend=alt.Legend(orient='top-left')),
+        tooltip=[alt.Tooltip('dteday:T', format='%Y-%m-%d %H:00'), 'series:N', alt.Tooltip('value:Q', format=',.0f')],
+    ).properties(title="Tren Peminjaman Sepeda per Jam dengan Rata-rata Bergerak", height=HEIGHT)
+
+
+def vega_season_day(day_boxes):
+    """Boxplot peminjaman harian per musim."""
+    return box_chart(day_boxes['season'], "Pengaruh Musim terhadap Peminjaman Sepeda (Day)", "Musim", 'redblue')
+
+
+def vega_season_hour(hour_boxes):
+    """Boxplot peminjaman per jam per musim."""
+    return box_chart(hour_boxes['season'], "Pengaruh Musim terhadap Peminjaman Sepeda (Hour)", "Musim", 'redblue')
+
+
+def vega_weather_day(day_boxes):
+    """Boxplot peminjaman harian per kondisi cuaca."""
+    return box_chart(day_boxes['weathersit'], "Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda (Day)",
+                     "Kondisi Cuaca", 'redblue')
+
+
+def vega_weather_hour(hour_boxes):
+    """Boxplot peminjaman per jam per kondisi cuaca."""
+    return box_chart(hour_boxes['weathersit'], "Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda (Hour)",
+                     "Kondisi Cuaca", 'redblue')
+
+
+def vega_temperature_hour(hour_boxes):
+    """Boxplot peminjaman per jam per kategori suhu."""
+    return box_chart(hour_boxes['temp_category'], "Pengaruh Suhu terhadap Peminjaman Sepeda (Hour)",
+                     "Kategori Suhu", 'magma', annotate='med', order=["Cold", "Mild", "Warm", "Hot"])
+
+
+def vega_weather_total(hour_cube):
+    """Total peminjaman per kondisi cuaca."""
+    return bar_chart(weather_comparison(hour_cube), 'weathersit', 'total_peminjaman',
+                     "Pengaruh Kondisi Cuaca terhadap Peminjaman Sepeda", "Kondisi Cuaca",
+                     "Total Peminjaman")
+
+
+def vega_user_type_day(day_boxes):
+    """Boxplot pengguna casual vs registered (harian)."""
+    return box_chart(day_boxes['users'], "Perbandingan Pengguna Casual vs Registered (Day)",
+                     "Tipe Pengguna", 'redblue', annotate='med')
+
+
+def vega_user_type_hour(hour_boxes):
+    """Boxplot pengguna casual vs registered (per jam)."""
+    return box_chart(hour_boxes['users'], "Perbandingan Pengguna Casual vs Registered (Hour)",
+                     "Tipe Pengguna", 'redblue', annotate='med')
+
+
+def vega_rush_hour_comparison(hour_cube):
+    """Rata-rata peminjaman per kategori waktu (jam sibuk)."""
+    return bar_chart(rush_hour_comparison(hour_cube), 'time_category', 'avg_peminjaman',
+                     "Perbandingan Peminjaman Sepeda pada Rush Hour vs Non-Rush Hour", "Kategori Waktu",
+                     "Rata-rata Peminjaman")
+
+
+def vega_rush_hour_weekday(hour_cube):
+    """Rata-rata peminjaman per kategori waktu dan tipe hari."""
+    base = alt.Chart(rush_hour_weekday(hour_cube)).encode(
+        x=alt.X('time_category:N', title="Kategori Waktu", axis=alt.Axis(labelAngle=0)),
+        xOffset='day_type:N',
+        y=alt.Y('avg_peminjaman:Q', title="Rata-rata Peminjaman"),
+        tooltip=['time_category:N', 'day_type:N', alt.Tooltip('avg_peminjaman:Q', format=',.0f')],
+    )
+    bars = base.mark_bar().encode(
+        color=alt.Color('day_type:N', title="Tipe Hari", scale=alt.Scale(range=['blue', 'red'])),
+    )
+    labels = base.mark_text(dy=-5, color='black').encode(text=alt.Text('avg_peminjaman:Q', format=',.0f'))
+    return (bars + labels).properties(
+        title="Pengaruh Hari Kerja dan Akhir Pekan terhadap Peminjaman Sepeda", height=HEIGHT,
+    )
+
+
+def vega_weekday_weekend(hour_cube):
+    """Total peminjaman weekday vs weekend."""
+    return bar_chart(weekday_weekend_comparison(hour_cube), 'day_type', 'total_peminjaman',
+                     "Perbandingan Total Peminjaman Sepeda: Weekday vs Weekend", "Tipe Hari",
+                     "Total Peminjaman", colors=['blue', 'orange'])
+
+
+# Id bagian -> fungsi pembuat grafik Vega-Lite (input: aggregates.SECTION_INPUTS)
+VEGA_SECTIONS = {
+    '2a': vega_daily_trend,
+    '2b': vega_hourly_trend,
+    '2c': vega_monthly_pattern,
+    '2d': vega_rush_hour_pattern,
+    '2e': vega_daily_rolling_trend,
+    '2f': vega_hourly_rolling_trend,
+    '3a': vega_season_day,
+    '3b': vega_season_hour,
+    '3c': vega_weather_day,
+    '3d': vega_weather_hour,
+    '3e': vega_temperature_hour,
+    '3f': vega_weather_total,
+    '4a': vega_user_type_day,
+    '4b': vega_user_type_hour,
+    '4c': vega_rush_hour_comparison,
+    '4d': vega_rush_hour_weekday,
+    '4e': vega_weekday_weekend,
+}